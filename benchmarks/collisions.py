@@ -0,0 +1,65 @@
+"""Compares the nested collision loop with the spatial hash broad phase.
+
+Run from the root of the repository:
+    python -m benchmarks.collisions
+"""
+
+import random
+import time
+
+from data.physics.hitbox import HitBox
+from data.physics.spatialhash import SpatialHash
+
+WORLD = (2560, 1920)
+PROJECTILES = [50, 500, 5000]
+ENEMIES = [10, 30]
+FRAMES = 20
+
+def generate(count, width, height, seed):
+    """Generates `count` hitboxes of the given size scattered over the world."""
+    rng = random.Random(seed)
+    return [HitBox(rng.uniform(0, WORLD[0]), rng.uniform(0, WORLD[1]), width, height)
+            for _ in range(count)]
+
+def nested(projectiles, enemies):
+    """Current approach: every projectile against every enemy."""
+    hits = 0
+    for proj in projectiles:
+        for enemy in enemies:
+            if proj.is_colliding(enemy):
+                hits += 1
+    return hits
+
+def hashed(grid, projectiles, enemies):
+    """Rebuilds the grid and only tests the enemies sharing a cell."""
+    grid.rebuild(enemies, enemies)
+    hits = 0
+    for proj in projectiles:
+        for enemy in grid.query(proj):
+            if proj.is_colliding(enemy):
+                hits += 1
+    return hits
+
+def measure(function, *args):
+    """Returns the average time of a frame in ms and the hit count."""
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        hits = function(*args)
+    return (time.perf_counter() - start) / FRAMES * 1000, hits
+
+def run():
+    """Runs the benchmark and prints the results."""
+    grid = SpatialHash()
+    print(f"{'enemies':>8} {'projectiles':>12} {'nested ms':>10} {'grid ms':>10} {'speedup':>8}")
+    for enemy_count in ENEMIES:
+        enemies = generate(enemy_count, 128, 128, enemy_count)
+        for proj_count in PROJECTILES:
+            projectiles = generate(proj_count, 32, 32, proj_count)
+            loop_ms, loop_hits = measure(nested, projectiles, enemies)
+            grid_ms, grid_hits = measure(hashed, grid, projectiles, enemies)
+            assert loop_hits == grid_hits
+            print(f"{enemy_count:>8} {proj_count:>12} {loop_ms:>10.3f} {grid_ms:>10.3f}"
+                  f" {loop_ms / grid_ms:>7.2f}x")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,32 @@
+"""Measures the procedural map generation, which runs on the loading thread.
+
+Run from the root of the repository:
+    python -m benchmarks.mapgen
+"""
+
+import time
+
+from data.game.mapgen import MapGenerator
+
+SIZES = [(40, 30), (200, 200), (500, 500)]
+RUNS = 20
+BUDGET_MS = 50
+
+def measure(width, height):
+    """Returns the average time in ms to generate a map of the given size."""
+    MapGenerator(0).generate(width, height)
+    start = time.perf_counter()
+    for seed in range(RUNS):
+        MapGenerator(seed).generate(width, height)
+    return (time.perf_counter() - start) / RUNS * 1000
+
+def run():
+    """Runs the benchmark and prints the results."""
+    print(f"{'size':>10} {'ms':>8} {'budget':>8}")
+    for width, height in SIZES:
+        elapsed = measure(width, height)
+        status = "ok" if elapsed < BUDGET_MS else "over"
+        print(f"{f'{width}x{height}':>10} {elapsed:>8.2f} {status:>8}")
+
+if __name__ == "__main__":
+    run()
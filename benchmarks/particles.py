@@ -0,0 +1,49 @@
+"""Compares the particle backends: objects or arrays, drawn one by one
+or batched from pre-rendered stamps.
+
+Run from the root of the repository:
+    python -m benchmarks.particles
+"""
+
+import os
+import time
+
+import numpy as np
+
+from data.api.surface import Surface, init_engine
+from data.physics.particle import ParticleEmitter
+
+PARTICLES = 2000
+FRAMES = 120
+FIRE = [(255, 100, 0), (255, 150, 0), (255, 200, 50)]
+
+def measure(vectorized, batched):
+    """Returns the average ms per frame to tick and draw a full emitter."""
+    np.random.seed(0)
+    emitter = ParticleEmitter(PARTICLES, vectorized=vectorized, batched=batched)
+    target = Surface(1920, 1080)
+    tick = 0
+    draw = 0
+    for _ in range(FRAMES):
+        emitter.emit(960, 540, PARTICLES, (1, 8), FIRE, (1, 6), (1.0, 3.0))
+        start = time.perf_counter()
+        emitter.tick()
+        middle = time.perf_counter()
+        emitter.draw(target)
+        tick += middle - start
+        draw += time.perf_counter() - middle
+    return tick / FRAMES * 1000, draw / FRAMES * 1000
+
+def run():
+    """Runs the benchmark and prints the results."""
+    print(f"{'backend':>10} {'draw':>8} {'tick ms':>8} {'draw ms':>8}")
+    for vectorized in (False, True):
+        for batched in (False, True):
+            tick, draw = measure(vectorized, batched)
+            print(f"{'arrays' if vectorized else 'objects':>10}"
+                  f" {'stamps' if batched else 'circles':>8} {tick:>8.3f} {draw:>8.3f}")
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    init_engine()
+    run()
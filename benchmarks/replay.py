@@ -0,0 +1,62 @@
+"""Plays back a recording made with `python main.py --record FILE` without
+a window, as fast as possible, and measures the real duration of each frame.
+The same recording played on two versions of the game gives the same frames,
+so their timings can be compared.
+
+Run from the root of the repository:
+    python -m benchmarks.replay FILE [--output results.json]
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+from data.constants import SYSTEM
+from data.simulation import enable_headless
+from data.replay import InputReplay
+
+def summarize(times: list[float]) -> dict:
+    """Returns the frame count and the mean, median, 95th and 99th\
+    percentiles and maximum frame time in ms."""
+    if not times:
+        return {"frames": 0}
+    ms = np.asarray(times) * 1000
+    return {
+        "frames": len(ms),
+        "mean": float(ms.mean()),
+        "p50": float(np.percentile(ms, 50)),
+        "p95": float(np.percentile(ms, 95)),
+        "p99": float(np.percentile(ms, 99)),
+        "max": float(ms.max())
+    }
+
+def run(path: str, output: str = None) -> dict:
+    """Plays a recording, prints the summary of its frame times and writes\
+    every frame time to `output` if given."""
+    enable_headless()
+    replay = InputReplay(path)
+    SYSTEM["inputs"] = replay
+    import main
+    main.init_game(threaded=False)
+    main.init_timers()
+    SYSTEM["options"]["adaptive_quality"] = False
+    main.debug_create_items()
+    main.setup_bottom_bar()
+    main.main_loop()
+    summary = summarize(replay.times)
+    print()
+    print(f"{path}: seed {replay.seed}, {replay.frames}/{replay.length} frames")
+    print(" ".join(f"{key} {value:.2f}" for key, value in summary.items() if key != "frames"))
+    if output is not None:
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump({"recording": path, "seed": replay.seed, "summary": summary,
+                       "frames": [t * 1000 for t in replay.times]}, file)
+    return summary
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("recording")
+    parser.add_argument("--output", help="JSON file for the frame times")
+    args = parser.parse_args()
+    run(args.recording, args.output)
@@ -0,0 +1,27 @@
+"""Plays a random level headlessly against a scripted player and measures
+the time spent in each system of the game.
+
+Run from the root of the repository:
+    python -m benchmarks.simulation
+"""
+
+from data.simulation import Simulation, enable_headless
+
+SECONDS = 60
+SEED = 0
+
+def run(render: bool = False):
+    """Runs the benchmark and prints the results."""
+    enable_headless()
+    from data.loading import init_game
+    init_game(threaded=False)
+    report = Simulation(seed=SEED, render=render).run(SECONDS)
+    print(f"simulated {report['simulated']:.1f}s in {report['wall_time']:.2f}s "
+          f"(x{report['speedup']:.1f}), {report['steps']} steps, wave {report['wave']}, "
+          f"{report['enemies']} enemies, {report['projectiles']} projectiles")
+    print(f"{'system':>12} {'ms/step':>8}")
+    for name, elapsed in sorted(report["systems"].items(), key=lambda item: -item[1]):
+        print(f"{name:>12} {elapsed:>8.3f}")
+
+if __name__ == "__main__":
+    run()
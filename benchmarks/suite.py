@@ -0,0 +1,214 @@
+"""Headless benchmark suite. Runs stress scenarios of the hot paths of the
+game, reports their operations per second and milliseconds per frame,
+writes them to a JSON file and compares them with a stored baseline: a
+scenario slower than its baseline by more than the threshold fails the run.
+
+Run from the root of the repository:
+    python -m benchmarks.suite [--only NAME ...] [--threshold 0.2]
+    python -m benchmarks.suite --save-baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+from data.constants import SYSTEM, ENNEMY_TRACKER, PROJECTILE_TRACKER, TEXT_TRACKER, ROOT
+from data.numerics.rng import RNG
+from data.simulation import enable_headless
+
+RESULTS = f"{ROOT}benchmarks/results"
+THRESHOLD = 0.2
+COLLISIONS = [(10, 500), (30, 5000), (100, 5000)]
+PARTICLES = 2000
+HITS = 500
+ITEMS = 10000
+LOOT_FRAMES = 10
+TEXTS = 200
+DIFFICULTIES = [0, 1, 2, 3, 4]
+
+def collisions(enemies: int, projectiles: int):
+    """Broad and narrow phase of `projectiles` against `enemies`."""
+    from benchmarks.collisions import generate, hashed
+    from data.physics.spatialhash import SpatialHash
+    grid = SpatialHash()
+    enemy_boxes = generate(enemies, 128, 128, enemies)
+    projectile_boxes = generate(projectiles, 32, 32, projectiles)
+    return lambda: hashed(grid, projectile_boxes, enemy_boxes), projectiles
+
+def particles(vectorized: bool, batched: bool):
+    """Emission, tick and draw of a full emitter."""
+    from benchmarks.particles import FIRE
+    from data.api.surface import Surface
+    from data.physics.particle import ParticleEmitter
+    emitter = ParticleEmitter(PARTICLES, vectorized=vectorized, batched=batched)
+    target = Surface(1920, 1080)
+    def frame():
+        emitter.emit(960, 540, PARTICLES, (1, 8), FIRE, (1, 6), (1.0, 3.0))
+        emitter.tick()
+        emitter.draw(target)
+    return frame, PARTICLES
+
+def damage_burst():
+    """A burst of hits of the player's spell on a creature."""
+    from data.game.creature import Creature
+    from data.tables.spell_table import FIREBOLT
+    attacker = SYSTEM["player"].creature
+    target = Creature("Dummy")
+    def frame():
+        for _ in range(HITS):
+            target.damage(attacker.recalculate_damage(FIREBOLT))
+        target.heal(1e12)
+    return frame, HITS
+
+def loot():
+    """Generation of random items of every rarity, the `ITEMS` being split\
+    over `LOOT_FRAMES` frames."""
+    looter = SYSTEM["looter"]
+    items = ITEMS // LOOT_FRAMES
+    def frame():
+        for i in range(items):
+            looter.generate_item(50, i % 4)
+    return frame, items
+
+def damage_text():
+    """Rendering of damage numbers, half of them critical."""
+    from data.image.textgenerator import make_text
+    from data.interface.general import DAMAGE_COLOR
+    values = [round(RNG["visual"].uniform(1, 5000), 2) for _ in range(TEXTS)]
+    def frame():
+        make_text.cache_clear()
+        for i, value in enumerate(values):
+            crit = i % 2 == 0
+            make_text(f"{value} !" if crit else f"{value}", DAMAGE_COLOR, crit, 35 if crit else 25)
+    return frame, TEXTS
+
+def level_load(difficulty: int):
+    """Synchronous loading of a level: map, modifiers and every wave."""
+    from data.game.level import Level
+    def frame():
+        level = Level("Benchmark", 20, SYSTEM["images"]["forest_icon"], 6000, 5,
+                      difficulty=difficulty, seed=difficulty)
+        level.load_level()
+        ENNEMY_TRACKER.clear()
+        PROJECTILE_TRACKER.clear()
+    return frame, 1
+
+SCENARIOS = [(f"collisions_{e}x{p}", collisions, (e, p), 20) for e, p in COLLISIONS] + \
+    [(f"particles_{'arrays' if v else 'objects'}_{'stamps' if b else 'circles'}",
+      particles, (v, b), 60) for v in (False, True) for b in (False, True)] + \
+    [("damage_burst", damage_burst, (), 20), ("loot", loot, (), LOOT_FRAMES),
+     ("damage_text", damage_text, (), 20)] + \
+    [(f"level_load_{d}", level_load, (d,), 3) for d in DIFFICULTIES]
+
+def measure(setup, params: tuple, frames: int) -> dict:
+    """Runs a scenario for a number of frames, after a warm up frame if\
+    there are several.
+
+    Args:
+        setup (callable): Called with `params`, returns the function running\
+        a frame and the amount of operations it does.
+        params (tuple): Parameters of the scenario.
+        frames (int): Amount of measured frames.
+
+    Returns:
+        dict: The frames, milliseconds per frame and operations per second.
+    """
+    RNG.seed(0)
+    frame, ops = setup(*params)
+    if frames > 1:
+        frame()
+    start = time.perf_counter()
+    for _ in range(frames):
+        frame()
+    elapsed = time.perf_counter() - start
+    TEXT_TRACKER.clear()
+    return {
+        "params": list(params),
+        "frames": frames,
+        "ms_per_frame": elapsed / frames * 1000,
+        "ops_per_sec": ops * frames / elapsed if elapsed > 0 else 0.0
+    }
+
+def compare(results: dict, baseline: dict, threshold: float = THRESHOLD) -> list[str]:
+    """Returns the scenarios slower than their baseline by more than the\
+    threshold, as messages. Scenarios missing from either side are ignored.
+
+    Args:
+        results (dict): Results of the run, by scenario.
+        baseline (dict): Stored results, by scenario.
+        threshold (float, optional): Allowed slowdown, 0.2 being 20% more\
+        milliseconds per frame. Defaults to 0.2.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ms_per_frame"]
+        after = result["ms_per_frame"]
+        if before > 0 and after > before * (1 + threshold):
+            regressions.append(f"{name}: {before:.3f} -> {after:.3f} ms/frame "
+                               f"({(after / before - 1) * 100:+.0f}%)")
+    return regressions
+
+def load_results(path: str) -> dict:
+    """Returns the scenarios stored in a results file, or an empty dict."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)["scenarios"]
+
+def save_results(path: str, results: dict):
+    """Writes the results of a run to a JSON file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"date": time.strftime("%Y-%m-%d %H:%M:%S"),
+                   "python": platform.python_version(),
+                   "machine": platform.machine(),
+                   "scenarios": results}, file, indent=2)
+
+def run(only: list[str] = None, output: str = f"{RESULTS}/latest.json",
+        baseline: str = f"{RESULTS}/baseline.json", threshold: float = THRESHOLD,
+        save_baseline: bool = False) -> list[str]:
+    """Runs the scenarios, prints and saves their results, and returns the\
+    regressions against the baseline."""
+    enable_headless()
+    from data.loading import init_game
+    init_game(threaded=False)
+    results = {}
+    print(f"{'scenario':>32} {'ms/frame':>10} {'ops/s':>12}")
+    for name, setup, params, frames in SCENARIOS:
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        results[name] = measure(setup, params, frames)
+        print(f"{name:>32} {results[name]['ms_per_frame']:>10.3f}"
+              f" {results[name]['ops_per_sec']:>12.0f}")
+    save_results(output, results)
+    if save_baseline:
+        save_results(baseline, results)
+        print(f"baseline saved to {baseline}")
+        return []
+    stored = load_results(baseline)
+    if not stored:
+        print(f"no baseline at {baseline}, run with --save-baseline to create it")
+        return []
+    regressions = compare(results, stored, threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return regressions
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", maxsplit=1)[0])
+    parser.add_argument("--only", nargs="*", help="prefixes of the scenarios to run")
+    parser.add_argument("--output", default=f"{RESULTS}/latest.json")
+    parser.add_argument("--baseline", default=f"{RESULTS}/baseline.json")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD,
+                        help="allowed slowdown against the baseline, 0.2 for 20%%")
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+    if run(args.only, args.output, args.baseline, args.threshold, args.save_baseline):
+        sys.exit(1)
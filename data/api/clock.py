@@ -8,6 +8,7 @@ class Clock:
     def __init__(self, buffer_size: int = 10):
         self._last_time = time.perf_counter()
         self._frame_times = deque(maxlen=buffer_size)
+        self._busy_times = deque(maxlen=buffer_size)
 
     def tick(self, fps: int = None) -> int:
         """Limit loop to `fps` frames per second.
@@ -18,10 +19,12 @@ class Clock:
             dt = now - self._last_time
             self._last_time = now
             self._frame_times.append(dt)
+            self._busy_times.append(dt)
             return int(dt * 1000)
         frame_duration = round(1.0 / fps, 5)
         now = time.perf_counter()
         dt = now - self._last_time
+        self._busy_times.append(dt)
         if dt < frame_duration:
             time.sleep(frame_duration - dt)
             now = time.perf_counter()
@@ -39,3 +42,28 @@ class Clock:
         if avg_dt == 0:
             return 0.0
         return 1.0 / avg_dt
+
+    @property
+    def frame_time(self) -> float:
+        """Returns the average duration in seconds of the buffered frames."""
+        if not self._frame_times:
+            return 0.0
+        return sum(self._frame_times) / len(self._frame_times)
+
+    @property
+    def busy_time(self) -> float:
+        """Returns the average time in seconds spent in the buffered frames\
+        before sleeping, the part of the frame the game actually used."""
+        if not self._busy_times:
+            return 0.0
+        return sum(self._busy_times) / len(self._busy_times)
+
+    @property
+    def busy_times(self) -> deque:
+        """Returns the buffered busy times, in seconds."""
+        return self._busy_times
+
+    @property
+    def frames(self) -> int:
+        """Returns the amount of buffered frames."""
+        return len(self._frame_times)
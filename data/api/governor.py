@@ -0,0 +1,148 @@
+"""Adaptive quality. When frames take longer than their budget, the governor
+lowers the cost of the optional visuals one step at a time, and brings them
+back once the game has headroom again."""
+
+import time
+from collections import deque
+
+from data.constants import SYSTEM
+
+QUALITY_LEVELS = (
+    {"particles": 1.0, "trail": 1.0, "damage_texts": 1, "buff_animations": True, "hitboxes": True},
+    {"particles": 1.0, "trail": 1.0, "damage_texts": 1, "buff_animations": True, "hitboxes": False},
+    {"particles": 0.5, "trail": 2.0, "damage_texts": 1, "buff_animations": True, "hitboxes": False},
+    {"particles": 0.25, "trail": 3.0, "damage_texts": 2, "buff_animations": False,
+     "hitboxes": False},
+    {"particles": 0.1, "trail": 5.0, "damage_texts": 4, "buff_animations": False,
+     "hitboxes": False},
+)
+
+class QualityGovernor():
+    """Steps the quality level from the busy times collected by the clock.
+    Level 0 is the full quality; each level above it drops hitbox debug
+    drawing, then cuts the particle budget and trail emissions, then skips
+    damage numbers and buff animations.
+
+    Args:
+        high (float, optional): Share of the frame budget above which the\
+        quality is lowered. Defaults to 1.0.
+        low (float, optional): Share of the frame budget under which the\
+        quality is raised. Defaults to 0.6.
+        patience (int, optional): Amount of frames above budget before\
+        lowering the quality. Defaults to 10.
+        recovery (int, optional): Amount of frames with headroom before\
+        raising the quality. Defaults to 180.
+    """
+    __slots__ = '_level', '_high', '_low', '_patience', '_recovery', '_over', '_under', \
+                '_particle_base', '_damage_count', '_history'
+    def __init__(self, high: float = 1.0, low: float = 0.6, patience: int = 10,
+                 recovery: int = 180):
+        self._level = 0
+        self._high = high
+        self._low = low
+        self._patience = patience
+        self._recovery = recovery
+        self._over = 0
+        self._under = 0
+        self._particle_base = None
+        self._damage_count = 0
+        self._history = deque(maxlen=64)
+
+    def update(self, clock, fps: int) -> bool:
+        """Checks the last frames and steps the quality if needed.
+
+        Args:
+            clock (Clock): Clock of the game.
+            fps (int): Targeted frames per second.
+
+        Returns:
+            bool: Whether or not the quality level changed.
+        """
+        busy = clock.busy_times
+        if not busy:
+            return False
+        budget = 1 / fps if fps and fps > 0 else 1 / 60
+        load = sorted(busy)[len(busy) // 2] / budget
+        if load > self._high:
+            self._over += 1
+            self._under = 0
+        elif load < self._low:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = 0
+            self._under = 0
+        if self._over >= self._patience and self._level < len(QUALITY_LEVELS) - 1:
+            self.set_level(self._level + 1, load)
+            return True
+        if self._under >= self._recovery and self._level > 0:
+            self.set_level(self._level - 1, load)
+            return True
+        return False
+
+    def set_level(self, level: int, load: float = None):
+        """Changes the quality level and logs it.
+
+        Args:
+            level (int): New level, 0 being the full quality.
+            load (float, optional): Share of the frame budget that caused\
+            the change. Defaults to None.
+        """
+        level = max(0, min(level, len(QUALITY_LEVELS) - 1))
+        previous = self._level
+        self._over = 0
+        self._under = 0
+        if level == previous:
+            return
+        self._level = level
+        emitter = SYSTEM.get("particle_emitter")
+        if emitter is not None:
+            if self._particle_base is None:
+                self._particle_base = emitter.max_particles
+            emitter.max_particles = self._particle_base * QUALITY_LEVELS[level]["particles"]
+            if level == 0:
+                self._particle_base = None
+        self._history.append((time.perf_counter(), previous, level, load))
+        if SYSTEM.get("logger") is not None:
+            reason = "" if load is None else f" (frames at {load:.0%} of budget)"
+            SYSTEM["logger"].print(f"Quality level {previous} -> {level}{reason}")
+
+    def reset(self):
+        """Restores the full quality."""
+        self.set_level(0)
+
+    def allow_damage_text(self, crit: bool = False) -> bool:
+        """Returns whether or not a damage number should be shown. Critical\
+        hits are always shown."""
+        every = QUALITY_LEVELS[self._level]["damage_texts"]
+        if crit or every <= 1:
+            return True
+        self._damage_count = (self._damage_count + 1) % every
+        return self._damage_count == 0
+
+    @property
+    def level(self) -> int:
+        """Returns the current quality level."""
+        return self._level
+
+    @property
+    def trail_factor(self) -> float:
+        """Returns the multiplier of the trail emission intervals."""
+        return QUALITY_LEVELS[self._level]["trail"]
+
+    @property
+    def buff_animations(self) -> bool:
+        """Returns whether or not the buff animations are drawn."""
+        return QUALITY_LEVELS[self._level]["buff_animations"]
+
+    @property
+    def hitboxes(self) -> bool:
+        """Returns whether or not the hitboxes may be drawn."""
+        return QUALITY_LEVELS[self._level]["hitboxes"]
+
+    @property
+    def history(self) -> deque:
+        """Returns the last adjustments, as (time, previous level, level, load)."""
+        return self._history
+
+GOVERNOR = QualityGovernor()
@@ -100,18 +100,25 @@ KEY_EVENT = {
     "shift": (K_LSHIFT, K_RSHIFT),
 }
 
-def get_key_event():
-    """Returns the list of key events."""
+def get_key_event(buttons: tuple = None):
+    """Returns the list of key events.
+
+    Args:
+        buttons (tuple, optional): State of the mouse buttons. Defaults to\
+        None, using `SYSTEM["mouse_click"]`.
+    """
     keys = get_keys()
+    if buttons is None:
+        buttons = SYSTEM["mouse_click"]
     events = set()
     for k, binds in KEY_EVENT.items():
         if (binds[0] is not None and keys[binds[0]]) or\
             (binds[1] is not None and keys[binds[1]]):
             events.add(k)
-        if LMB in (binds[0], binds[1]) and SYSTEM["mouse_click"][0]:
+        if LMB in (binds[0], binds[1]) and buttons[0]:
             events.add(k)
-        if MMB in (binds[0], binds[1]) and SYSTEM["mouse_click"][1]:
+        if MMB in (binds[0], binds[1]) and buttons[1]:
             events.add(k)
-        if RMB in (binds[0], binds[1]) and SYSTEM["mouse_click"][2]:
+        if RMB in (binds[0], binds[1]) and buttons[2]:
             events.add(k)
     return events
@@ -0,0 +1,132 @@
+"""Metrics of the running game: memory in use and the size of the trackers
+and caches. They are sampled on a background thread a few times per second
+at most, so the frame loop only reads the last values."""
+
+import csv
+import os
+import threading
+import time
+from collections import deque
+
+import psutil
+
+class MetricsCollector():
+    """Samples gauges on a background timer.
+
+    Args:
+        interval (float, optional): Delay in seconds between two samples.\
+        Defaults to 1.0.
+        history (int, optional): Amount of samples kept per gauge.\
+        Defaults to 300.
+    """
+    __slots__ = '_interval', '_gauges', '_values', '_history', '_history_size', '_process', \
+                '_thread', '_stop', '_log_path', '_logging', '_samples', '_lock'
+    def __init__(self, interval: float = 1.0, history: int = 300):
+        self._interval = interval
+        self._gauges = {"rss": self.rss}
+        self._values = {}
+        self._history = {}
+        self._history_size = history
+        self._process = psutil.Process(os.getpid())
+        self._thread = None
+        self._stop = threading.Event()
+        self._log_path = None
+        self._logging = False
+        self._samples = 0
+        self._lock = threading.Lock()
+
+    def rss(self) -> float:
+        """Returns the memory used by the game in MB."""
+        return self._process.memory_info().rss / 1024 / 1024
+
+    def add_gauge(self, name: str, function):
+        """Adds a value to sample.
+
+        Args:
+            name (str): Name of the gauge.
+            function (callable): Called without arguments, returns the value.
+        """
+        self._gauges[name] = function
+
+    def sample(self) -> dict:
+        """Reads every gauge now, and returns their values. A gauge that\
+        fails is skipped, as the game state it reads may not exist yet."""
+        values = {"time": time.time()}
+        for name, function in self._gauges.items():
+            try:
+                values[name] = function()
+            except (AttributeError, KeyError, TypeError):
+                continue
+        with self._lock:
+            self._values = values
+            for name, value in values.items():
+                if name not in self._history:
+                    self._history[name] = deque(maxlen=self._history_size)
+                self._history[name].append(value)
+            self._samples += 1
+        if self._logging and self._log_path is not None:
+            self._write(values)
+        return values
+
+    def _write(self, values: dict):
+        """Appends a sample to the log file."""
+        directory = os.path.dirname(self._log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        names = ["time"] + list(self._gauges)
+        new_file = not os.path.exists(self._log_path)
+        with open(self._log_path, "a", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            if new_file:
+                writer.writerow(names)
+            writer.writerow([values.get(name, "") for name in names])
+
+    def _run(self):
+        """Samples until stopped."""
+        while not self._stop.wait(self._interval):
+            self.sample()
+
+    def start(self, log_path: str = None):
+        """Starts sampling in the background.
+
+        Args:
+            log_path (str, optional): CSV file the samples are appended to\
+            while logging is on. Defaults to None (no log).
+        """
+        self._log_path = log_path
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stops sampling."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def history(self, name: str) -> list:
+        """Returns the kept samples of a gauge, oldest first."""
+        with self._lock:
+            return list(self._history.get(name, ()))
+
+    @property
+    def values(self) -> dict:
+        """Returns the last sampled values."""
+        return self._values
+
+    @property
+    def samples(self) -> int:
+        """Returns the amount of samples taken."""
+        return self._samples
+
+    @property
+    def logging(self) -> bool:
+        """Returns whether or not samples are written to the log file."""
+        return self._logging
+
+    @logging.setter
+    def logging(self, value: bool):
+        self._logging = value
@@ -9,6 +9,10 @@ def flip():
     """Wrapper toward pygame's flip."""
     pygame.display.flip()
 
+def update(rects):
+    """Wrapper toward pygame's update, only refreshing parts of the screen."""
+    pygame.display.update(rects)
+
 def mouse_position():
     """Wrapper to pygame's mouse pos."""
     return pygame.mouse.get_pos()
@@ -85,10 +89,11 @@ class Surface(Widget):
         return self._surface.scroll(dx, dy)
 
     def blits(self, sources):
-        """Batch blit multiple surfaces efficiently."""
+        """Batch blit multiple surfaces efficiently. Items are (source, dest)\
+        or (source, dest, area) tuples."""
         batch = [
-            (src.surface if isinstance(src, Surface) else src, dest)
-            for src, dest in sources
+            (src.surface, *rest) if isinstance(src, Surface) else (src, *rest)
+            for src, *rest in sources
         ]
         return self._surface.blits(batch)
 
@@ -164,6 +169,12 @@ class Surface(Widget):
         self._width, self._height = w, h
         return self
 
+    def scale_into(self, dest: "Surface") -> "Surface":
+        """Scales this surface into another one, of any size. Neither\
+        surface is reallocated, and this one is left untouched."""
+        pygame.transform.scale(self._surface, dest.get_size(), dest.surface)
+        return dest
+
     def smoothscale(self, size: tuple[int, int] | None = None,
               width: int | None = None, height: int | None = None) -> "Surface":
         """Scale this surface to a new size (absolute)."""
@@ -200,8 +211,9 @@ class Surface(Widget):
     @classmethod
     def from_existing(cls, existing: pygame.Surface):
         """Wrap an existing pygame.Surface inside our Surface"""
-        obj = cls(existing.get_width(), existing.get_height())
+        obj = cls()
         obj._surface = existing
+        obj._width, obj._height = existing.get_size()
         return obj
 
     @classmethod
@@ -225,3 +237,90 @@ class Surface(Widget):
     @surface.setter
     def surface(self, sfc):
         self._surface = sfc
+
+class Overlay(Surface):
+    """A transparent surface drawn over the whole screen, which remembers\
+    the bounding box of everything drawn on it. Only that box is cleared\
+    and blitted on the screen, and nothing at all when the overlay is empty.
+
+    Args:
+        width (float): Width of the overlay.
+        height (float): Height of the overlay.
+    """
+    __slots__ = '_bounds', '_area'
+    def __init__(self, width: float, height: float):
+        super().__init__(width, height)
+        self._bounds = None
+        self._area = pygame.Rect(0, 0, width, height)
+
+    def mark(self, rect):
+        """Adds a rect to the drawn bounding box. Returns the rect."""
+        if rect is None:
+            return rect
+        rect = self._area.clip(rect)
+        if rect.w and rect.h:
+            if self._bounds is None:
+                self._bounds = rect
+            else:
+                self._bounds.union_ip(rect)
+        return rect
+
+    def mark_many(self, rects):
+        """Adds many rects to the drawn bounding box."""
+        if rects:
+            self.mark(rects[0].unionall(rects[1:]))
+
+    def blit(self, source, dest: tuple[float|float], premult = None):
+        return self.mark(super().blit(source, dest, premult))
+
+    def blits(self, sources):
+        rects = super().blits(sources)
+        self.mark_many(rects)
+        return rects
+
+    def fill(self, color, rect=None):
+        return self.mark(super().fill(color, rect))
+
+    def set_at(self, pos: tuple[int, int], color):
+        super().set_at(pos, color)
+        self.mark(pygame.Rect(pos[0], pos[1], 1, 1))
+
+    def draw_rect(self, color, rect, width: int = 0):
+        return self.mark(super().draw_rect(color, rect, width))
+
+    def draw_circle(self, color, center, radius: int, width: int = 0):
+        return self.mark(super().draw_circle(color, center, radius, width))
+
+    def draw_line(self, color, start_pos, end_pos, width: int = 1):
+        return self.mark(super().draw_line(color, start_pos, end_pos, width))
+
+    def draw_ellipse(self, color, rect, width: int = 0):
+        return self.mark(super().draw_ellipse(color, rect, width))
+
+    def draw_polygon(self, color, points, width: int = 0):
+        return self.mark(super().draw_polygon(color, points, width))
+
+    def draw_lines(self, color, closed: bool, points, width: int = 1):
+        return self.mark(super().draw_lines(color, closed, points, width))
+
+    def draw_arc(self, color, rect, start_angle, end_angle, width: int = 1):
+        return self.mark(super().draw_arc(color, rect, start_angle, end_angle, width))
+
+    def clear(self, color = (0, 0, 0, 0)):
+        """Clears the drawn bounding box only."""
+        if self._bounds is not None:
+            self._surface.fill(color, self._bounds)
+            self._bounds = None
+
+    def blit_item(self, offset: tuple[int, int] = (0, 0)) -> tuple | None:
+        """Returns the (surface, position, area) to blit the drawn part of\
+        the overlay at the given offset, or None if nothing was drawn."""
+        bounds = self._bounds
+        if bounds is None:
+            return None
+        return (self._surface, (bounds.x + offset[0], bounds.y + offset[1]), bounds.copy())
+
+    @property
+    def bounds(self):
+        """Returns the bounding box of what was drawn, None if empty."""
+        return self._bounds
@@ -0,0 +1,145 @@
+"""Process-wide registry of decoded images. Every file is read and
+decoded once while it is in use; images created from the same uri
+afterwards start from an in-memory copy, and clones reuse the result of
+the transformations they replay. Both kinds of surfaces are kept within
+a memory budget, the least recently used ones being released first."""
+
+import threading
+from collections import OrderedDict
+
+from data.api.surface import Surface
+from data.constants import RESSOURCES
+
+class ImageRegistry():
+    """Stores decoded surfaces by uri, and the transformed surfaces made\
+    from them by (uri, flip, rotation, scale).
+
+    The stored surfaces are shared: callers must copy them before\
+    drawing on them or changing their alpha. The registry is filled by\
+    the loading thread while the main thread draws, so every access holds\
+    its lock.
+
+    Args:
+        max_bytes (int, optional): Memory budget of the transformed\
+        surfaces. Defaults to 64 MB.
+        max_file_bytes (int, optional): Memory budget of the decoded\
+        files. A file released from it is read again on its next use.\
+        Defaults to 8 MB.
+    """
+    __slots__ = '_surfaces', '_transforms', '_max_bytes', '_bytes', '_loads', '_reuses', \
+                '_max_file_bytes', '_file_bytes', '_lock'
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024,
+                 max_file_bytes: int = 8 * 1024 * 1024):
+        self._surfaces = OrderedDict()
+        self._transforms = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._max_file_bytes = max_file_bytes
+        self._file_bytes = 0
+        self._loads = 0
+        self._reuses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _size(surface) -> int:
+        """Returns the memory used by the pixels of a surface."""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @classmethod
+    def _store(cls, store: OrderedDict, key, surface, used: int, budget: int) -> int:
+        """Stores a surface, evicting the least recently used ones to stay\
+        within the budget. Returns the memory used by the store."""
+        old = store.pop(key, None)
+        if old is not None:
+            used -= cls._size(old)
+        size = cls._size(surface)
+        if size > budget:
+            return used
+        store[key] = surface
+        used += size
+        while used > budget:
+            _, old = store.popitem(last=False)
+            used -= cls._size(old)
+        return used
+
+    def load(self, uri: str):
+        """Returns the decoded pygame surface of a file, reading it only\
+        the first time.
+
+        Args:
+            uri (str): Path of the file in /ressources/.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with self._lock:
+            surface = self._surfaces.get(uri)
+            if surface is None:
+                surface = Surface.load(f"{RESSOURCES}/{uri}").surface
+                self._file_bytes = self._store(self._surfaces, uri, surface,
+                                               self._file_bytes, self._max_file_bytes)
+                self._loads += 1
+            else:
+                self._surfaces.move_to_end(uri)
+                self._reuses += 1
+            return surface
+
+    def get(self, key: tuple):
+        """Returns the transformed surface stored for a key, or None."""
+        with self._lock:
+            surface = self._transforms.get(key)
+            if surface is not None:
+                self._transforms.move_to_end(key)
+                self._reuses += 1
+            return surface
+
+    def put(self, key: tuple, surface):
+        """Stores a transformed surface, evicting the least recently used\
+        ones to stay within the budget."""
+        with self._lock:
+            self._bytes = self._store(self._transforms, key, surface,
+                                      self._bytes, self._max_bytes)
+
+    def clear(self):
+        """Forgets every stored surface."""
+        with self._lock:
+            self._surfaces.clear()
+            self._transforms.clear()
+            self._bytes = 0
+            self._file_bytes = 0
+
+    def __contains__(self, uri):
+        with self._lock:
+            return uri in self._surfaces
+
+    @property
+    def files(self) -> int:
+        """Returns the amount of decoded files."""
+        return len(self._surfaces)
+
+    @property
+    def transforms(self) -> int:
+        """Returns the amount of stored transformations."""
+        return len(self._transforms)
+
+    @property
+    def bytes(self) -> int:
+        """Returns the memory used by the transformed surfaces."""
+        return self._bytes
+
+    @property
+    def file_bytes(self) -> int:
+        """Returns the memory used by the decoded files."""
+        return self._file_bytes
+
+    @property
+    def loads(self) -> int:
+        """Returns the amount of files read from the disk."""
+        return self._loads
+
+    @property
+    def reuses(self) -> int:
+        """Returns the amount of requests served from memory."""
+        return self._reuses
+
+IMAGE_REGISTRY = ImageRegistry()
@@ -0,0 +1,174 @@
+"""Pre-rendered rotations of projectile animations. Projectiles are
+rotated towards their direction when spawned, which costs a transform
+of every frame of their animation; baking the rotations at load time
+turns this into a lookup.
+
+Each baked set on disk comes with a stamp of the source file and of the
+bake parameters; a set whose stamp differs, or a strip that cannot be read,
+is baked again and overwritten."""
+
+import json
+import os
+
+from data.api.surface import Surface
+from data.constants import RESSOURCES
+from data.image.animation import Animation
+from data.image.image import Image
+
+class RotationBake():
+    """Stores every rotation bucket of some animations, for a set of\
+    area tiers. Unlike the transformation cache, baked sets are never evicted.
+
+    Args:
+        step (int, optional): Size in degrees of a rotation bucket.\
+        Defaults to 5, which gives 72 buckets.
+        directory (str, optional): Folder where the baked frames are\
+        saved as PNG strips so later launches can load them instead of\
+        baking them again. Defaults to None (no persistence).
+    """
+    __slots__ = '_step', '_directory', '_sets'
+    def __init__(self, step: int = 5, directory: str = None):
+        self._step = step
+        self._directory = directory
+        self._sets = {}
+
+    def bucket(self, angle: float) -> int:
+        """Returns the index of the rotation bucket of an angle."""
+        return int(round(angle / self._step)) % self.buckets
+
+    def _path(self, name: str, area: float, bucket: int) -> str:
+        """Returns the file of a baked bucket."""
+        return os.path.join(self._directory, f"{name}_{area:.2f}_{bucket:03d}.png")
+
+    def _stamp_path(self, name: str, area: float) -> str:
+        """Returns the file of the stamp of a baked set."""
+        return os.path.join(self._directory, f"{name}_{area:.2f}.json")
+
+    def _stamp(self, animation: Animation, area: float) -> dict:
+        """Returns what a baked set depends on: the size and modification\
+        time of the source file, the transforms of the animation and the\
+        parameters of the bake.
+
+        Args:
+            animation (Animation): Animation to rotate.
+            area (float): Scale factor of the tier.
+        """
+        data = json.loads(animation.export())
+        source = f"{RESSOURCES}/{data['uri']}"
+        if os.path.isfile(source):
+            info = os.stat(source)
+            data["source"] = [info.st_size, info.st_mtime_ns]
+        else:
+            data["source"] = None
+        data["frames"] = len(animation.frames)
+        data["step"] = self._step
+        data["area"] = area
+        return data
+
+    def _read_stamp(self, path: str) -> dict|None:
+        """Returns the stamp saved for a baked set, or None if it is missing\
+        or unreadable."""
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return None
+
+    def _load(self, animation: Animation, path: str) -> Animation|None:
+        """Loads a baked bucket saved as a strip of frames. Returns None\
+        if the file is missing, unreadable or does not match the animation."""
+        if not os.path.isfile(path):
+            return None
+        try:
+            strip = Image(Surface.load(path))
+        # pygame's errors on a truncated or corrupt file are RuntimeErrors
+        except (RuntimeError, OSError):
+            return None
+        count = len(animation.frames)
+        width = strip.width // count
+        if width * count != strip.width:
+            return None
+        frames = [strip.extracts(index * width, 0, width, strip.height)\
+                  for index in range(count)]
+        return animation.copy(frames)
+
+    def _save(self, animation: Animation, path: str):
+        """Saves a baked bucket as a strip of frames."""
+        frames = animation.frames
+        width = frames[0].image.get_width()
+        strip = Surface(width * len(frames), frames[0].image.get_height())
+        strip.blits([(frame.image, (index * width, 0)) for index, frame in enumerate(frames)])
+        strip.save(path)
+
+    def bake(self, name: str, animation: Animation, area: float = 1) -> int:
+        """Bakes every rotation of an animation for an area tier, the same\
+        way a projectile transforms it on spawn. Buckets found in the cache\
+        directory are loaded instead, if the stamp of the set still matches.
+
+        Args:
+            name (str): Key of the animation in `SYSTEM["images"]`.
+            animation (Animation): Animation to rotate.
+            area (float, optional): Scale factor of the tier. Defaults to 1.
+
+        Returns:
+            int: Amount of buckets that had to be rendered.
+        """
+        area = round(area, 2)
+        persist = self._directory is not None
+        fresh = False
+        if persist:
+            os.makedirs(self._directory, exist_ok=True)
+            stamp = self._stamp(animation, area)
+            stamp_path = self._stamp_path(name, area)
+            fresh = self._read_stamp(stamp_path) == stamp
+            if not fresh and os.path.isfile(stamp_path):
+                os.remove(stamp_path)
+        rotations = []
+        rendered = 0
+        for bucket in range(self.buckets):
+            path = self._path(name, area, bucket) if persist else None
+            baked = self._load(animation, path) if fresh else None
+            if baked is None:
+                baked = animation.copy().rotate(bucket * self._step).scale(area, area, False)
+                rendered += 1
+                if path is not None:
+                    self._save(baked, path)
+            rotations.append(baked)
+        if persist and not fresh:
+            with open(stamp_path, "w", encoding="utf-8") as file:
+                json.dump(stamp, file)
+        self._sets[(name, area)] = rotations
+        return rendered
+
+    def get(self, name: str, angle: float, area: float = 1) -> Animation|None:
+        """Returns the baked rotation closest to the angle, or None if the\
+        animation was not baked for this area tier."""
+        rotations = self._sets.get((name, round(area, 2)))
+        if rotations is None:
+            return None
+        return rotations[self.bucket(angle)]
+
+    def clear(self):
+        """Forgets every baked set. Files on disk are kept."""
+        self._sets.clear()
+
+    def __contains__(self, key):
+        return key in self._sets
+
+    def __len__(self):
+        return len(self._sets)
+
+    @property
+    def step(self) -> int:
+        """Returns the size in degrees of a bucket."""
+        return self._step
+
+    @property
+    def buckets(self) -> int:
+        """Returns the amount of buckets per set."""
+        return 360 // self._step
+
+    @property
+    def directory(self) -> str:
+        """Returns the folder of the persisted bakes."""
+        return self._directory
@@ -1,41 +1,164 @@
 """For caching projectile transformations"""
 
-from functools import lru_cache
+from collections import OrderedDict
+
+from data.api.surface import Surface
+from data.image.image import Image
+from data.image.animation import Animation
+from data.image.sprite import Sprite
+
+def estimate_bytes(image) -> int:
+    """Estimates the memory used by the pixels of an image, animation or sprite."""
+    if isinstance(image, Sprite):
+        return sum(estimate_bytes(anim) for anim in image.animations.values())
+    if isinstance(image, Animation):
+        return sum(estimate_bytes(frame) for frame in image.frames)
+    if isinstance(image, Image):
+        return estimate_bytes(image.image)
+    if image is None:
+        return 0
+    if isinstance(image, Surface):
+        image = image.surface
+    return image.get_width() * image.get_height() * image.get_bytesize()
 
 class TransformCache:
-    """Caches transformed versions of animations for reuse."""
-    def __init__(self):
-        self._cache = {}
-        self._max_cache_size = 1024
-        self._access_count = {}
-
-    @lru_cache(1024)
-    def get_key(self, image_name, rotation=0, scale=1.0, flip=False):
+    """Caches transformed versions of animations for reuse.
+
+    Entries are kept in a segmented LRU: new entries land in a probation
+    segment and are promoted to a protected segment on their second hit,
+    so a burst of one-shot transformations cannot flush the ones that are
+    reused all the time. Every operation is O(1).
+
+    Args:
+        max_bytes (int, optional): Memory budget of the cache, estimated from\
+        the size of the frames. Defaults to 256 MB.
+        protected_ratio (float, optional): Share of the budget kept for entries\
+        that were hit at least once. Defaults to 0.8.
+    """
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024, protected_ratio: float = 0.8):
+        self._probation = OrderedDict()
+        self._protected = OrderedDict()
+        self._max_bytes = max_bytes
+        self._max_protected = int(max_bytes * protected_ratio)
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def get_key(image_name, rotation=0, scale=1.0, flip=False) -> tuple:
         """Generate cache key for transformation."""
-        rotation = round(rotation / 5) * 5
-        scale = round(scale, 2)
-        return f"{image_name}|r{rotation}|s{scale}|f{flip}"
+        return (image_name, round(rotation / 5) * 5, round(scale, 2), flip)
 
     def get(self, image_name, rotation=0, scale=1.0, flip=False):
         """Get cached transformed image or None."""
         key = self.get_key(image_name, rotation, scale, flip)
-        if key in self._cache:
-            self._access_count[key] = self._access_count.get(key, 0) + 1
-            return self._cache[key]
-        return None
+        entry = self._protected.get(key)
+        if entry is not None:
+            self._protected.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+        entry = self._probation.pop(key, None)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._probation_bytes -= entry[1]
+        self._protected[key] = entry
+        self._protected_bytes += entry[1]
+        while self._protected_bytes > self._max_protected and len(self._protected) > 1:
+            old_key, old = self._protected.popitem(last=False)
+            self._protected_bytes -= old[1]
+            self._probation[old_key] = old
+            self._probation_bytes += old[1]
+        self._evict()
+        return entry[0]
 
     def put(self, image_name, transformed_image, rotation=0, scale=1.0, flip=False):
         """Store transformed image in cache."""
         key = self.get_key(image_name, rotation, scale, flip)
-        if len(self._cache) >= self._max_cache_size:
-            least_used = min(self._access_count.items(), key=lambda x: x[1])
-            del self._cache[least_used[0]]
-            del self._access_count[least_used[0]]
+        self._discard(key)
+        size = estimate_bytes(transformed_image)
+        if size > self._max_bytes:
+            return
+        self._probation[key] = (transformed_image, size)
+        self._probation_bytes += size
+        self._evict()
+
+    def _discard(self, key):
+        """Removes a key from both segments."""
+        entry = self._probation.pop(key, None)
+        if entry is not None:
+            self._probation_bytes -= entry[1]
+        entry = self._protected.pop(key, None)
+        if entry is not None:
+            self._protected_bytes -= entry[1]
 
-        self._cache[key] = transformed_image
-        self._access_count[key] = 0
+    def _evict(self):
+        """Evicts the least recently used entries until the cache fits its budget,
+        starting with the ones that were never hit."""
+        while self._probation_bytes + self._protected_bytes > self._max_bytes:
+            segment = self._probation if self._probation else self._protected
+            _, old = segment.popitem(last=False)
+            if segment is self._probation:
+                self._probation_bytes -= old[1]
+            else:
+                self._protected_bytes -= old[1]
+            self._evictions += 1
 
     def clear(self):
         """Clear the cache."""
-        self._cache.clear()
-        self._access_count.clear()
+        self._probation.clear()
+        self._protected.clear()
+        self._probation_bytes = 0
+        self._protected_bytes = 0
+
+    def stats(self) -> dict:
+        """Returns the counters of the cache, for debug overlays and logs."""
+        return {
+            "entries": len(self),
+            "bytes": self.bytes,
+            "max_bytes": self._max_bytes,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_rate": self.hit_rate
+        }
+
+    def __len__(self):
+        return len(self._probation) + len(self._protected)
+
+    def __contains__(self, key):
+        return key in self._probation or key in self._protected
+
+    @property
+    def bytes(self) -> int:
+        """Returns the estimated memory used by the cached frames."""
+        return self._probation_bytes + self._protected_bytes
+
+    @property
+    def max_bytes(self) -> int:
+        """Returns the memory budget of the cache."""
+        return self._max_bytes
+
+    @property
+    def hits(self) -> int:
+        """Returns the amount of successful lookups."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the amount of failed lookups."""
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Returns the amount of entries evicted to fit the budget."""
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """Returns the ratio of successful lookups."""
+        total = self._hits + self._misses
+        return self._hits / total if total else 0.0
@@ -1,10 +1,10 @@
 """Projectile are the most common type of attacks."""
 
 from math import pi
-import random
 import numpy
 
 from data.api.vec2d import Vec2
+from data.api.governor import GOVERNOR
 
 from data.constants import Flags, SCREEN_HEIGHT, SCREEN_WIDTH, SYSTEM,\
     PROJECTILE_TRACKER, ENNEMY_TRACKER, ANIMATION_TRACKER, PARTICULE_TRACKER
@@ -13,6 +13,7 @@ from data.physics.hitbox import HitBox
 from data.game.creature import Creature
 from data.image.animation import Animation
 from data.image.controller import AnimationController
+from data.numerics.rng import RNG
 
 class DummyEntity():
     """Emulates an entity of the projectile."""
@@ -39,12 +40,12 @@ class Projectile(HitBox):
                 ignore_team = False, offset_x = 0, offset_y = 0, anim_on_hit = None,
                 anim_speed = 1, debuff_chance = 1.0, trail = None, impact = None):
         if Flags.RANDOM_POSITION in behaviours:
-            if numpy.random.random() > 0.5: #Horizontal
-                y = int(numpy.random.choice([0, SCREEN_HEIGHT]))
-                x = numpy.random.randint(0, SCREEN_WIDTH + 1)
+            if RNG["combat"].random() > 0.5: #Horizontal
+                y = int(RNG["combat"].choice([0, SCREEN_HEIGHT]))
+                x = RNG["combat"].integers(0, SCREEN_WIDTH + 1)
             else: #Vertical
-                x = int(numpy.random.choice([0, SCREEN_WIDTH]))
-                y = numpy.random.randint(0, SCREEN_HEIGHT)
+                x = int(RNG["combat"].choice([0, SCREEN_WIDTH]))
+                y = RNG["combat"].integers(0, SCREEN_HEIGHT)
         self._speed = speed
         self._angle = angle % 360
         self._wander_angle = angle
@@ -68,7 +69,9 @@ class Projectile(HitBox):
                 self._angle = 90 - numpy.arctan2(closest.entity.hitbox.center_x - x,\
                     closest.entity.hitbox.center_y - y) * 180 / pi
                 self._target = closest
-        cached = SYSTEM["trans_cache"].get(imagefile, -self._angle, area, False)
+        cached = SYSTEM["rotation_bake"].get(imagefile, -self._angle, area)
+        if cached is None:
+            cached = SYSTEM["trans_cache"].get(imagefile, -self._angle, area, False)
         self._initial_angle = self._angle
         if cached is not None:
             self._real_image = cached
@@ -227,8 +230,8 @@ class Projectile(HitBox):
             if num != "Dodged !":
                 if self._anim_on_hit is not None:
                     if Flags.IMPACT_ANIMATION_RANDOM in self._behaviours:
-                        x = numpy.random.randint(entity.left, entity.right)
-                        y = numpy.random.randint(entity.top, entity.bottom)
+                        x = RNG["combat"].integers(entity.left, entity.right)
+                        y = RNG["combat"].integers(entity.top, entity.bottom)
                     else:
                         x = self.center_x - self._anim_on_hit.width / 2
                         y = self.center_y - self._anim_on_hit.height / 2
@@ -319,7 +322,7 @@ class Projectile(HitBox):
             self._real_image.tick(self._anim_speed)
         if self._particle_trail and SYSTEM["particle_emitter"].enabled:
             self._particle_timer += 0.016
-            if self._particle_timer >= self._particle_interval:
+            if self._particle_timer >= self._particle_interval * GOVERNOR.trail_factor:
                 self._particle_timer = 0
                 config = self._particle_trail
                 SYSTEM["particle_emitter"].emit(
@@ -375,7 +378,7 @@ class Projectile(HitBox):
         if Flags.SKITTER in self._behaviours:
             if self._delay <= 0:
                 self._delay = self._initial_delay
-                self._angle = numpy.random.randint(-60, 60) + self._initial_angle
+                self._angle = RNG["combat"].integers(-60, 60) + self._initial_angle
         self.move()
         if Flags.CHAINS in self._behaviours and self._bounced and self._chains > 0:
             self._bounced = False
@@ -395,16 +398,16 @@ class Projectile(HitBox):
             self._speed *= 1.4
             if self.x <= 0:
                 self.x += self._width
-                self._angle = random.randint(45, 135)
+                self._angle = RNG["combat"].randint(45, 135)
             if self.x >= SCREEN_WIDTH:
                 self.x -= self._width * 2
-                self._angle = random.randint(135, 225)
+                self._angle = RNG["combat"].randint(135, 225)
             if self.y <= 0:
                 self.y += self._height
-                self._angle = random.randint(-45, 45)
+                self._angle = RNG["combat"].randint(-45, 45)
             if self.y >= SCREEN_HEIGHT:
                 self.y -= self._height * 2
-                self._angle = random.randint(225, 315)
+                self._angle = RNG["combat"].randint(225, 315)
             self.move((self.x, self.y))
         if self._bounces <= 0 and Flags.BOUNCE in self._behaviours:
             self._flagged = True
@@ -1,12 +1,11 @@
 """Special spell component for meteor."""
 
-import numpy
-
 from data.constants import SYSTEM, PROJECTILE_TRACKER, SCREEN_WIDTH, trad
 from data.components.spells.spell import Spell
 from data.components.projectiles.p_meteor import MeteorProjectile
 from data.game.creature import Creature
 from data.physics.entity import Entity
+from data.numerics.rng import RNG
 
 class Meteor(Spell):
     """Unique spell component for meteor."""
@@ -28,7 +27,7 @@ class Meteor(Spell):
                          angle=90, ignore_team=False):
         area = self._stats["area"].c_value + caster.stats["area"].c_value
         debuffs, debuff_chance = self.generate_debuff_list(caster)
-        x = int(numpy.random.randint(0, SCREEN_WIDTH)) - 64
+        x = int(RNG["combat"].integers(0, SCREEN_WIDTH)) - 64
         y = SYSTEM["mouse"][1]
         proj = MeteorProjectile(x, -64,\
                         self._attack_anim,\
@@ -1,7 +1,6 @@
 """For spells"""
 
 import json
-import numpy
 
 from data.api.surface import Surface
 
@@ -18,6 +17,7 @@ from data.numerics.damage import Damage
 from data.constants import Flags, PROJECTILE_TRACKER, SYSTEM, trad, BLACK
 from data.numerics.affliction import Affliction
 from data.image.hoverable import Hoverable, Text
+from data.numerics.rng import RNG
 
 class Spell():
     """Creates a spell. A spell is how creature interact with each other
@@ -295,7 +295,7 @@ class Spell():
                 self._counter = self._stats["delay"].c_value
                 self.spawn_projectile(caster.entity, caster.creature, False, 0, 0,\
                                           self._stats["delay"].c_value * 10,\
-                                          numpy.random.randint(0, 361))
+                                          RNG["combat"].integers(0, 361))
             if self._to_release <= 0:
                 self._releasing = False
         if Flags.COMBO_SPELL in self.all_flags:
@@ -727,7 +727,7 @@ class Spell():
         if Flags.PROJECTILE in self.all_flags:
             angle_mod = 0
             if Flags.RANDOM_ANGLE in self._flags:
-                angle_mod = int(numpy.random.randint(0, 360))
+                angle_mod = int(RNG["combat"].integers(0, 360))
             if Flags.BARRAGE in self.all_flags:
                 for i in range (0, int(self._stats["projectiles"].c_value)):
                     self.spawn_projectile(target, caster, evil, 0, i * (20 + self._offset[1]),\
@@ -901,6 +901,11 @@ class Spell():
     def icon(self, value):
         self._icon = value
 
+    @property
+    def attack_anim(self):
+        """Returns the key of the spell's attack animation."""
+        return self._attack_anim
+
     @property
     def cooldown(self):
         """Returns the spell's cooldown."""
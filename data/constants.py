@@ -7,6 +7,8 @@ from data.api.surface import mouse_position
 
 ROOT = ""
 RESSOURCES = f"{ROOT}ressources"
+CACHE = f"{ROOT}cache"
+PROFILES = f"{ROOT}profiles"
 
 SCREEN_WIDTH = 1920
 SCREEN_HEIGHT = 1080
@@ -83,6 +85,9 @@ SYSTEM = {
     "loaded": False,
     "progress": 0,
     "playing": True,
+    "headless": False,
+    "inputs": None,
+    "metrics": None,
     "font": None,
     "font_crit": None,
     "text_generator": None,
@@ -94,6 +99,9 @@ SYSTEM = {
         "fps_temp": 60,
         "fps_selector": [120, 60, 30],
         "fps_display": [120, 60, 30],
+        "render_scale": 100,
+        "render_scale_temp": 100,
+        "render_scales": [50, 66, 75, 100],
         "resolutions": [(1138, 640), (1280, 720), (1366, 768), (1600, 900), (1920, 1080)],
         "fullscreen": True,
         "vsync": True,
@@ -105,6 +113,13 @@ SYSTEM = {
         "show_cards": True,
         "show_bars": False,
         "particles_enabled": True,
+        "particles_vectorized": True,
+        "particles_batched": True,
+        "prebake_projectiles": False,
+        "prebake_areas": [2],
+        "dirty_rects": False,
+        "adaptive_quality": True,
+        "profiler": False,
         "display_hp": True,
         "display_exp": False,
         "display_cd": True,
@@ -112,6 +127,7 @@ SYSTEM = {
     "lang": set(),
     "game_state": None,
     "windows": None,
+    "world": None,
     "images": {
         "fireball": None,
         "energyball": None,
@@ -136,13 +152,21 @@ SYSTEM = {
     "real_mouse": (0, 0)
 }
 
-def get_mouse_pos():
-    """Updates the mouse position in world coordinates."""
-    x_factor = SCREEN_WIDTH / SYSTEM["options"]["screen_resolution"][0]
-    y_factor = SCREEN_HEIGHT / SYSTEM["options"]["screen_resolution"][1]
+def screen_mouse_position() -> tuple[float, float]:
+    """Returns the position of the mouse on the screen, whatever the\
+    resolution of the window."""
+    width, height = SYSTEM["options"]["screen_resolution"]
     x, y = mouse_position()
-    x *= x_factor
-    y *= y_factor
+    return (x * SCREEN_WIDTH / width, y * SCREEN_HEIGHT / height)
+
+def get_mouse_pos(position: tuple[float, float] = None):
+    """Updates the mouse position in world coordinates.
+
+    Args:
+        position (tuple[float, float], optional): Position of the mouse on\
+        the screen. Defaults to None, reading the mouse.
+    """
+    x, y = screen_mouse_position() if position is None else position
     SYSTEM["real_mouse"] = (x, y)
     if SYSTEM["level"] is None or SYSTEM["game_state"] in [GAME_PAUSE, GAME_VICTORY, GAME_DEATH]:
         SYSTEM["mouse"] = (x, y)
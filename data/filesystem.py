@@ -84,6 +84,7 @@ def export_options():
     if SYSTEM["options"]["screen_resolution"] != SYSTEM["options"]["screen_resolution_temp"]:
         SYSTEM["options"]["changed"] = True
     SYSTEM["options"]["screen_resolution"] = SYSTEM["options"]["screen_resolution_temp"]
+    SYSTEM["options"]["render_scale"] = SYSTEM["options"]["render_scale_temp"]
     SYSTEM["options"]["fps"] = SYSTEM["options"]["fps_temp"]
     if SYSTEM["options"]["lang_selec"] != SYSTEM["options"]["lang_temp"]:
         SYSTEM["options"]["lang_selec"] = SYSTEM["options"]["lang_temp"]
@@ -95,12 +96,10 @@ def export_options():
 def reload_options():
     """Reloads the options from the SYSTEM."""
     if SYSTEM["options"]["changed"]:
-        disp = set_screen(SYSTEM["options"]["fullscreen"],
-                          SYSTEM["options"]["screen_resolution"][0],
-                          SYSTEM["options"]["screen_resolution"][1],
+        width, height = SYSTEM["options"]["screen_resolution"]
+        disp = set_screen(SYSTEM["options"]["fullscreen"], width, height,
                           SYSTEM["options"]["vsync"])
-        SYSTEM["real_windows"] = Surface(SYSTEM["options"]["screen_resolution"][0],\
-                                        SYSTEM["options"]["screen_resolution"][1], is_alpha=False)
+        SYSTEM["real_windows"] = Surface(width, height, is_alpha=False)
         SYSTEM["real_windows"].surface = disp
         SYSTEM["options"]["changed"] = False
 
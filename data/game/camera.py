@@ -9,6 +9,7 @@ class Camera:
         self.y = y
         self.width = SCREEN_WIDTH
         self.height = SCREEN_HEIGHT
+        self.render_scale = 1.0
 
     def update(self, target_x, target_y, world_width, world_height):
         """Update camera to follow target, constrained to world bounds."""
@@ -21,6 +22,11 @@ class Camera:
         screen_y = world_y - self.y
         return (screen_x, screen_y)
 
+    def screen_to_render(self, screen_x, screen_y):
+        """Convert screen coordinates to coordinates in the reduced render\
+        target of the world."""
+        return (int(screen_x * self.render_scale), int(screen_y * self.render_scale))
+
     def screen_to_world(self, screen_x, screen_y):
         """Convert screen coordinates to world coordinates."""
         world_x = screen_x + self.x
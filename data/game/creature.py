@@ -2,7 +2,6 @@
 both the player and the ennemies alike."""
 
 import json
-import random
 import math
 from data.numerics.ressource import Ressource
 from data.numerics.rangestat import RangeStat
@@ -12,6 +11,7 @@ from data.numerics.damage import Damage
 from data.constants import Flags, SYSTEM, trad, GAME_LEVEL
 from data.game.item import Item
 from data.image.hoverable import Hoverable
+from data.numerics.rng import RNG
 
 NOT_PERCENT = ["life", "mana", "str", "int", "dex", "def", "chains",
     "proj_quantity", "dodge_rating", "precision", "abs_def", "potion_mana_count",
@@ -22,6 +22,13 @@ IGNORE_STAT = ["fire_flat", "fire_pen", "phys_flat", "phys_pen",
 DAMAGE_STAT = ["fire_dmg", "phys_dmg", "ice_dmg", "elec_dmg", "energy_dmg",
     "light_dmg", "dark_dmg"]
 DAMAGE_TYPE = ["phys", "fire", "ice", "lightning", "energy", "light", "dark"]
+STAT_GROUPS = {
+    "all_resistances": ("phys", "fire", "ice", "lightning", "energy", "light", "dark"),
+    "all_damage": ("phys_dmg", "fire_dmg", "ice_dmg", "lightning_dmg", "energy_dmg",
+                   "light_dmg", "dark_dmg"),
+    "elemental_resistances": ("fire", "ice", "lightning"),
+    "elemental_damage": ("fire_dmg", "ice_dmg", "lightning_dmg")
+}
 
 WHITE = (255,255,255)
 
@@ -172,7 +179,7 @@ class Creature:
                            additional_multiplier: float = 1) -> Damage:
         """Takes a raw damage source (ie from a spell) and applies the creature's
         own multipliers to it."""
-        crit_roll = random.uniform(0, 1)
+        crit_roll = RNG["combat"].uniform(0, 1)
         crit_tresh = self._stats["crit_rate"].get_value() * (1 + damage_source.crit_rate)
         crit = bool(crit_roll <= crit_tresh)\
             if not damage_source.is_crit else True
@@ -288,12 +295,12 @@ class Creature:
         dmg, pen = damage_source.get_damage()
         mitig = 1 - self.__get_armor_mitigation()
         if not damage_source.ignore_dodge:
-            roll = random.uniform(0, 1)
+            roll = RNG["combat"].uniform(0, 1)
             if roll <= self.__get_dodge_chance(damage_source.origin.stats["precision"].get_value()):
                 self.on_dodge()
                 return "Dodged !", False
         if not damage_source.ignore_block:
-            roll = random.uniform(0, 1)
+            roll = RNG["combat"].uniform(0, 1)
             if roll <= self._stats["block"].get_value():
                 self.on_block()
                 return "Blocked !", False
@@ -379,43 +386,39 @@ class Creature:
             for i, existing_aff in enumerate(self._buffs):
                 if existing_aff.name == affliction.name:
                     self._buffs[i] = affliction
+                    affliction.schedule(self.expire_affliction)
                     return
             self._buffs.append(affliction)
+        affliction.schedule(self.expire_affliction)
+        for stat_key in self.__affected_stats(affliction):
+            self._stats[stat_key].afflict(affliction)
+            self._changed.add(stat_key)
+
+    def __affected_stats(self, affliction: Affliction) -> list[str]:
+        """Returns the keys of the stats modified by an affliction."""
+        keys = []
         for flag in affliction.flags:
             stat_key = flag.value
             if stat_key in self._stats:
-                self._stats[stat_key].afflict(affliction)
-                self._changed.add(stat_key)
-            elif stat_key == "all_resistances":
-                self._stats["phys"].afflict(affliction)
-                self._stats["fire"].afflict(affliction)
-                self._stats["ice"].afflict(affliction)
-                self._stats["lightning"].afflict(affliction)
-                self._stats["energy"].afflict(affliction)
-                self._stats["light"].afflict(affliction)
-                self._stats["dark"].afflict(affliction)
-                self._changed.update({"phys", "fire", "ice", "lightning",
-                                      "energy", "light", "dark"})
-            elif stat_key == "all_damage":
-                self._stats["phys_dmg"].afflict(affliction)
-                self._stats["fire_dmg"].afflict(affliction)
-                self._stats["ice_dmg"].afflict(affliction)
-                self._stats["lightning_dmg"].afflict(affliction)
-                self._stats["energy_dmg"].afflict(affliction)
-                self._stats["light_dmg"].afflict(affliction)
-                self._stats["dark_dmg"].afflict(affliction)
-                self._changed.update({"phys_dmg", "fire_dmg", "ice_dmg", "lightning_dmg",\
-                    "energy_dmg", "light_dmg", "dark_dmg"})
-            elif stat_key == "elemental_resistances":
-                self._stats["fire"].afflict(affliction)
-                self._stats["ice"].afflict(affliction)
-                self._stats["lightning"].afflict(affliction)
-                self._changed.update({"fire", "ice", "lightning"})
-            elif stat_key == "elemental_damage":
-                self._stats["fire_dmg"].afflict(affliction)
-                self._stats["ice_dmg"].afflict(affliction)
-                self._stats["lightning_dmg"].afflict(affliction)
-                self._changed.update({"fire_dmg", "ice_dmg", "lightning_dmg"})
+                keys.append(stat_key)
+            elif stat_key in STAT_GROUPS:
+                keys.extend(STAT_GROUPS[stat_key])
+        return keys
+
+    def expire_affliction(self, affliction: Affliction):
+        """Removes an affliction that ran out from the buffs and from the\
+        stats it modifies. Called by the expiry scheduler.
+
+        Args:
+            affliction (Affliction): Expired affliction.
+        """
+        for i, buff in enumerate(self._buffs):
+            if buff is affliction:
+                self._buffs.pop(i)
+                self._changed_flags = True
+                break
+        for stat_key in self.__affected_stats(affliction):
+            self._stats[stat_key].expire(affliction)
 
     def afflict(self, affliction, is_debuff: bool = False, debuff_chance: float = 1.0):
         """Afflicts the creature with an affliction.
@@ -433,7 +436,7 @@ class Creature:
             for a in affliction:
                 if is_debuff:
                     treshold = debuff_chance - self._stats["debuff_res"].get_value()
-                    roll = random.uniform(0, 1)
+                    roll = RNG["combat"].uniform(0, 1)
                     if treshold <= 0:
                         continue
                     if roll > treshold:
@@ -442,7 +445,7 @@ class Creature:
         elif isinstance(affliction, Affliction):
             if is_debuff:
                 treshold = debuff_chance - self._stats["debuff_res"].get_value()
-                roll = random.uniform(0, 1)
+                roll = RNG["combat"].uniform(0, 1)
                 if treshold <= 0:
                     return
                 if roll > treshold:
@@ -492,25 +495,23 @@ class Creature:
         self._changed_flags = True
 
     def tick(self):
-        """Ticks down all buffs and debuffs."""
+        """Ticks the ressources and the damage over time. Buffs and debuffs\
+        are removed by the expiry scheduler when they run out."""
+        for name in ("life", "mana"):
+            ressource = self._stats[name]
+            if ressource.has_modifier:
+                ressource.tick()
         i = len(self._buffs) - 1
-        for stat in self._stats:
-            stat_obj = self._stats[stat]
-            if stat_obj.has_modifier:
-                stat_obj.tick()
         while i >= 0:
             buff = self._buffs[i]
-            buff.tick()
-            if buff.expired:
-                self._buffs.pop(i)
-                self._changed_flags = True
-            elif buff.damage is not None:
+            if buff.damage is not None:
+                buff.tick()
                 dt = buff.dot_amount
                 for _ in range(dt):
                     dmg, crit = self.damage(buff.damage)
                     if self._origin is not None:
-                        x = random.randint(int(self._origin.x), int(self._origin.right))
-                        y = random.randint(int(self._origin.y), int(self._origin.bottom))
+                        x = RNG["visual"].randint(int(self._origin.x), int(self._origin.right))
+                        y = RNG["visual"].randint(int(self._origin.y), int(self._origin.bottom))
                         SYSTEM["text_generator"].generate_damage_text(x, y, buff.dot_color,
                                                                       crit, dmg)
             i -= 1
@@ -881,6 +882,8 @@ class Creature:
     @buffs.setter
     def buffs(self, value):
         self._buffs = value
+        for buff in value:
+            buff.schedule(self.expire_affliction)
 
     @property
     def gear(self):
@@ -33,10 +33,15 @@ class DeltaTime():
         """Stops the given timer."""
         self._timers.pop(ref, None)
 
-    def tick(self):
-        """Ticks down every timers."""
+    def tick(self, elapsed: float = None):
+        """Ticks down every timers.
+
+        Args:
+            elapsed (float, optional): Time to tick down in miliseconds.\
+            Defaults to None, using the real time since the last tick.
+        """
         now = time.perf_counter()
-        delta = (now - self._last_tick) * 1000
+        delta = (now - self._last_tick) * 1000 if elapsed is None else elapsed
         self._last_tick = now
         expired = []
         for timer in self._timers.values():
@@ -48,6 +53,7 @@ class DeltaTime():
                     timer.loop -= 1
                     if timer.loop <= 0:
                         expired.append(timer.ref)
+                        break
         for ref in expired:
             self._timers.pop(ref, None)
 
@@ -64,3 +70,70 @@ class DeltaTime():
     def clear(self):
         """Clears all events."""
         self._events.clear()
+
+
+class FixedStep():
+    """Accumulates the real time elapsed between frames and turns it into
+    a number of fixed simulation steps, so the game runs at the same speed
+    whatever the frame rate.
+
+    Args:
+        step (float, optional): Duration in seconds of a simulation step.\
+        Defaults to 0.016, the step every tick function is written for.
+        max_steps (int, optional): Maximum amount of steps run for a single\
+        frame. Time above it is dropped, so a long hitch slows the game down\
+        for a moment instead of stalling it with catch up steps. Defaults to 5.
+    """
+    __slots__ = '_step', '_max_steps', '_accumulator', '_last_tick', '_steps', '_dropped'
+    def __init__(self, step: float = 0.016, max_steps: int = 5):
+        self._step = step
+        self._max_steps = max_steps
+        self._accumulator = 0.0
+        self._last_tick = time.perf_counter()
+        self._steps = 0
+        self._dropped = 0.0
+
+    def advance(self, elapsed: float = None) -> int:
+        """Adds the time elapsed since the last call to the accumulator.
+
+        Args:
+            elapsed (float, optional): Time to add in seconds. Defaults to\
+            None, measuring the real time since the last call.
+
+        Returns:
+            int: The amount of simulation steps to run this frame.
+        """
+        now = time.perf_counter()
+        if elapsed is None:
+            elapsed = now - self._last_tick
+        self._last_tick = now
+        self._accumulator += elapsed
+        steps = int(self._accumulator // self._step)
+        if steps > self._max_steps:
+            self._dropped += (steps - self._max_steps) * self._step
+            steps = self._max_steps
+        self._accumulator -= steps * self._step
+        if self._accumulator >= self._step:
+            self._accumulator %= self._step
+        self._steps += steps
+        return steps
+
+    def reset(self):
+        """Empties the accumulator, after a pause or a loading."""
+        self._accumulator = 0.0
+        self._last_tick = time.perf_counter()
+
+    @property
+    def step(self) -> float:
+        """Returns the duration of a simulation step."""
+        return self._step
+
+    @property
+    def steps(self) -> int:
+        """Returns the total amount of steps run."""
+        return self._steps
+
+    @property
+    def dropped(self) -> float:
+        """Returns the simulated time dropped by the steps clamp, in seconds."""
+        return self._dropped
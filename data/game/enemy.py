@@ -3,14 +3,12 @@ the player can fight in the world. They are a creature,
 and also an entity.
 They can move toward the player, or fire projectiles."""
 
-import random
-import numpy
-
 from data.physics.entity import Entity
 from data.game.creature import Creature
 from data.constants import Flags, POWER_UP_TRACKER, SYSTEM, SCREEN_HEIGHT, SCREEN_WIDTH
 from data.game.pickup import PickUp
 from data.components.spells.spell import Spell
+from data.numerics.rng import RNG
 
 VALUE_GROUPS = [5000, 2500, 1000, 500, 250, 100, 50, 20, 5, 1]
 
@@ -47,6 +45,7 @@ class Enemy():
         self._delay = delay
         self._attacking = False
         self._attack_delay = 0
+        self._steering = None
 
     def explode(self):
         """Explodes the creature in loot, life and mana orbs,
@@ -58,8 +57,8 @@ class Enemy():
         pickups.extend([(d, "life") for d in loot["life"]])
         pickups.extend([(d, "mana") for d in loot["mana"]])
         for pickup, types in pickups:
-            x = self.x + numpy.random.randint(-20, 20)
-            y = self.y + numpy.random.randint(-20, 20)
+            x = self.x + RNG["loot"].integers(-20, 20)
+            y = self.y + RNG["loot"].integers(-20, 20)
             match types:
                 case "rune":
                     pu = PickUp(x, y, pickup, flags=[Flags.RUNE])
@@ -79,14 +78,14 @@ class Enemy():
         gold_left = int(loot["gold"])
         for value in VALUE_GROUPS:
             while gold_left >= value:
-                x = self.x + numpy.random.randint(-20, 20)
-                y = self.y + numpy.random.randint(-20, 20)
+                x = self.x + RNG["loot"].integers(-20, 20)
+                y = self.y + RNG["loot"].integers(-20, 20)
                 pu = PickUp(x, y, value, flags=[Flags.GOLD], speed_mod=2.5)
                 POWER_UP_TRACKER.append(pu)
                 gold_left -= value
         for l in loot["items"]:
-            x = self.x + numpy.random.randint(-20, 20)
-            y = self.y + numpy.random.randint(-20, 20)
+            x = self.x + RNG["loot"].integers(-20, 20)
+            y = self.y + RNG["loot"].integers(-20, 20)
             pu = PickUp(x, y, 1, flags=[Flags.ITEM], contained=l)
             POWER_UP_TRACKER.append(pu)
             if l in ALREADY:
@@ -192,6 +191,8 @@ class Enemy():
                 if self.distance_to_player(player) < 10000:
                     self._stopped = True
                     self._counter = 0
+                elif self._steering is not None and (self._steering[0] or self._steering[1]):
+                    self._entity.follow(self._steering)
                 else:
                     self._entity.move((player.x, player.y))
         if Flags.SHOOTER in self._behaviours:
@@ -202,8 +203,8 @@ class Enemy():
         if Flags.RANDOM_MOVE in self._behaviours:
             if self._counter >= self._timer:
                 self.attack()
-                self._destination = [numpy.random.randint(SCREEN_WIDTH - 400, SCREEN_WIDTH),\
-                                     numpy.random.randint(100, SCREEN_HEIGHT - 400)]
+                self._destination = [RNG["combat"].integers(SCREEN_WIDTH - 400, SCREEN_WIDTH),\
+                                     RNG["combat"].integers(100, SCREEN_HEIGHT - 400)]
             else:
                 self._entity.move(self._destination)
         if self._counter >= self._timer:
@@ -211,7 +212,7 @@ class Enemy():
 
     def attack(self):
         """Launches a random attack from the enemy's arsenal."""
-        choice = random.uniform(0, sum(weight for _, weight in self._abilities))
+        choice = RNG["combat"].uniform(0, sum(weight for _, weight in self._abilities))
         cumulative = 0.0
         for ability, weight in self._abilities:
             cumulative += weight
@@ -290,6 +291,21 @@ class Enemy():
         removed."""
         return self._exploded
 
+    @property
+    def chases(self) -> bool:
+        """Returns whether or not the enemy runs after the player."""
+        return Flags.CHASER in self._behaviours or Flags.SUICIDER in self._behaviours
+
+    @property
+    def steering(self):
+        """Returns the (dx, dy) step given by the flow field, or None\
+        to walk straight toward the player."""
+        return self._steering
+
+    @steering.setter
+    def steering(self, value):
+        self._steering = value
+
     @property
     def immune(self):
         """Returns the enemy's immunity."""
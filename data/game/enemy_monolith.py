@@ -1,9 +1,8 @@
 """Special class for the Monolith Pinnacle boss."""
 
-import numpy
-
 from data.constants import SYSTEM
 from data.game.enemy import Enemy
+from data.numerics.rng import RNG
 
 LIGHTSHARD = 1
 SPEARS = 2
@@ -30,7 +29,7 @@ class Monolith(Enemy):
         Boss shoots simple abilities.
         """
         if self._subphase == 0:
-            self._subphase = numpy.random.randint(1, 4)
+            self._subphase = RNG["combat"].integers(1, 4)
         if self._counter <= 0:
             if self._subphase == LIGHTSHARD:
                 SYSTEM["spells"]["e_lightshard"].cast(self._creature, self._entity,\
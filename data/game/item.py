@@ -3,7 +3,6 @@ characters and used."""
 
 import json
 import time
-import random
 
 from data.api.surface import Surface
 
@@ -13,6 +12,7 @@ from data.image.animation import Animation
 from data.image.text import Text
 from data.numerics.double_affix import DoubleAffix
 from data.numerics.affix import Affix
+from data.numerics.rng import RNG
 
 AFF_RARITY_TABLE = {
     0: 0,
@@ -124,7 +124,7 @@ class Item():
         names_data = trad("item_names")
         match self._rarity:
             case 0:
-                prefix = random.choice(names_data["0"])
+                prefix = RNG["loot"].choice(names_data["0"])
                 self._name = f"{prefix} {self._base}"
             case 1:
                 affix = self._affixes[0]
@@ -134,8 +134,8 @@ class Item():
                 name_pool = names_data["2"]
                 key1 = self._affixes[0].flag_key
                 key2 = self._affixes[1].flag_key
-                word1 = random.choice(name_pool.get(key1, [key1]))[0]
-                word2 = random.choice(name_pool.get(key2, [key2]))[1]
+                word1 = RNG["loot"].choice(name_pool.get(key1, [key1]))[0]
+                word2 = RNG["loot"].choice(name_pool.get(key2, [key2]))[1]
                 self._name = f"{word1.capitalize()} {word2.capitalize()}"
             case _:
                 return
@@ -327,7 +327,7 @@ class Item():
         if sealed > 0:
             return False
         while True:
-            roll = random.randint(0, len(self._affixes) - 1)
+            roll = RNG["loot"].randint(0, len(self._affixes) - 1)
             if not self._affixes[roll].sealed:
                 self._affixes[roll].seal(True)
                 break
@@ -352,7 +352,7 @@ class Item():
     def rarify(self):
         """Transforms the item into a rare item."""
         self._rarity = 2
-        roll = random.randint(3 - len(self._affixes), 6)
+        roll = RNG["loot"].randint(3 - len(self._affixes), 6)
         affixes = [f.roll() for f in SYSTEM["looter"].generate_affixes(self.__get_gear_flags(),\
                                             roll, self._level, self._affixes)]
         self._affixes.extend(affixes)
@@ -373,11 +373,11 @@ class Item():
     def try_upgrade(self):
         """Attemps to make a rare item into an exalted item.
         Scours the item if it fails."""
-        roll = random.randint(0, 1)
+        roll = RNG["loot"].randint(0, 1)
         if roll == 0:
             return self.scour()
         mods = len(self._affixes)
-        roll = random.randint(7, 8)
+        roll = RNG["loot"].randint(7, 8)
         roll -= mods
         affixes = [f.roll() for f in SYSTEM["looter"].generate_affixes(self.__get_gear_flags(),\
                         roll, self._level, self._affixes)]
@@ -392,7 +392,7 @@ class Item():
         mods = self.__get_sealed_affixes()
         if mods == 6:
             return False
-        roll = random.randint(3 - mods, 6 - mods)
+        roll = RNG["loot"].randint(3 - mods, 6 - mods)
         affixes = [f.roll() for f in SYSTEM["looter"].generate_affixes(self.__get_gear_flags(),\
                         roll, self._level)]
         self._rarity = 2
@@ -403,7 +403,7 @@ class Item():
     def enchant(self):
         """Makes a blank item magic."""
         mods = len(self._affixes)
-        roll = random.randint(1, 2)
+        roll = RNG["loot"].randint(1, 2)
         roll -= mods
         if roll <= 0:
             return False #should never happen anyway
@@ -433,7 +433,7 @@ class Item():
         mods = self.__get_sealed_affixes()
         if mods == 2:
             return False
-        roll = random.randint(1, 2) - mods
+        roll = RNG["loot"].randint(1, 2) - mods
         affixes = [f.roll() for f in SYSTEM["looter"].generate_affixes(self.__get_gear_flags(),\
                         roll, self._level)]
         self._rarity = 1
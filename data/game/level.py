@@ -5,17 +5,13 @@ Only waves for now."""
 
 import time
 import threading
-import random
-import pstats
-
-import numpy as np
 
 from data.api.surface import Surface
 
 from data.game.creature import Creature
 from data.constants import ENNEMY_TRACKER, SCREEN_WIDTH, SCREEN_HEIGHT, WAVE_TIMER, SYSTEM,\
-    trad, LOADING, GAME_LEVEL, TICKER_TIMER, UPDATE_TIMER,\
-    PROJECTILE_TRACKER, POWER_UP_TRACKER, ANIMATION_TRACKER, WAVE_CHECK, Flags, RED_PURE
+    trad, LOADING, GAME_LEVEL, UPDATE_TIMER,\
+    PROJECTILE_TRACKER, POWER_UP_TRACKER, ANIMATION_TRACKER, WAVE_CHECK, Flags, RED_PURE, PROFILES
 from data.game.enemy import Enemy
 from data.game.enemy_monolith import Monolith
 from data.physics.entity import Entity
@@ -27,8 +23,9 @@ from data.game.item import Item
 from data.tables.area_table import MODIFIERS
 from data.tables.enemy_table import VOIDBOMBER, DEMONBAT, NECROMANCER, FAIRY, FAIRYFIRE, LOSTSOUL
 from data.interface.endlevel import generate_victory, generate_defeat
-from data.interface.render import render
 from data.game.map import Map
+from data.game.mapgen import MapGenerator
+from data.numerics.rng import RNG
 
 RUNE_ORDER = [0, 7, 9, 8, 6, 1, 2, 3, 5, 4]
 
@@ -65,9 +62,15 @@ def init_timers():
     """Inits Pygame's timers."""
     SYSTEM["deltatime"].start(WAVE_TIMER, 1500)
     SYSTEM["deltatime"].start(WAVE_CHECK, 400)
-    SYSTEM["deltatime"].start(TICKER_TIMER, int(0.016 * 1000))
     SYSTEM["deltatime"].start(UPDATE_TIMER, int(SYSTEM["options"]["fps"]))
 
+def export_profile():
+    """Writes the frames recorded by the profiler during the level to a CSV\
+    file, if it was enabled."""
+    path = f"{PROFILES}/level_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    if SYSTEM["profiler"].export_csv(path):
+        SYSTEM["logger"].print(f"Frame profile written to {path}")
+
 class DummyItems(Item):
     """Fake items to show in the showcase at the end of a level."""
     def __init__(self, name, image = None, quantity = 1, stolen = 0, rarity = 0):
@@ -116,8 +119,9 @@ class Level():
     def __init__(self, name: str, area_lvl:int, icon: Animation,\
                     wave_timer = 5000,
                     waves: int = 5, difficulty = 0,\
-                    flags = None, boss = None):
+                    flags = None, boss = None, seed = None):
         self._name = name
+        self._seed = RNG["spawns"].integers(0, 1 << 32) if seed is None else seed
         self._area_level = area_lvl
         self._difficulty = difficulty
         self._icon = icon
@@ -147,8 +151,9 @@ class Level():
         self._map = None
 
     def draw(self):
-        """Renders the map in background."""
-        render(self._map.draw(SYSTEM["player"].x, SYSTEM["player"].y).surface, (0, 0))
+        """Renders the map in background, on its own layer so the dirty\
+        rects can leave it out while the camera stands still."""
+        SYSTEM["layers"].extend("map", self._map.draw(SYSTEM["player"].x, SYSTEM["player"].y))
 
     def generate_modifiers(self):
         """Generates a list of modifiers for the level."""
@@ -166,7 +171,7 @@ class Level():
         options = available[:]
         for _ in range(to_pick):
             total_type_weight = sum(opt[2] for opt in options)
-            r = random.uniform(0, total_type_weight)
+            r = RNG["spawns"].uniform(0, total_type_weight)
             cum = 0.0
             picked_index = None
             for idx, opt in enumerate(options):
@@ -178,7 +183,7 @@ class Level():
                 break
             name, eligible_tiers, type_weight, type_risk = options.pop(picked_index)
             tier_total = sum(t[1] for t in eligible_tiers)
-            tr = random.uniform(0, tier_total)
+            tr = RNG["spawns"].uniform(0, tier_total)
             tcum = 0.0
             picked_tier = None
             for t in eligible_tiers:
@@ -207,19 +212,19 @@ class Level():
 
     def generate_enemy(self, reference: list, level:int):
         """Creates a single enemy."""
-        if random.random() < 0.5:
-            y_pos = random.randint(0, SCREEN_HEIGHT)
-            x_pos = random.randint(0, 1) * SCREEN_WIDTH
+        if RNG["spawns"].random() < 0.5:
+            y_pos = RNG["spawns"].randint(0, SCREEN_HEIGHT)
+            x_pos = RNG["spawns"].randint(0, 1) * SCREEN_WIDTH
         else:
-            x_pos = random.randint(0, SCREEN_WIDTH)
-            y_pos = random.randint(0, 1) * SCREEN_HEIGHT
-        x_dest = random.randint(100, 300)
+            x_pos = RNG["spawns"].randint(0, SCREEN_WIDTH)
+            y_pos = RNG["spawns"].randint(0, 1) * SCREEN_HEIGHT
+        x_dest = RNG["spawns"].randint(100, 300)
         enemy_type = reference["flags"]
         img = reference["image"]
         ent = Entity(x_pos, y_pos, img, hitbox_mod=reference["hitbox"])
-        exp_value = random.randint(int(reference["exp"]*(level + 1) *0.9),\
+        exp_value = RNG["spawns"].randint(int(reference["exp"]*(level + 1) *0.9),\
                                    int(reference["exp"]*(level + 1) * 1.1))
-        gold_value = random.randint(int(reference["gold"]*(level + 1) *0.9),\
+        gold_value = RNG["spawns"].randint(int(reference["gold"]*(level + 1) *0.9),\
                                     int(reference["gold"]*(level + 1) * 1.1))
         attack_delay = reference["delay"]
         crea = Creature(reference["name"])
@@ -236,9 +241,10 @@ class Level():
 
     def summon_wave(self, level:int, wave:int):
         """Summons a wave of monsters."""
-        min_monsters = (1 + random.randint(0, 2)) * (wave + 1)
-        max_monsters = (4 + random.randint(0, 2)) * (wave + 1)
-        monsters = round(max(random.randint(min_monsters, max_monsters + 1), 1) * self._pack_size)
+        min_monsters = (1 + RNG["spawns"].randint(0, 2)) * (wave + 1)
+        max_monsters = (4 + RNG["spawns"].randint(0, 2)) * (wave + 1)
+        monsters = round(max(RNG["spawns"].randint(min_monsters, max_monsters + 1), 1)\
+                         * self._pack_size)
         choice = [VOIDBOMBER, DEMONBAT, NECROMANCER, FAIRY, FAIRYFIRE, LOSTSOUL]
         chance = [1, 10, 12, 11, 11, 7]
         tot = sum(chance)
@@ -246,7 +252,7 @@ class Level():
         #chance = [0, 0, 0, 0, 0, 1]
         wave_data = []
         for _ in range(monsters):
-            monster = np.random.choice(choice, p=rchance)
+            monster = RNG["spawns"].choice(choice, rchance)
             mob = self.generate_enemy(monster, level)
             wave_data.append(mob)
         self._wave_tracker.append(wave_data)
@@ -270,9 +276,9 @@ class Level():
             enemy_type = self._boss["flags"]
             img = self._boss["image"]
             ent = Entity(SCREEN_WIDTH + 200, y_pos, img, hitbox_mod=self._boss["hitbox"])
-            exp_value = random.randint(int(self._boss["exp"]*(level + 1) *0.9),\
+            exp_value = RNG["spawns"].randint(int(self._boss["exp"]*(level + 1) *0.9),\
                                     int(self._boss["exp"]*(level + 1) * 1.1))
-            gold_value = random.randint(int(self._boss["gold"]*(level + 1) *0.9),\
+            gold_value = RNG["spawns"].randint(int(self._boss["gold"]*(level + 1) *0.9),\
                                         int(self._boss["gold"]*(level + 1) * 1.1))
             attack_delay = self._boss["delay"]
             crea = Creature(self._boss["name"])
@@ -309,7 +315,8 @@ class Level():
     def load_level(self):
         """Loading function of the level."""
         SYSTEM["game_state"] = LOADING
-        self._map = Map(SYSTEM["images"]["grass_tileset"], 40, 30)
+        tiles, obstacles = MapGenerator(self._seed).generate(40, 30)
+        self._map = Map(SYSTEM["images"]["grass_tileset"], 40, 30, tiles, obstacles)
         progress = 0
         if Flags.PINNACLE in self._flags:
             total, tasks = self.load_pinnacle()
@@ -324,16 +331,20 @@ class Level():
         SYSTEM["game_state"] = GAME_LEVEL
         init_timers()
         SYSTEM["deltatime"].clear()
+        SYSTEM["fixed_step"].reset()
         SYSTEM["keys"].clear()
 
     def init(self):
         """Sets up the background of the level."""
-        SYSTEM["profiler"].enable()
+        SYSTEM["profiler"].reset()
         print("###### LEVEL START #####")
         ENNEMY_TRACKER.clear()
         PROJECTILE_TRACKER.clear()
         POWER_UP_TRACKER.clear()
         ANIMATION_TRACKER.clear()
+        if SYSTEM["inputs"] is not None and SYSTEM["inputs"].deterministic:
+            self.load_level()
+            return
         loading_thread = threading.Thread(target=self.load_level)
         loading_thread.start()
 
@@ -350,9 +361,7 @@ class Level():
 
     def end_level(self):
         """End level sequence. Sets the needed flag and creates the dummy items."""
-        SYSTEM["profiler"].disable()
-        stats = pstats.Stats(SYSTEM["profiler"]).sort_stats("cumtime")
-        stats.print_stats(25)
+        export_profile()
         print("###### LEVEL END #####")
         for pick in POWER_UP_TRACKER:
             pick.pickup(SYSTEM["player"])
@@ -374,13 +383,11 @@ class Level():
     def fail_level(self, abandon = False):
         """Game over sequence. Removes half the gold gained, 10% of the player's current exp,
         and a random amount of items."""
-        SYSTEM["profiler"].disable()
-        stats = pstats.Stats(SYSTEM["profiler"]).sort_stats("cumtime")
-        stats.print_stats(25)
+        export_profile()
         print("###### LEVEL END #####")
         self._finished = True
-        failure = int(len(self._loot) * np.random.random())
-        loss = np.random.choice(len(self._loot), size=failure, replace=False).tolist()
+        failure = int(len(self._loot) * RNG["loot"].random())
+        loss = RNG["loot"].sample(range(len(self._loot)), failure)
         for i in loss:
             it = self._loot[i]
             if it in SYSTEM["player"].inventory:
@@ -399,7 +406,7 @@ class Level():
         ]
         for i in RUNE_ORDER:
             if self._runes[i] > 0:
-                runes_loss[i] = int(np.random.randint(0, self._runes[i] + 1))
+                runes_loss[i] = RNG["loot"].randint(0, self._runes[i])
                 SYSTEM["player"].runes[i] -= runes_loss[i]
                 if runes_loss[i] == self._runes[i]:
                     rune = DummyItems("stolen_rune", SYSTEM["images"]["loss"])
@@ -435,24 +442,24 @@ class Level():
             if len(ENNEMY_TRACKER) >= mx:
                 self._ready = self._ready[i:]
                 return
-            spawn_edge = random.randint(0, 3)
+            spawn_edge = RNG["spawns"].randint(0, 3)
             spawn_margin = 300
             if spawn_edge == 0:
-                spawn_x = camera_x + random.randint(0, SCREEN_WIDTH)
+                spawn_x = camera_x + RNG["spawns"].randint(0, SCREEN_WIDTH)
                 spawn_y = camera_y - spawn_margin
             elif spawn_edge == 1:
-                spawn_x = camera_x + random.randint(0, SCREEN_WIDTH)
+                spawn_x = camera_x + RNG["spawns"].randint(0, SCREEN_WIDTH)
                 spawn_y = camera_y + SCREEN_HEIGHT + spawn_margin
             elif spawn_edge == 2:
                 spawn_x = camera_x - spawn_margin
-                spawn_y = camera_y + random.randint(0, SCREEN_HEIGHT)
+                spawn_y = camera_y + RNG["spawns"].randint(0, SCREEN_HEIGHT)
             else:
                 spawn_x = camera_x + SCREEN_WIDTH + spawn_margin
-                spawn_y = camera_y + random.randint(0, SCREEN_HEIGHT)
+                spawn_y = camera_y + RNG["spawns"].randint(0, SCREEN_HEIGHT)
             e.entity.x = spawn_x
             e.entity.y = spawn_y
             e.entity.move((spawn_x, spawn_y))
-            approach_distance = random.randint(100, 300)
+            approach_distance = RNG["spawns"].randint(100, 300)
             dx = SYSTEM["player"].x - spawn_x
             dy = SYSTEM["player"].y - spawn_y
             distance = (dx**2 + dy**2)**0.5
@@ -616,3 +623,13 @@ class Level():
     def map(self) -> Map:
         """Returns the level's map."""
         return self._map
+
+    @property
+    def camera_offset(self) -> tuple[int, int]:
+        """Returns the camera offset of the level's map."""
+        return self._map.camera_offset
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the level's map."""
+        return self._seed
@@ -1,11 +1,11 @@
 """Generates random loot."""
 
-import random
 import numpy
 from data.game.item import Item
 from data.constants import SYSTEM, Flags
 from data.tables.implicits_table import IMPLICITS
 from data.tables.affix_table import get_affixes_for_slot
+from data.numerics.rng import RNG
 
 RUNE_WEIGHT = [100, 80, 70, 50, 40, 30, 25, 5, 2, 1]
 RUNES = [0, 7, 9, 8, 6, 1, 2, 3, 5, 4]
@@ -307,7 +307,7 @@ class LootGenerator():
     def pick_weighted(self, items_with_weights):
         """Picks items with the weights"""
         items, weights = zip(*items_with_weights)
-        return random.choices(items, weights=weights, k=1)[0]
+        return RNG["loot"].choice(items, weights)
 
     def weighted_sample_without_replacement(self, items_with_weights, k):
         """Manually sample k unique items by weight without replacement."""
@@ -317,7 +317,7 @@ class LootGenerator():
             if not items:
                 break
             total_weight = sum(w for _, w in items)
-            r = random.uniform(0, total_weight)
+            r = RNG["loot"].uniform(0, total_weight)
             upto = 0
             for i, (item, weight) in enumerate(items):
                 upto += weight
@@ -370,12 +370,12 @@ class LootGenerator():
             for item, lvl in types:
                 if lvl <= level:
                     choice.append(item)
-            return random.choice(choice)
+            return RNG["loot"].choice(choice)
         else:
             max_weight = 0
             for _, weight in types:
                 max_weight += float(weight)
-            roll = random.uniform(0, max_weight)
+            roll = RNG["loot"].uniform(0, max_weight)
             cress = 0
             for item, weight in types:
                 cress += float(weight)
@@ -385,25 +385,25 @@ class LootGenerator():
 
     def generate_item(self, level, rarity):
         """Generates a random armor."""
-        item_type = numpy.random.randint(0, 13)
+        item_type = RNG["loot"].integers(0, 13)
         if item_type == 11 or item_type == 12:
-            rarity = numpy.random.randint(0, 2)
+            rarity = RNG["loot"].integers(0, 2)
         match rarity:
             case 1:
                 if item_type == 10:
                     affx = 1
                 else:
-                    affx = numpy.random.randint(1, 3)
+                    affx = RNG["loot"].integers(1, 3)
             case 2:
                 if item_type == 10:
                     affx = 2
                 else:
-                    affx = numpy.random.randint(3, 6)
+                    affx = RNG["loot"].integers(3, 6)
             case 3:
                 if item_type == 10:
-                    affx = numpy.random.randint(3, 4)
+                    affx = RNG["loot"].integers(3, 4)
                 else:
-                    affx = numpy.random.randint(7, 9)
+                    affx = RNG["loot"].integers(7, 9)
             case _:
                 affx = 0
         match item_type:
@@ -462,28 +462,28 @@ class LootGenerator():
         rare_sum = sum(adjusted_rare)
         rune_sum = sum(adjusted_rune)
         rarity = enemy.tier
-        amount = max(rarity * numpy.random.randint(-2, 6) *\
+        amount = max(rarity * RNG["loot"].integers(-2, 6) *\
                 (SYSTEM["player"].creature.stats["item_quant"].c_value +\
                 enemy.creature.stats["item_quant"].c_value), 0)
         while amount > 0:
-            choice = numpy.random.choice(LOOT_VALUES, p=[d / loot_sum for d in adjusted_loot])
+            choice = RNG["loot"].choice(LOOT_VALUES, [d / loot_sum for d in adjusted_loot])
             match choice:
                 case "item":
-                    roll = int(numpy.random.choice(RARITIES,
-                                                   p=[d / rare_sum for d in adjusted_rare]))
-                    level = round(enemy.creature.level * (0.7 + numpy.random.rand()))
+                    roll = int(RNG["loot"].choice(RARITIES,
+                                                   [d / rare_sum for d in adjusted_rare]))
+                    level = round(enemy.creature.level * (0.7 + RNG["loot"].random()))
                     loot["items"].add(self.generate_item(level, roll))
                 case "mana":
-                    roll = numpy.random.randint(1, 6)
+                    roll = RNG["loot"].integers(1, 6)
                     loot["mana"].append(roll)
                 case "life":
-                    roll = numpy.random.randint(1, 6)
+                    roll = RNG["loot"].integers(1, 6)
                     loot["life"].append(roll)
                 case "rune":
-                    roll = numpy.random.choice(RUNES, p=[d / rune_sum for d in adjusted_rune])
+                    roll = RNG["loot"].choice(RUNES, [d / rune_sum for d in adjusted_rune])
                     loot["runes"].append(roll)
                 case _: #gold
-                    gold = enemy.gold_value * (0.7 + numpy.random.rand()) *\
+                    gold = enemy.gold_value * (0.7 + RNG["loot"].random()) *\
                         (SYSTEM["player"].creature.stats["item_quant"].c_value +\
                         enemy.creature.stats["item_quant"].c_value)
                     loot["gold"] += gold
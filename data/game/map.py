@@ -1,4 +1,12 @@
-"""A game map can contains obstacle. It replaces parallaxes as the levels background."""
+"""A game map can contains obstacle. It replaces parallaxes as the levels background.
+
+The tiles are stored as a grid of tile ids, and the map is only rendered
+in chunks of tiles when the camera gets close to them. The rendered chunks
+are kept in a LRU, so memory does not depend on the size of the map."""
+
+from collections import OrderedDict
+
+import numpy as np
 
 from data.constants import SCREEN_HEIGHT, SCREEN_WIDTH
 
@@ -7,47 +15,165 @@ from data.image.tileset import Tileset
 
 class Map():
     """Defines a map.
-    
+
     Args:
         tileset (Tileset): Which tileset to use for the map.
         width (int): Amount of horizontal tiles in the map.
         height (int): Amount of vertical tiles in the map.
+        tiles (np.ndarray, optional): Grid of tile ids of shape (height, width).\
+        A tile id is the index of the tile in the tileset, read line by line.\
+        Defaults to None, filling the map with the first tile.
+        obstacles (np.ndarray, optional): Boolean grid of the same shape,\
+        `True` where a tile blocks movement. Defaults to None (no obstacle).
+        chunk_size (int, optional): Amount of tiles per side of a chunk.\
+        Defaults to 8.
+        max_chunks (int, optional): Amount of rendered chunks to keep.\
+        Defaults to 48, about twice what a 1920x1080 screen shows with\
+        64 pixels tiles.
     """
-    __slots__ = ('_tileset', '_width', '_height', '_max_x', '_max_y', '_surface', '_camera_x',
-                 '_camera_y', "_cached_cuts")
-    def __init__(self, tileset: Tileset, width: int, height: int):
+    __slots__ = ('_tileset', '_width', '_height', '_max_x', '_max_y', '_camera_x',
+                 '_camera_y', '_tiles', '_chunk_size', '_chunk_w', '_chunk_h', '_chunks',
+                 '_max_chunks', '_obstacles', '_has_obstacles')
+    def __init__(self, tileset: Tileset, width: int, height: int, tiles: np.ndarray = None,
+                 obstacles: np.ndarray = None, chunk_size: int = 8, max_chunks: int = 48):
         self._tileset = tileset
         self._width = width
         self._height = height
         self._max_x = tileset.width * width
         self._max_y = tileset.height * height
-        self._surface = Surface(self._max_x, self._max_y)
         self._camera_x = 0
         self._camera_y = 0
-        self._cached_cuts = {}
-        for y in range(height):
-            for x in range(width):
-                tile = tileset.get_at(0, 0) #TODO: Replace with a real map generation algorithm ...
-                if tile is not None:
-                    self._surface.blit(tile.image, (tileset.width * x, tileset.height * y))
-
-    def draw(self, x, y) -> Surface:
-        """Draws the map using the x.y pos as a camera."""
-        if (x, y) not in self._cached_cuts:
-            w = SCREEN_WIDTH
-            h = SCREEN_HEIGHT
-            x = min(max(0, x - w // 2), self._max_x - SCREEN_WIDTH)
-            y = min(max(0, y - h // 2), self._max_y - SCREEN_HEIGHT)
-            self._camera_x = x
-            self._camera_y = y
-            self._cached_cuts[(x, y)] = self._surface.subsurface((x, y, w, h))
-        return self._cached_cuts[(x, y)]
+        if tiles is None:
+            tiles = np.zeros((height, width), dtype=np.uint16)
+        elif tiles.shape != (height, width):
+            raise ValueError(f"Tile grid of shape {tiles.shape} for a {width}x{height} map.")
+        self._tiles = tiles.astype(np.uint16, copy=False)
+        if obstacles is None:
+            obstacles = np.zeros((height, width), dtype=bool)
+        elif obstacles.shape != (height, width):
+            raise ValueError(f"Obstacle grid of shape {obstacles.shape} for a {width}x{height} map.")
+        self._obstacles = obstacles.astype(bool, copy=False)
+        self._has_obstacles = bool(self._obstacles.any())
+        self._chunk_size = chunk_size
+        self._chunk_w = tileset.width * chunk_size
+        self._chunk_h = tileset.height * chunk_size
+        self._chunks = OrderedDict()
+        self._max_chunks = max_chunks
+
+    def _render_chunk(self, cx: int, cy: int) -> Surface:
+        """Renders the tiles of a chunk on a new surface."""
+        tileset = self._tileset
+        size = self._chunk_size
+        x_start = cx * size
+        y_start = cy * size
+        block = self._tiles[y_start:y_start + size, x_start:x_start + size]
+        surface = Surface(self._chunk_w, self._chunk_h)
+        columns = tileset.columns
+        batch = []
+        for (y, x), tile_id in np.ndenumerate(block):
+            tile = tileset.get_at(int(tile_id) % columns, int(tile_id) // columns)
+            if tile is not None:
+                batch.append((tile.image.surface, (x * tileset.width, y * tileset.height)))
+        surface.surface.blits(batch, doreturn=False)
+        return surface
+
+    def get_chunk(self, cx: int, cy: int) -> Surface:
+        """Returns the surface of a chunk, rendering it if it is not in the LRU.
+
+        Args:
+            cx (int): Horizontal index of the chunk.
+            cy (int): Vertical index of the chunk.
+        """
+        key = (cx, cy)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        chunk = self._render_chunk(cx, cy)
+        self._chunks[key] = chunk
+        while len(self._chunks) > self._max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def set_tile(self, x: int, y: int, tile_id: int):
+        """Changes a tile of the map. Its chunk is rendered again when next drawn."""
+        self._tiles[y, x] = tile_id
+        self._chunks.pop((x // self._chunk_size, y // self._chunk_size), None)
+
+    def is_blocked(self, x: float, y: float) -> bool:
+        """Returns whether or not the world position x.y is on an obstacle.
+        Positions outside of the map are blocked."""
+        tile_x = int(x // self._tileset.width)
+        tile_y = int(y // self._tileset.height)
+        if not (0 <= tile_x < self._width and 0 <= tile_y < self._height):
+            return True
+        return bool(self._obstacles[tile_y, tile_x])
+
+    def move_camera(self, x, y) -> tuple[int, int]:
+        """Centers the camera on the x.y pos, clamped to the borders of the map.
+
+        Returns:
+            tuple[int, int]: The new camera offset.
+        """
+        self._camera_x = max(0, min(int(x) - SCREEN_WIDTH // 2, self._max_x - SCREEN_WIDTH))
+        self._camera_y = max(0, min(int(y) - SCREEN_HEIGHT // 2, self._max_y - SCREEN_HEIGHT))
+        return (self._camera_x, self._camera_y)
+
+    def draw(self, x, y) -> list[tuple]:
+        """Draws the map using the x.y pos as a camera.
+
+        Returns:
+            list[tuple]: The (surface, position) of the visible chunks,\
+            in screen coordinates.
+        """
+        camera_x, camera_y = self.move_camera(x, y)
+        chunk_w = self._chunk_w
+        chunk_h = self._chunk_h
+        last_x = (min(camera_x + SCREEN_WIDTH, self._max_x) - 1) // chunk_w
+        last_y = (min(camera_y + SCREEN_HEIGHT, self._max_y) - 1) // chunk_h
+        return [(self.get_chunk(cx, cy).surface, (cx * chunk_w - camera_x, cy * chunk_h - camera_y))
+                for cy in range(camera_y // chunk_h, last_y + 1)
+                for cx in range(camera_x // chunk_w, last_x + 1)]
+
+    def clear(self):
+        """Forgets every rendered chunk."""
+        self._chunks.clear()
 
     @property
     def camera_offset(self):
         """Returns the current camera offset (world position of top-left corner of screen)."""
         return (self._camera_x, self._camera_y)
 
+    @property
+    def tiles(self) -> np.ndarray:
+        """Returns the grid of tile ids."""
+        return self._tiles
+
+    @property
+    def obstacles(self) -> np.ndarray:
+        """Returns the grid of obstacles, `True` where a tile blocks movement."""
+        return self._obstacles
+
+    @property
+    def has_obstacles(self) -> bool:
+        """Returns whether or not any tile blocks movement."""
+        return self._has_obstacles
+
+    @property
+    def tile_size(self) -> tuple[int, int]:
+        """Returns the size in pixels of a tile."""
+        return (self._tileset.width, self._tileset.height)
+
+    @property
+    def chunks(self) -> int:
+        """Returns the amount of rendered chunks in memory."""
+        return len(self._chunks)
+
+    @property
+    def chunk_size(self) -> int:
+        """Returns the amount of tiles per side of a chunk."""
+        return self._chunk_size
+
     @property
     def width(self):
         """Returns the map's width."""
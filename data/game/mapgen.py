@@ -0,0 +1,95 @@
+"""Procedural generation of the level maps. Layers of value noise decide
+where the water, dirt and grass go; everything is done on whole NumPy
+arrays so a map is generated in a few milliseconds on the loading thread."""
+
+import numpy as np
+
+class MapGenerator():
+    """Generates the tile grid and the obstacle bitmap of a map.
+    Tile ids are indexes in the island tileset (9 tiles per line).
+
+    Args:
+        seed (int): Seed of the generation. The same seed always gives\
+        the same map.
+        water (float, optional): Share of the map covered by water.\
+        Defaults to 0.12.
+        dirt (float, optional): Share of the map covered by dirt patches.\
+        Defaults to 0.1.
+        scale (int, optional): Size in tiles of the noise features.\
+        Defaults to 12.
+    """
+    GRASS = (0, 1, 2, 3, 9, 11, 18, 19, 20)
+    GRASS_DARK = 10
+    DIRT = 6
+    WATER = (64, 65, 66, 67)
+    WATER_DECORATIONS = (49, 50, 59, 60)
+    __slots__ = '_seed', '_water', '_dirt', '_scale'
+    def __init__(self, seed: int, water: float = 0.12, dirt: float = 0.1, scale: int = 12):
+        self._seed = seed
+        self._water = water
+        self._dirt = dirt
+        self._scale = scale
+
+    @staticmethod
+    def noise(rng: np.random.Generator, width: int, height: int, scale: int) -> np.ndarray:
+        """Returns a (height, width) grid of smooth value noise in [0, 1].
+
+        Args:
+            rng (np.random.Generator): Source of the random lattice.
+            width (int): Width of the grid.
+            height (int): Height of the grid.
+            scale (int): Distance in cells between two lattice points.
+        """
+        lattice = rng.random((height // scale + 2, width // scale + 2), dtype=np.float32)
+        ys = np.arange(height, dtype=np.float32) / scale
+        xs = np.arange(width, dtype=np.float32) / scale
+        y0 = ys.astype(np.int32)
+        x0 = xs.astype(np.int32)
+        ty = ys - y0
+        tx = xs - x0
+        ty = (ty * ty * (3 - 2 * ty))[:, None]
+        tx = (tx * tx * (3 - 2 * tx))[None, :]
+        top = lattice[y0][:, x0] * (1 - tx) + lattice[y0][:, x0 + 1] * tx
+        bottom = lattice[y0 + 1][:, x0] * (1 - tx) + lattice[y0 + 1][:, x0 + 1] * tx
+        return top * (1 - ty) + bottom * ty
+
+    def fractal(self, rng: np.random.Generator, width: int, height: int) -> np.ndarray:
+        """Returns two octaves of noise, normalized in [0, 1]."""
+        grid = self.noise(rng, width, height, self._scale)
+        grid += 0.5 * self.noise(rng, width, height, max(1, self._scale // 3))
+        return grid / 1.5
+
+    def generate(self, width: int, height: int) -> tuple[np.ndarray, np.ndarray]:
+        """Generates a map.
+
+        Args:
+            width (int): Amount of horizontal tiles.
+            height (int): Amount of vertical tiles.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The (height, width) uint16 tile ids,\
+            and the boolean obstacle bitmap of the same shape.
+        """
+        rng = np.random.default_rng(self._seed)
+        elevation = self.fractal(rng, width, height)
+        paths = self.fractal(rng, width, height)
+        details = rng.random((height, width), dtype=np.float32)
+        variants = rng.integers(0, 1 << 16, (height, width), dtype=np.uint32)
+
+        grass = np.array(self.GRASS, dtype=np.uint16)
+        tiles = grass[variants % len(grass)]
+        tiles[details < 0.02] = self.GRASS_DARK
+        dirt = paths > np.quantile(paths, 1 - self._dirt)
+        tiles[dirt] = self.DIRT
+        obstacles = elevation < np.quantile(elevation, self._water)
+        water = np.array(self.WATER, dtype=np.uint16)
+        tiles[obstacles] = water[variants[obstacles] % len(water)]
+        decorated = obstacles & (details > 0.97)
+        decorations = np.array(self.WATER_DECORATIONS, dtype=np.uint16)
+        tiles[decorated] = decorations[variants[decorated] % len(decorations)]
+        return tiles, obstacles
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the generator."""
+        return self._seed
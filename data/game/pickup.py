@@ -1,6 +1,5 @@
 """A pick up is something the player can gather by touching it"""
 
-import random
 import math
 
 from data.api.vec2d import Vec2
@@ -8,6 +7,7 @@ from data.api.vec2d import Vec2
 from data.physics.hitbox import HitBox
 from data.image.text import Text
 from data.constants import Flags, TEXT_TRACKER, SYSTEM, BLUE_ALT, GREEN_WEAK
+from data.numerics.rng import RNG
 
 COLORS = [
     (128, 128, 128),
@@ -39,8 +39,8 @@ class PickUp(HitBox):
         self._arrival_threshold = 10
         self._arrival_threshold_sq = 100
         self._delay = 30
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 4) * speed_mod
+        angle = RNG["loot"].uniform(0, 2 * math.pi)
+        speed = RNG["loot"].uniform(2, 4) * speed_mod
         self._velocity = Vec2(math.cos(angle), math.sin(angle)) * speed
         self._contains = contained
         self._cached_image = None
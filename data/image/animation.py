@@ -173,6 +173,27 @@ class Animation():
         ani.frame_max = self._frame_max
         return ani
 
+    def copy(self, frames: list = None):
+        """Returns a copy of the animation made from its current frames,\
+        without reading the file again. The frames are copied in memory,\
+        so transforming the copy does not alter the original.
+
+        Args:
+            frames (list, optional): Images to use as the frames of the copy\
+            instead. Defaults to None.
+        """
+        ani = Animation.__new__(Animation)
+        for slot in Animation.__slots__:
+            setattr(ani, slot, getattr(self, slot))
+        if frames is None:
+            frames = [Image(frame.image) for frame in self._sequence]
+        ani._sequence = frames
+        ani._current_frame = 0
+        ani._finished = False
+        ani._width = frames[0].width
+        ani._height = frames[0].height
+        return ani
+
     def export(self) -> str:
         """Serializes the animation as JSON."""
         data = {
@@ -216,6 +237,11 @@ class Animation():
         """Returns the image."""
         return self.get_image()
 
+    @property
+    def frames(self) -> list:
+        """Returns the images of the sequence."""
+        return self._sequence
+
     @property
     def width(self):
         """Returns the sequence's frame width."""
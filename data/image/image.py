@@ -2,7 +2,7 @@
 
 from data.api.surface import Surface, Widget
 
-from data.constants import RESSOURCES
+from data.caching.image_registry import IMAGE_REGISTRY
 
 class Image(Widget):
     """Defines an image. If the URI does not points
@@ -31,11 +31,11 @@ class Image(Widget):
             h = self._image.get_height()
         else:
             try:
-                self._image = Surface.load(f"{RESSOURCES}/{uri}")
+                self._image = Surface.from_existing(IMAGE_REGISTRY.load(uri).copy())
             except FileNotFoundError:
                 print(f"Couldn't find file {uri}. Using default image.")
                 self._uri = "default.png"
-                self._image = Surface.load(f"{RESSOURCES}/default.png")
+                self._image = Surface.from_existing(IMAGE_REGISTRY.load("default.png").copy())
             w = self._image.get_width()
             h = self._image.get_height()
         super().__init__(0, 0, w, h)
@@ -119,11 +119,24 @@ class Image(Widget):
         return self
 
     def clone(self):
-        """Returns a deep copy of the image."""
-        return Image(self._uri)\
-            .flip(self._flipped[0], self._flipped[1])\
-            .rotate(self._rotated)\
-            .scale(self._scaled[0], self._scaled[1], self._scaled[2])
+        """Returns a deep copy of the image. The file is never read again:
+        the transformed surface is taken from the image registry when the
+        same transformations were already replayed once."""
+        key = (self._uri, self._flipped, self._rotated, self._scaled)
+        cached = IMAGE_REGISTRY.get(key)
+        if cached is None:
+            image = Image(self._uri)\
+                .flip(self._flipped[0], self._flipped[1])\
+                .rotate(self._rotated)\
+                .scale(self._scaled[0], self._scaled[1], self._scaled[2])
+            IMAGE_REGISTRY.put(key, image.image.surface.copy())
+            return image
+        image = Image(Surface.from_existing(cached))
+        image._uri = self._uri
+        image._flipped = self._flipped
+        image._rotated = self._rotated
+        image._scaled = self._scaled
+        return image
 
     @property
     def image(self) -> Surface:
@@ -1,10 +1,11 @@
 """Handles image post treatment."""
 
-import numpy
+from data.api.surface import Surface, flip, update
+from data.api.governor import GOVERNOR
 
-from data.api.surface import Surface, flip
-
-from data.constants import SYSTEM, SCREEN_WIDTH, ANIMATION_TICK_TRACKER, SCREEN_HEIGHT
+from data.constants import SYSTEM, SCREEN_WIDTH, ANIMATION_TICK_TRACKER, SCREEN_HEIGHT, GAME_LEVEL
+from data.interface.render import DIRTY_REGIONS
+from data.numerics.rng import RNG
 
 class PostEffects():
     """Handle whole screen effects."""
@@ -59,26 +60,51 @@ class PostEffects():
         self._flash_color = list(color)
 
     def tick(self):
-        """Applies the effects."""
+        """Applies the effects. The wait for the frame cap is left out of the\
+        profiler's scope."""
+        profiler = SYSTEM["profiler"]
+        profiler.begin("post_effects")
         for f in ANIMATION_TICK_TRACKER:
             f. tick()
         if self._pause > 0:
             self._pause -= 1
         if self._shaking and self._simple_shaking:
             if self._max_x > 0:
-                self._shake_x = numpy.random.randint(-self._max_x, self._max_x)
+                self._shake_x = RNG["visual"].integers(-self._max_x, self._max_x)
             if self._max_y > 0:
-                self._shake_y = numpy.random. randint(-self._max_y, self._max_y)
+                self._shake_y = RNG["visual"].integers(-self._max_y, self._max_y)
             self._timer -= 1
             if self._timer <= 0:
                 self. stop_shaking()
+        profiler.end("post_effects")
+        if SYSTEM["headless"]:
+            SYSTEM["clock"].tick()
+            return
         SYSTEM["clock"].tick(SYSTEM["options"]["fps"])
+        profiler.begin("post_effects")
+        self.present()
+        profiler.end("post_effects")
+
+    def present(self):
+        """Shows the composed frame on the display."""
+        if not SYSTEM["options"]["adaptive_quality"]:
+            if GOVERNOR.level:
+                GOVERNOR.reset()
+        elif SYSTEM["game_state"] == GAME_LEVEL:
+            GOVERNOR.update(SYSTEM["clock"], SYSTEM["options"]["fps"])
         SYSTEM["text_generator"].generate_fps()
         current_res = SYSTEM["real_windows"].get_size()
         expected_res = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        rects = DIRTY_REGIONS.rects
+        if rects is not None and current_res == expected_res and self._flash_timer <= 0:
+            windows = SYSTEM["windows"].surface
+            real_windows = SYSTEM["real_windows"].surface
+            for rect in rects:
+                real_windows.blit(windows, rect, rect)
+            update(rects)
+            return
         if current_res != expected_res:
-            scaled = SYSTEM["windows"].scale(expected_res)
-            SYSTEM["real_windows"]. blit(scaled, (0, 0))
+            self.present_scaled(current_res)
         else:
             SYSTEM["real_windows"].blit(SYSTEM["windows"], (0, 0))
         if self._flash_timer > 0:
@@ -87,6 +113,21 @@ class PostEffects():
             SYSTEM["real_windows"].fill(self._flash_color + [self._flash_opacity])
         flip()
 
+    def present_scaled(self, resolution: tuple[int, int]):
+        """Scales the composed frame into a display of another resolution.
+        The display is written to directly when it shares the frame's pixel
+        format, otherwise through a destination allocated once per resolution.
+        The frame itself is never modified."""
+        windows = SYSTEM["windows"]
+        real_windows = SYSTEM["real_windows"]
+        if real_windows.get_bitsize() == windows.get_bitsize():
+            windows.scale_into(real_windows)
+            return
+        if self._cached_resolution != resolution:
+            self._scaled_cache = Surface(resolution[0], resolution[1], is_alpha=False)
+            self._cached_resolution = resolution
+        real_windows.blit(windows.scale_into(self._scaled_cache), (0, 0))
+
     @property
     def pause(self):
         """Returns the processor's pause status."""
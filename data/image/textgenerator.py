@@ -2,6 +2,7 @@
 
 from functools import lru_cache
 from data.constants import TEXT_TRACKER, SYSTEM, WHITE, LEVEL_COLOR
+from data.api.governor import GOVERNOR
 from data.image.text import Text
 
 @lru_cache(maxsize=64)
@@ -13,6 +14,8 @@ class TextGenerator():
     """Generator of text."""
     def generate_damage_text(self, x, y, color, crit, dmg):
         """Shows a damage pop up."""
+        if not GOVERNOR.allow_damage_text(crit):
+            return
         if not isinstance(color, tuple):
             color = (255, 255, 255)
         if crit:
@@ -39,6 +39,16 @@ class Tileset():
             tile.scale(self._frame_y, self._frame_x)
         return self
 
+    @property
+    def columns(self):
+        """Returns the amount of tiles per line of the tileset."""
+        return self._max_x
+
+    @property
+    def rows(self):
+        """Returns the amount of lines of tiles of the tileset."""
+        return self._max_y
+
     @property
     def width(self):
         """Returns the tileset's tile width."""
@@ -8,7 +8,7 @@ from data.api.keycodes import KEY_EVENT, K_1, K_2
 
 from data.image.text import Text
 from data.constants import SYSTEM, SCREEN_HEIGHT, SCREEN_WIDTH, trad, ENNEMY_TRACKER, \
-    RED_WEAK, YELLOW, ORANGE, GREEN_TRANSP
+    RED_WEAK, YELLOW, ORANGE, GREEN_TRANSP, GREEN, RED, WHITE
 from data.image.textgenerator import make_text
 
 UI_SKILLS_OFFSET = 408
@@ -20,6 +20,11 @@ POTION_OFFSET_REV = SCREEN_WIDTH - POTION_OFFSET - 64
 
 UPDATE_COUNTER = [5]
 
+PROFILER_BAR = 200
+PROFILER_ROW = 24
+PROFILER_REFRESH = 30
+PROFILER_PANEL = [None, PROFILER_REFRESH]
+
 _UI_CACHE = {
     'last_life': None,
     'last_mana': None,
@@ -404,6 +409,60 @@ def draw_enemy_card():
             i += 1
     return data
 
+def draw_metrics() -> list[str]:
+    """Returns the lines showing the last sampled metrics."""
+    values = SYSTEM["metrics"].values
+    if "rss" not in values:
+        return []
+    return [
+        f"memory: {values['rss']:.0f} MB, transform cache: {values.get('trans_cache', 0):.1f} MB",
+        f"projectiles: {values.get('projectiles', 0)}, enemies: {values.get('enemies', 0)}, "
+        f"power ups: {values.get('power_ups', 0)}",
+        f"texts: {values.get('texts', 0)}, animations: {values.get('animations', 0)}, "
+        f"particles: {values.get('particles', 0)}"
+    ]
+
+def build_profiler() -> Surface:
+    """Builds the panel of the frame profiler: the green bar is the median\
+    time of a scope, the yellow one the 95th percentile and the red tick\
+    the maximum, against the frame budget."""
+    summary = SYSTEM["profiler"].summary()
+    metrics = draw_metrics()
+    scale = PROFILER_BAR * (SYSTEM["options"]["fps"] or 60) / 1000
+    panel = Surface(PROFILER_BAR + 340, PROFILER_ROW * (len(summary) + len(metrics)) + 10)
+    panel.fill((0, 0, 0, 160))
+    for i, (name, (p50, p95, peak)) in enumerate(summary.items()):
+        y = 5 + i * PROFILER_ROW
+        panel.draw_rect(YELLOW, (5, y + 4, min(p95 * scale, PROFILER_BAR), PROFILER_ROW - 8))
+        panel.draw_rect(GREEN, (5, y + 4, min(p50 * scale, PROFILER_BAR), PROFILER_ROW - 8))
+        x = 5 + min(peak * scale, PROFILER_BAR)
+        panel.draw_line(RED, (x, y + 2), (x, y + PROFILER_ROW - 2), 2)
+        label = Text(f"{name}: {p50:.2f} / {p95:.2f} / {peak:.2f} ms", size=16,
+                     font="item_desc")
+        panel.blit(label.surface, (PROFILER_BAR + 15, y + 2))
+    bars = PROFILER_ROW * len(summary) + 5
+    panel.draw_line(WHITE, (5 + PROFILER_BAR, 0), (5 + PROFILER_BAR, bars), 1)
+    for i, line in enumerate(metrics):
+        label = Text(line, size=16, font="item_desc")
+        panel.blit(label.surface, (5, bars + 2 + i * PROFILER_ROW))
+    return panel
+
+def draw_profiler():
+    """Draws the panel of the frame profiler on the debug layer. The panel\
+    is only built again every `PROFILER_REFRESH` frames, and is called out\
+    of the profiled scopes so it does not measure itself."""
+    layers = SYSTEM["layers"]
+    layers.clear("debug")
+    if not SYSTEM["options"]["profiler"] or not SYSTEM["profiler"].scopes:
+        PROFILER_PANEL[0] = None
+        PROFILER_PANEL[1] = PROFILER_REFRESH
+        return
+    PROFILER_PANEL[1] += 1
+    if PROFILER_PANEL[0] is None or PROFILER_PANEL[1] >= PROFILER_REFRESH:
+        PROFILER_PANEL[0] = build_profiler()
+        PROFILER_PANEL[1] = 0
+    layers.push("debug", PROFILER_PANEL[0], (10, 10))
+
 def draw_ui():
     """Draws the user interface."""
     SYSTEM["images"]["enemy_card"].tick()
@@ -418,8 +477,9 @@ def draw_ui():
     to_draw.extend(draw_buffs())
     to_draw.extend(draw_enemy_card())
     to_draw.extend(draw_boss())
-    SYSTEM["layers"]["ui"].clear()
-    SYSTEM["layers"]["ui"].extend(SYSTEM["ui_background"])
-    SYSTEM["layers"]["ui"].extend(to_draw)
-    SYSTEM["layers"]["ui"].extend(SYSTEM["ui_foreground"])
-    SYSTEM["layers"]["ui"].extend(draw_text())
+    layers = SYSTEM["layers"]
+    layers.clear("ui")
+    layers.extend("ui", SYSTEM["ui_background"])
+    layers.extend("ui", to_draw)
+    layers.extend("ui", SYSTEM["ui_foreground"])
+    layers.extend("ui", draw_text())
@@ -3,6 +3,7 @@
 from functools import lru_cache
 
 from data.api.surface import Surface
+from data.api.governor import GOVERNOR
 
 from data.constants import SYSTEM, SCREEN_HEIGHT, POWER_UP_TRACKER, ENNEMY_TRACKER,\
     PROJECTILE_TRACKER, TEXT_TRACKER, trad,\
@@ -12,8 +13,10 @@ from data.constants import SYSTEM, SCREEN_HEIGHT, POWER_UP_TRACKER, ENNEMY_TRACK
 from data.image.tabs import Tabs
 from data.components.projectiles.projectile import Projectile
 from data.components.slashes.slash import Slash
+from data.numerics.expiry import EXPIRY
 
 CULL_MARGIN = 200
+DAMAGE_COLOR = (255, 30, 30)
 
 def setup_bottom_bar():
     """Sets up the bottom bar."""
@@ -83,39 +86,36 @@ def draw_game(show_player = True, show_enemies = True,\
               show_loot = True, show_projectiles = True,\
               show_text = True, show_animations = True):
     """Draws the main game component"""
-    show_hitboxes = SYSTEM["options"]["show_hitboxes"]
+    show_hitboxes = SYSTEM["options"]["show_hitboxes"] and GOVERNOR.hitboxes
+    show_buffs = GOVERNOR.buff_animations
     show_bars = SYSTEM["options"]["show_bars"]
     camera_x, camera_y = SYSTEM["level"].camera_offset if SYSTEM["level"] is not None else (0, 0)
 
+    layers = SYSTEM["layers"]
     if show_player or show_enemies or show_animations:
-        chars_layer = SYSTEM["layers"]["characters"]
-        chars_layer.clear()
+        layers.clear("characters")
     if show_loot:
-        pickup_layer = SYSTEM["layers"]["pickup"]
-        pickup_layer.clear()
+        layers.clear("pickup")
     if show_projectiles:
-        bullets_layer = SYSTEM["layers"]["bullets"]
-        warnings_layer = SYSTEM["layers"]["warnings"]
-        bullets_layer.clear()
-        warnings_layer.clear()
+        layers.clear("bullets")
+        layers.clear("warnings")
     if show_text:
-        texts_layer = SYSTEM["layers"]["texts"]
-        texts_layer.clear()
+        layers.clear("texts")
 
     if show_player:
         if show_hitboxes:
             x, y, w, h = SYSTEM["player"].entity.hitbox.get_rect()
             screen_rect = (x - camera_x, y - camera_y, w, h)
-            chars_layer.append(draw_hitbox(screen_rect, GREEN_TRANSP, GREEN_PURE))
+            layers.push("characters", *draw_hitbox(screen_rect, GREEN_TRANSP, GREEN_PURE))
         px, py, _, _ = SYSTEM["player"].get_pos()
-        chars_layer.append((SYSTEM["player"].get_image(), (px - camera_x, py - camera_y)))
-        for buff in SYSTEM["player"].creature.buffs:
+        layers.push("characters", SYSTEM["player"].get_image(), (px - camera_x, py - camera_y))
+        for buff in (SYSTEM["player"].creature.buffs if show_buffs else ()):
             if f"buffanim_{buff.name}" in SYSTEM["images"]:
                 buff_anim = SYSTEM["images"][f"buffanim_{buff.name}"]
                 buff_anim.tick()
-                chars_layer.append((buff_anim.get_image(),\
+                layers.push("characters", buff_anim.get_image(),\
                     (SYSTEM["player"].entity.center_x - camera_x - buff_anim.width // 2,\
-                     SYSTEM["player"].entity.center_y - camera_y - buff_anim.height // 2)))
+                     SYSTEM["player"].entity.center_y - camera_y - buff_anim.height // 2))
     if show_loot:
         loot_count = len(POWER_UP_TRACKER)
         if loot_count > 0:
@@ -125,12 +125,12 @@ def draw_game(show_player = True, show_enemies = True,\
                     continue
                 if show_hitboxes:
                     loot_rect = b.hitbox.get_rect()
-                    pickup_layer.append(draw_hitbox((loot_rect[0] - camera_x, loot_rect[1] -
-                                                     camera_y, loot_rect[2], loot_rect[3]),
-                                                     BLUE_TRANSP, BLUE_PURE))
+                    layers.push("pickup", *draw_hitbox((loot_rect[0] - camera_x, loot_rect[1] -
+                                                        camera_y, loot_rect[2], loot_rect[3]),
+                                                        BLUE_TRANSP, BLUE_PURE))
                 loot_blits.append((b.get_image(), (b.x - camera_x, b.y - camera_y)))
             if loot_blits:
-                pickup_layer.extend(loot_blits)
+                layers.extend("pickup", loot_blits)
     if show_enemies:
         enemy_count = len(ENNEMY_TRACKER)
         if enemy_count > 0:
@@ -143,9 +143,10 @@ def draw_game(show_player = True, show_enemies = True,\
                                    camera_x, camera_y):
                     continue
                 if show_hitboxes:
-                    chars_layer.append(draw_hitbox((enemy_rect[0] - camera_x, enemy_rect[1] -
-                                                    camera_y, enemy_rect[2], enemy_rect[3]),
-                                                    RED_TRANSP, RED_PURE))
+                    layers.push("characters", *draw_hitbox((enemy_rect[0] - camera_x,
+                                                            enemy_rect[1] - camera_y,
+                                                            enemy_rect[2], enemy_rect[3]),
+                                                            RED_TRANSP, RED_PURE))
                 if show_bars:
                     bar_x = b.entity.center_x - camera_x - 50
                     bar_y = b.y - camera_y - 25
@@ -160,7 +161,7 @@ def draw_game(show_player = True, show_enemies = True,\
                 enemy_pos = b.get_pos()
                 enemy_blits.append((b.get_image(), (enemy_pos[0] - camera_x,
                                                     enemy_pos[1] - camera_y)))
-                for buff in b.creature.buffs:
+                for buff in (b.creature.buffs if show_buffs else ()):
                     if f"buffanim_{buff.name}" in SYSTEM["images"]:
                         buff_anim = SYSTEM["images"][f"buffanim_{buff.name}"]
                         buff_anim.tick()
@@ -168,7 +169,7 @@ def draw_game(show_player = True, show_enemies = True,\
                             (b.entity.center_x - camera_x - buff_anim.width // 2,\
                              b.entity.center_y - camera_y - buff_anim.height // 2)))
             if enemy_blits:
-                chars_layer.extend(enemy_blits)
+                layers.extend("characters", enemy_blits)
     if show_animations:
         anim_count = len(ANIMATION_TRACKER)
         if anim_count > 0:
@@ -178,7 +179,7 @@ def draw_game(show_player = True, show_enemies = True,\
                     continue
                 anim_blits.append((p[0].get_image(), (p[1] - camera_x, p[2] - camera_y)))
             if anim_blits:
-                chars_layer.extend(anim_blits)
+                layers.extend("characters", anim_blits)
     if show_projectiles:
         proj_count = len(PROJECTILE_TRACKER)
         if proj_count > 0:
@@ -189,16 +190,17 @@ def draw_game(show_player = True, show_enemies = True,\
                 if show_hitboxes:
                     if p.effective:
                         proj_rect = p.hitbox.get_rect()
-                        bullets_layer.append(draw_hitbox((proj_rect[0] - camera_x, proj_rect[1] -
-                                                          camera_y, proj_rect[2], proj_rect[3]),
-                                                          BLUE_TRANSP, BLUE_PURE))
+                        layers.push("bullets", *draw_hitbox((proj_rect[0] - camera_x,
+                                                             proj_rect[1] - camera_y,
+                                                             proj_rect[2], proj_rect[3]),
+                                                             BLUE_TRANSP, BLUE_PURE))
                 if p.warning is not None:
                     warning_points = [(pt[0] - camera_x, pt[1] - camera_y) for pt in p.warning[0]]
                     draw_warning(warning_points, RED_WARNING, p.warning[1])
                 if hasattr(p, 'get_image'):
                     proj_blits.append((p.get_image(), (p.x - camera_x, p.y - camera_y)))
             if proj_blits:
-                bullets_layer.extend(proj_blits)
+                layers.extend("bullets", proj_blits)
     if show_text:
         text_count = len(TEXT_TRACKER)
         if text_count > 0:
@@ -206,11 +208,32 @@ def draw_game(show_player = True, show_enemies = True,\
             for t in TEXT_TRACKER:
                 text_blits.append((t[0].image, (t[1] - camera_x, t[2] - camera_y)))
             if text_blits:
-                texts_layer.extend(text_blits)
+                layers.extend("texts", text_blits)
 
-def logic_tick():
-    """Ticks all there is to tick"""
+def steer_enemies():
+    """Points the chasing enemies along the flow field toward the player.
+    The field is only used on maps with obstacles; elsewhere they keep
+    walking straight at the player."""
+    chasers = [enemy for enemy in ENNEMY_TRACKER if enemy.chases]
+    if not chasers:
+        return
+    level_map = SYSTEM["level"].map if SYSTEM["level"] is not None else None
+    if level_map is None or not level_map.has_obstacles:
+        for enemy in chasers:
+            enemy.steering = None
+        return
+    field = SYSTEM["flow_field"]
+    field.update(level_map.obstacles, level_map.tile_size, SYSTEM["player"].entity.center)
+    steps = field.sample_many([enemy.entity.center for enemy in chasers])
+    for enemy, step in zip(chasers, steps.tolist()):
+        enemy.steering = step
+
+def tick_player():
+    """Ticks the player."""
     SYSTEM["player"].tick()
+
+def tick_pickups():
+    """Ticks the pickups, removing the collected ones."""
     i = len(POWER_UP_TRACKER) - 1
     while i >= 0:
         bubble = POWER_UP_TRACKER[i]
@@ -218,6 +241,9 @@ def logic_tick():
         if bubble.flagged_for_deletion:
             POWER_UP_TRACKER.pop(i)
         i -= 1
+
+def tick_enemies():
+    """Ticks the enemies, removing the destroyed ones."""
     i = len(ENNEMY_TRACKER) - 1
     while i >= 0:
         baddie = ENNEMY_TRACKER[i]
@@ -226,6 +252,9 @@ def logic_tick():
             ENNEMY_TRACKER.pop(i)
             baddie.entity.real_image = None
         i -= 1
+
+def tick_animations():
+    """Ticks the animations, removing the finished ones."""
     i = len(ANIMATION_TRACKER) - 1
     while i >= 0:
         p = ANIMATION_TRACKER[i]
@@ -233,6 +262,9 @@ def logic_tick():
         if p[0].finished:
             ANIMATION_TRACKER.pop(i)
         i -= 1
+
+def tick_projectiles():
+    """Ticks the projectiles and slashes, removing the finished ones."""
     i = len(PROJECTILE_TRACKER) - 1
     while i >= 0:
         p = PROJECTILE_TRACKER[i]
@@ -242,6 +274,9 @@ def logic_tick():
             PROJECTILE_TRACKER.pop(i)
             del p
         i -= 1
+
+def tick_texts():
+    """Fades the floating texts, removing the faded ones."""
     i = len(TEXT_TRACKER) - 1
     while i >= 0:
         txt = TEXT_TRACKER[i]
@@ -252,3 +287,75 @@ def logic_tick():
         if txt[3] < 10:
             TEXT_TRACKER.pop(i)
         i -= 1
+
+def tick_particles():
+    """Moves the particles and fades the lightning arcs by one step."""
+    SYSTEM["particle_emitter"].tick(SYSTEM["fixed_step"].step)
+
+LOGIC_SYSTEMS = (
+    ("afflictions", EXPIRY.advance),
+    ("player", tick_player),
+    ("steering", steer_enemies),
+    ("pickups", tick_pickups),
+    ("enemies", tick_enemies),
+    ("animations", tick_animations),
+    ("projectiles", tick_projectiles),
+    ("texts", tick_texts),
+    ("particles", tick_particles)
+)
+
+def logic_tick():
+    """Ticks all there is to tick"""
+    for _, system in LOGIC_SYSTEMS:
+        system()
+
+def check_collisions():
+    """Checks all collisions."""
+    grid = SYSTEM["collision_grid"]
+    grid.rebuild(ENNEMY_TRACKER, [enemy.entity.hitbox for enemy in ENNEMY_TRACKER])
+    for proj in PROJECTILE_TRACKER:
+        if proj.ignore_team or proj.evil: #check for player
+            if proj.hitbox.is_colliding(SYSTEM["player"].entity.hitbox):
+                if proj in SYSTEM["player"].immune:
+                    continue
+                if isinstance(proj, Projectile) and proj.effective:
+                    dmg, crit = proj.on_hit(SYSTEM["player"].creature, SYSTEM["player"].entity)
+                    if dmg is None or crit is None:
+                        continue
+                    SYSTEM["text_generator"].generate_damage_text(SYSTEM["player"].x,\
+                                                                  SYSTEM["player"].y,\
+                                                                DAMAGE_COLOR, crit, dmg)
+                    if proj.can_be_destroyed():
+                        continue
+                elif isinstance(proj, Slash) and proj.effective:
+                    dmg, crit = proj.on_hit(SYSTEM["player"].creature, SYSTEM["player"].entity)
+                    if dmg is None or crit is None:
+                        continue
+                    SYSTEM["text_generator"].generate_damage_text(SYSTEM["player"].x,\
+                                                                  SYSTEM["player"].y,\
+                                                                DAMAGE_COLOR, crit, dmg)
+                    if proj.finished:
+                        continue
+        elif proj.ignore_team or not proj.evil: #Check for each enemy
+            for enemy in grid.query(proj.hitbox):
+                if proj.hitbox.is_colliding(enemy.entity.hitbox):
+                    if proj in enemy.immune:
+                        continue
+                    if isinstance(proj, Projectile) and proj.effective:
+                        dmg, crit = proj.on_hit(enemy.creature, enemy.entity)
+                        if dmg is None or crit is None:
+                            continue
+                        SYSTEM["text_generator"].generate_damage_text(enemy.x,\
+                                                                    enemy.y,\
+                                                                    DAMAGE_COLOR, crit, dmg)
+                        if proj.can_be_destroyed():
+                            continue
+                    elif isinstance(proj, Slash) and proj.effective:
+                        dmg, crit = proj.on_hit(enemy.creature, enemy.entity)
+                        if dmg is None or crit is None:
+                            continue
+                        SYSTEM["text_generator"].generate_damage_text(enemy.x,\
+                                                                    enemy.y,\
+                                                                    DAMAGE_COLOR, crit, dmg)
+                        if proj.finished:
+                            continue
@@ -49,6 +49,14 @@ def open_option_screen():
     SYSTEM["ui"]["drop_fps"] = DropDown("fps",\
         [f"{str(fps)}" for fps in SYSTEM["options"]["fps_display"]],\
         SYSTEM["options"]["fps_selector"], "fps_temp", default_fps)
+    default_scale = 0
+    for k in SYSTEM["options"]["render_scales"]:
+        if k == SYSTEM["options"]["render_scale"]:
+            break
+        default_scale += 1
+    SYSTEM["ui"]["drop_scale"] = DropDown("render_scale",\
+        [f"{scale}%" for scale in SYSTEM["options"]["render_scales"]],\
+        SYSTEM["options"]["render_scales"], "render_scale_temp", default_scale)
     SYSTEM["ui"]["box_fullscreen"] = Checkbox("fullscreen", SYSTEM["images"]["checkbox"],\
         SYSTEM["images"]["checkbox_ok"], "fullscreen")
     SYSTEM["ui"]["box_vsync"] = Checkbox("vsync", SYSTEM["images"]["checkbox"],\
@@ -69,6 +77,8 @@ def open_option_screen():
         SYSTEM["images"]["checkbox_ok"], "display_exp")
     SYSTEM["ui"]["box_cd"] = Checkbox("display_cd", SYSTEM["images"]["checkbox"],\
         SYSTEM["images"]["checkbox_ok"], "display_cd")
+    SYSTEM["ui"]["box_profiler"] = Checkbox("profiler", SYSTEM["images"]["checkbox"],\
+        SYSTEM["images"]["checkbox_ok"], "profiler")
 
 def unloader():
     """Unloads all option-specific data."""
@@ -86,9 +96,11 @@ def draw_options(_):
     SYSTEM["ui"]["box_hp"].set(10, 640).tick().draw()
     SYSTEM["ui"]["box_exp"].set(10, 730).tick().draw()
     SYSTEM["ui"]["box_cd"].set(10, 820).tick().draw()
+    SYSTEM["ui"]["box_profiler"].set(1650, 10).tick().draw()
     SYSTEM["ui"]["drop_resolution"].set(450, 10).tick().draw()
     SYSTEM["ui"]["drop_fps"].set(750, 10).tick().draw()
     SYSTEM["ui"]["drop_lang"].set(1050, 10).tick().draw()
+    SYSTEM["ui"]["drop_scale"].set(1350, 10).tick().draw()
     SYSTEM["ui"]["button_validate"].set(10, 900).tick().draw()
     SYSTEM["ui"]["button_cancel"].set(10, 950).tick().draw()
     SYSTEM["ui"]["button_save"].set(300, 850).tick().draw()
@@ -1,17 +1,406 @@
 """"Renders the screen."""
 
+from collections import OrderedDict
+
+from pygame import Rect, transform
+
 from data.constants import SYSTEM, SCREEN_HEIGHT, SCREEN_WIDTH, GAME_LEVEL, MENU_INVENTORY, LOADING\
     , BLACK_TRANSP
+from data.api.surface import Surface
+
+SCREEN_RECT = Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+class RenderQueue():
+    """Buffers the blits of a frame in named layers, drawn by increasing z.
+    Sources are unwrapped to raw pygame surfaces as they are pushed, so each
+    layer is handed to pygame as is, in a single blits call.
+
+    Args:
+        layers (dict[str, int]): The z of each layer.
+    """
+    __slots__ = '_layers', '_z', '_order', '_counts'
+    def __init__(self, layers: dict[str, int]):
+        self._layers = {}
+        self._z = {}
+        self._order = ()
+        self._counts = {}
+        for name, z in layers.items():
+            self.add_layer(name, z)
+
+    def add_layer(self, name: str, z: int):
+        """Adds a layer, or moves an existing one to another z."""
+        if name not in self._layers:
+            self._layers[name] = []
+            self._counts[name] = 0
+        self._z[name] = z
+        self._order = tuple(sorted(self._z, key=self._z.get))
+
+    def push(self, name: str, source, dest, area=None):
+        """Adds a blit to a layer.
+
+        Args:
+            name (str): Name of the layer.
+            source (Surface | pygame.Surface): Image to draw.
+            dest (tuple): x;y position on the screen.
+            area (tuple, optional): Part of the source to draw. Defaults to None.
+        """
+        if isinstance(source, Surface):
+            source = source.surface
+        if area is None:
+            self._layers[name].append((source, dest))
+        else:
+            self._layers[name].append((source, dest, area))
+
+    def extend(self, name: str, items):
+        """Adds (source, dest[, area]) blits to a layer."""
+        self._layers[name].extend([(item[0].surface,) + tuple(item[1:])
+                                   if isinstance(item[0], Surface) else item
+                                   for item in items])
+
+    def clear(self, name: str = None):
+        """Empties a layer, or all of them."""
+        if name is None:
+            for layer in self._layers.values():
+                layer.clear()
+        else:
+            self._layers[name].clear()
+
+    def blits(self, names=None) -> list:
+        """Returns the blits of the given layers (all by default), in z order."""
+        return [item for name in self._order if names is None or name in names
+                for item in self._layers[name]]
+
+    def submit(self, target, names=None):
+        """Draws the given layers (all by default) in z order.
+
+        Args:
+            target (Surface | pygame.Surface): Surface to draw on.
+            names (tuple[str], optional): Layers to draw. Defaults to None.
+        """
+        if isinstance(target, Surface):
+            target = target.surface
+        counts = self._counts
+        for name in self._order:
+            layer = self._layers[name]
+            if names is not None and name not in names:
+                counts[name] = 0
+                continue
+            counts[name] = len(layer)
+            if layer:
+                target.blits(layer, doreturn=False)
+
+    def submit_scaled(self, target, world, names, scaler: "ScaledBlits", camera):
+        """Draws the world layers among the given ones into a reduced\
+        surface, at the render scale of the camera, scales that surface up\
+        once into the target, then draws the other layers over it at the\
+        resolution of the target. Each pass keeps the z order.
+
+        Args:
+            target (Surface | pygame.Surface): Surface to draw on.
+            world (Surface | pygame.Surface): Reduced surface the world\
+            layers are drawn into.
+            names (tuple[str]): Layers to draw.
+            scaler (ScaledBlits): Scales the blits of the world layers.
+            camera (Camera): Camera giving the render scale.
+        """
+        if isinstance(target, Surface):
+            target = target.surface
+        if isinstance(world, Surface):
+            world = world.surface
+        counts = self._counts
+        for name in self._order:
+            layer = self._layers[name]
+            counts[name] = len(layer) if name in names else 0
+            if layer and name in names and name in scaler.layers:
+                world.blits(scaler.scale(layer, camera, name in scaler.volatile),
+                            doreturn=False)
+        transform.scale(world, target.get_size(), target)
+        for name in self._order:
+            layer = self._layers[name]
+            if layer and name in names and name not in scaler.layers:
+                target.blits(layer, doreturn=False)
+
+    def __getitem__(self, name: str) -> list:
+        return self._layers[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._layers
+
+    @property
+    def order(self) -> tuple[str]:
+        """Returns the names of the layers, by increasing z."""
+        return self._order
+
+    @property
+    def counts(self) -> dict[str, int]:
+        """Returns the amount of blits of each layer during the last submit."""
+        return self._counts
+
+RENDER_QUEUE = RenderQueue({
+    "background": 0,
+    "map": 5,
+    "screen": 10,
+    "overlay": 20,
+    "pickup": 30,
+    "warnings": 40,
+    "bullets": 50,
+    "characters": 60,
+    "texts": 70,
+    "particles": 80,
+    "ui": 90,
+    "debug": 95,
+    "effects": 100
+})
+FRAME_LAYERS = ("background", "map", "screen", "overlay", "particles", "effects")
+LEVEL_LAYERS = tuple(RENDER_QUEUE.order)
+INVENTORY_LAYERS = ("background", "map", "screen", "pickup", "effects")
+MENU_LAYERS = ("background", "map", "screen", "effects")
+STATIC_LAYERS = ("background", "map")
+SCREEN_LAYERS = ("screen", "ui", "debug", "effects")
+WORLD_LAYERS = tuple(name for name in LEVEL_LAYERS if name not in SCREEN_LAYERS)
+VOLATILE_LAYERS = ("overlay", "particles")
+
+class ScaledBlits():
+    """Scales the blits of the world layers for the reduced render target.
+    The scaled copy of a source is kept, the least recently used ones being
+    released past the budget, so an animation frame or a map chunk is only
+    scaled once. Sources redrawn every frame, such as the overlays, are
+    scaled again each time.
+
+    Args:
+        layers (tuple[str]): Layers drawn at the render scale.
+        volatile (tuple[str]): Layers whose sources change every frame.
+        max_bytes (int, optional): Memory budget of the scaled copies.\
+        Defaults to 32 MB.
+    """
+    __slots__ = '_layers', '_volatile', '_copies', '_bytes', '_max_bytes', '_scale'
+    def __init__(self, layers: tuple[str], volatile: tuple[str],
+                 max_bytes: int = 32 * 1024 * 1024):
+        self._layers = layers
+        self._volatile = volatile
+        self._copies = OrderedDict()
+        self._bytes = 0
+        self._max_bytes = max_bytes
+        self._scale = None
+
+    @staticmethod
+    def _shrink(source, area, scale: float):
+        """Returns the part of a source scaled down, and the offset of the\
+        part in the source area."""
+        offset = (0, 0)
+        if area is not None:
+            area = Rect(area)
+            part = area.clip(source.get_rect())
+            if not part:
+                return None, offset
+            offset = (part.x - area.x, part.y - area.y)
+            source = source.subsurface(part)
+        width, height = source.get_size()
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        return transform.scale(source, size), offset
+
+    def scale(self, blits: list, camera, volatile: bool = False) -> list:
+        """Returns the blits scaled to the render scale of the camera.
 
-RENDER_LIST = []
+        Args:
+            blits (list): (source, dest[, area]) items in screen coordinates.
+            camera (Camera): Camera giving the render scale.
+            volatile (bool, optional): Whether the sources change every\
+            frame, and must not be kept. Defaults to False.
+        """
+        scale = camera.render_scale
+        if scale != self._scale:
+            self.clear()
+            self._scale = scale
+        scaled = []
+        for item in blits:
+            source = item[0]
+            area = item[2] if len(item) > 2 else None
+            key = (id(source), None if area is None else tuple(area))
+            entry = None if volatile else self._copies.get(key)
+            if entry is None:
+                entry = (source,) + self._shrink(source, area, scale)
+                if entry[1] is None:
+                    continue
+                if not volatile:
+                    self._store(key, entry)
+            else:
+                self._copies.move_to_end(key)
+            _, copy, offset = entry
+            if copy.get_alpha() != source.get_alpha():
+                copy.set_alpha(source.get_alpha())
+            scaled.append((copy, camera.screen_to_render(item[1][0] + offset[0],
+                                                         item[1][1] + offset[1])))
+        return scaled
 
-def render(image, pos, world_space=False):
+    def _store(self, key: tuple, entry: tuple):
+        """Keeps a scaled copy, releasing the least recently used ones past\
+        the budget. The source is kept with it so its id is not reused."""
+        copy = entry[1]
+        self._copies[key] = entry
+        self._bytes += copy.get_width() * copy.get_height() * copy.get_bytesize()
+        while self._bytes > self._max_bytes and len(self._copies) > 1:
+            _, (_, old, _) = self._copies.popitem(last=False)
+            self._bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+
+    def clear(self):
+        """Releases every scaled copy."""
+        self._copies.clear()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._copies)
+
+    @property
+    def layers(self) -> tuple[str]:
+        """Returns the layers drawn at the render scale."""
+        return self._layers
+
+    @property
+    def volatile(self) -> tuple[str]:
+        """Returns the layers whose sources change every frame."""
+        return self._volatile
+
+    @property
+    def bytes(self) -> int:
+        """Returns the memory used by the scaled copies."""
+        return self._bytes
+
+SCALED_BLITS = ScaledBlits(WORLD_LAYERS, VOLATILE_LAYERS)
+
+def world_target(scale: int) -> Surface:
+    """Returns the persistent surface the world is drawn into at a render\
+    scale, allocated again only when the scale changes.
+
+    Args:
+        scale (int): Render scale, in percent of the screen resolution.
+    """
+    size = (max(1, SCREEN_WIDTH * scale // 100), max(1, SCREEN_HEIGHT * scale // 100))
+    if SYSTEM["world"] is None or SYSTEM["world"].get_size() != size:
+        SYSTEM["world"] = Surface(size[0], size[1], is_alpha=False)
+    return SYSTEM["world"]
+
+class DirtyRegions():
+    """Tracks the parts of the screen that have to be drawn again. A part
+    is dirty if something was drawn on it during this frame or the previous
+    one, so that moved images are erased from where they were.
+
+    Static layers, such as the map, cover the whole screen but do not\
+    change while the camera stands still: they are left out of the dirty\
+    rects and only force a full frame when their blits change.
+
+    Args:
+        threshold (float, optional): Share of the screen above which the\
+        whole frame is redrawn instead. Defaults to 0.5.
+        max_rects (int, optional): Amount of rects above which they are\
+        merged in a single bounding box. Defaults to 32.
+    """
+    __slots__ = '_previous', '_rects', '_threshold', '_max_rects', '_full_frames', \
+                '_partial_frames', '_static'
+    def __init__(self, threshold: float = 0.5, max_rects: int = 32):
+        self._previous = None
+        self._static = None
+        self._rects = None
+        self._threshold = threshold
+        self._max_rects = max_rects
+        self._full_frames = 0
+        self._partial_frames = 0
+
+    @staticmethod
+    def bounds(blits) -> list[Rect]:
+        """Returns the screen rects covered by (source, dest[, area]) items."""
+        rects = []
+        for item in blits:
+            if len(item) > 2 and item[2] is not None:
+                width, height = item[2][2], item[2][3]
+            else:
+                width, height = item[0].get_size()
+            rects.append(Rect(item[1][0], item[1][1], width, height))
+        return rects
+
+    def compute(self, blits, static=None) -> list[Rect] | None:
+        """Computes the dirty rects of a frame.
+
+        Args:
+            blits (list): (source, dest[, area]) items drawn this frame,\
+            except the static ones they are drawn over.
+            static (list, optional): (source, dest[, area]) items of the\
+            static layers. The whole frame is redrawn when they differ\
+            from the previous frame's. Defaults to None.
+
+        Returns:
+            list[Rect] | None: The rects to redraw, or None if the whole\
+            frame has to be redrawn.
+        """
+        current = self.bounds(blits)
+        previous = self._previous
+        self._previous = current
+        static = [(item[0], tuple(item[1])) + tuple(item[2:]) for item in static or ()]
+        moved = static != self._static
+        self._static = static
+        if previous is None or moved:
+            self._full_frames += 1
+            self._rects = None
+            return None
+        merged = []
+        area = 0
+        for rect in previous + current:
+            rect = rect.clip(SCREEN_RECT)
+            if not rect:
+                continue
+            for other in merged:
+                if other.colliderect(rect):
+                    area -= other.w * other.h
+                    other.union_ip(rect)
+                    area += other.w * other.h
+                    break
+            else:
+                merged.append(rect)
+                area += rect.w * rect.h
+        if len(merged) > self._max_rects:
+            merged = [merged[0].unionall(merged[1:])]
+            area = merged[0].w * merged[0].h
+        if area > self._threshold * SCREEN_WIDTH * SCREEN_HEIGHT:
+            self._full_frames += 1
+            self._rects = None
+            return None
+        self._partial_frames += 1
+        self._rects = merged
+        return merged
+
+    def invalidate(self):
+        """Forces a full frame. The next frame is compared to nothing, so\
+        it is a full frame as well."""
+        self._previous = None
+        self._static = None
+        self._rects = None
+        self._full_frames += 1
+
+    @property
+    def rects(self) -> list[Rect] | None:
+        """Returns the rects of the last frame, None if it was a full frame."""
+        return self._rects
+
+    @property
+    def full_frames(self) -> int:
+        """Returns the amount of frames drawn entirely."""
+        return self._full_frames
+
+    @property
+    def partial_frames(self) -> int:
+        """Returns the amount of frames drawn through dirty rects."""
+        return self._partial_frames
+
+DIRTY_REGIONS = DirtyRegions()
+
+def render(image, pos, world_space=False, area=None):
     """Prepares the image to be rendered at position pos.
     
     Args:
         image: The image to render
         pos: (x, y) position
         world_space: If True, pos is in world coordinates. If False, screen coordinates.
+        area: Optional (x, y, width, height) part of the image to render.
     """
     if world_space:
         camera = SYSTEM["camera"]
@@ -23,48 +412,76 @@ def render(image, pos, world_space=False):
         return
     if y < -200 or y > SCREEN_HEIGHT + 200:
         return
-    RENDER_LIST.append((image, screen_pos))
+    RENDER_QUEUE.push("screen", image, screen_pos, area)
 
 def renders(lst):
     """Prepares a list of tuple (image:pos) to be rendered."""
-    RENDER_LIST.extend(lst)
+    RENDER_QUEUE.extend("screen", lst)
+
+def submit_frame(queue: RenderQueue, layers: tuple[str], shake: tuple):
+    """Draws the layers of a frame at the screen resolution, through the\
+    dirty rects when they are enabled and the screen is still."""
+    rects = None
+    if SYSTEM["options"]["dirty_rects"] and shake == (0, 0) and \
+        SYSTEM["post_effects"].flash_timer <= 0:
+        rects = DIRTY_REGIONS.compute(
+            queue.blits([name for name in layers if name not in STATIC_LAYERS]),
+            queue.blits(STATIC_LAYERS))
+    else:
+        DIRTY_REGIONS.invalidate()
+    if rects is None:
+        queue.submit(SYSTEM["windows"], layers)
+    else:
+        windows = SYSTEM["windows"].surface
+        for rect in rects:
+            windows.set_clip(rect)
+            queue.submit(windows, layers)
+        windows.set_clip(None)
 
 def render_all():
     """Renders the screen."""
     game_state = SYSTEM["game_state"]
+    queue = RENDER_QUEUE
     if game_state == LOADING:
+        DIRTY_REGIONS.invalidate()
         SYSTEM["windows"].fill(BLACK_TRANSP)
-        if RENDER_LIST:
-            SYSTEM["windows"].blits(RENDER_LIST)
-            RENDER_LIST.clear()
+        queue.submit(SYSTEM["windows"], ("screen",))
     else:
-        all_blits = []
         shake = SYSTEM["post_effects"].shake_factor
-        all_blits.append((SYSTEM["gm_background"], shake))
-        if RENDER_LIST:
-            all_blits.extend(RENDER_LIST)
-            RENDER_LIST.clear()
+        queue.push("background", SYSTEM["gm_background"], shake)
         if game_state == GAME_LEVEL:
-            SYSTEM["particles"].fill(BLACK_TRANSP)
+            layers = LEVEL_LAYERS
+            SYSTEM["particles"].clear(BLACK_TRANSP)
             SYSTEM["images"]["life_orb"].tick()
             SYSTEM["images"]["mana_orb"].tick()
             SYSTEM["images"]["exp_orb"].tick()
-            all_blits.append((SYSTEM["warnings"], shake))
-            for name, layer in SYSTEM["layers"].items():
-                if name == "ui":
-                    if SYSTEM["particle_emitter"] and SYSTEM["options"]["particles_enabled"]:
-                        SYSTEM["particle_emitter"].enabled = SYSTEM["options"]["particles_enabled"]
-                        SYSTEM["particle_emitter"].draw(SYSTEM["particles"])
-                        all_blits.append((SYSTEM["particles"], (0, 0)))
-                all_blits.extend(layer)
+            warnings = SYSTEM["warnings"].blit_item(shake)
+            if warnings is not None:
+                queue["overlay"].append(warnings)
+            if SYSTEM["particle_emitter"] and SYSTEM["options"]["particles_enabled"]:
+                SYSTEM["particle_emitter"].enabled = SYSTEM["options"]["particles_enabled"]
+                SYSTEM["particle_emitter"].draw(SYSTEM["particles"])
+                particles = SYSTEM["particles"].blit_item()
+                if particles is not None:
+                    queue["particles"].append(particles)
         elif game_state == MENU_INVENTORY:
-            all_blits.extend(SYSTEM["layers"]["pickup"])
+            layers = INVENTORY_LAYERS
+        else:
+            layers = MENU_LAYERS
         if SYSTEM["post_effects"].flash_timer > 0:
-            all_blits.append((SYSTEM["post_effects"].flash_surface, shake))
+            queue.push("effects", SYSTEM["post_effects"].flash_surface, shake)
         if SYSTEM["fps_counter"] is not None and SYSTEM["options"]["show_fps"]:
-            all_blits.append((SYSTEM["fps_counter"].surface,\
-                                (SCREEN_WIDTH - SYSTEM["fps_counter"].width, 0)))
-        if all_blits:
-            SYSTEM["windows"].blits(all_blits)
+            queue.push("effects", SYSTEM["fps_counter"].surface,\
+                       (SCREEN_WIDTH - SYSTEM["fps_counter"].width, 0))
+        scale = SYSTEM["options"]["render_scale"]
+        if game_state == GAME_LEVEL and scale < 100:
+            DIRTY_REGIONS.invalidate()
+            SYSTEM["camera"].render_scale = scale / 100
+            queue.submit_scaled(SYSTEM["windows"], world_target(scale), layers,
+                                SCALED_BLITS, SYSTEM["camera"])
+        else:
+            submit_frame(queue, layers, shake)
+    for name in FRAME_LAYERS:
+        queue.clear(name)
     if game_state == GAME_LEVEL:
-        SYSTEM["warnings"].fill(BLACK_TRANSP)
+        SYSTEM["warnings"].clear(BLACK_TRANSP)
@@ -3,19 +3,17 @@
 import threading
 import re
 import os
-import random
-import cProfile
-import numpy as np
-import psutil
 
-from data.api.surface import Surface, mouse_position, get_keys, init_engine
+from data.api.surface import Surface, Overlay, mouse_position, init_engine
 from data.api.clock import Clock
 from data.api.logger import Logger
+from data.api.profiler import FrameProfiler
+from data.api.metrics import MetricsCollector
 from data.api.keycodes import K_Q, K_E, K_R, K_F, K_T, K_1, K_2, K_LSHIFT, K_G, K_X
 
 from data.constants import SYSTEM, SCREEN_HEIGHT, SCREEN_WIDTH, MENU_MAIN, GAME_LEVEL,\
-    RESSOURCES, ENNEMY_TRACKER, POWER_UP_TRACKER, trad, Flags,\
-    PROJECTILE_TRACKER, TEXT_TRACKER, WAVE_TIMER, TICKER_TIMER, UPDATE_TIMER
+    RESSOURCES, CACHE, ENNEMY_TRACKER, POWER_UP_TRACKER, trad, Flags,\
+    PROJECTILE_TRACKER, TEXT_TRACKER, WAVE_TIMER, UPDATE_TIMER, ANIMATION_TRACKER, PROFILES
 from data.filesystem import change_language, load_options
 
 from data.image.sprite import Animation, Image, Sprite
@@ -29,6 +27,7 @@ from data.image.posteffects import PostEffects
 from data.image.tileset import Tileset
 
 from data.interface.general import setup_bottom_bar
+from data.interface.render import RENDER_QUEUE
 from data.interface.gear import open_gear_screen
 from data.interface.spellbook import open_spell_screen
 from data.interface.skilltree import open_skill_screen
@@ -45,24 +44,29 @@ from data.tables.enemy_table import VOIDBOSS, MONOLITH, HERALD
 
 from data.game.level import Level
 from data.game.lootgenerator import LootGenerator
-from data.game.deltatime import DeltaTime
+from data.game.deltatime import DeltaTime, FixedStep
 from data.game.camera import Camera
 
 from data.caching.transformation_cache import TransformCache
+from data.caching.rotation_bake import RotationBake
 
 from data.physics.particle import ParticleEmitter
+from data.physics.spatialhash import SpatialHash
+from data.physics.flowfield import FlowField
+from data.numerics.rng import RNG
+from data.replay import LiveInput
 
 def generate_random_level():
     """Creates a random level."""
-    area_lvl = max(SYSTEM["player"].creature.level + random.randint(-3, 5), 1)
+    area_lvl = max(SYSTEM["player"].creature.level + RNG["spawns"].randint(-3, 5), 1)
     bosses = [VOIDBOSS, HERALD, None]
     chance = [0.5, 0.1, 0.4]
-    has_boss = np.random.choice(bosses, p=chance)
-    zone = random.randint(0, 6)
+    has_boss = RNG["spawns"].choice(bosses, chance)
+    zone = RNG["spawns"].randint(0, 6)
     diff_level = [0,1,2,3]
     diff_weight = [0.4, 0.25, 0.2, 0.15]
-    diff = np.random.choice(diff_level, p=diff_weight)
-    waves = random.randint(2, 8)
+    diff = RNG["spawns"].choice(diff_level, diff_weight)
+    waves = RNG["spawns"].randint(2, 8)
     flags = []
     match zone:
         case 0:
@@ -117,7 +121,6 @@ def reset():
 def init_timers():
     """Inits Pygame's timers."""
     SYSTEM["deltatime"].start(WAVE_TIMER, 1000)
-    SYSTEM["deltatime"].start(TICKER_TIMER, int(0.016 * 1000))
     SYSTEM["deltatime"].start(UPDATE_TIMER, int(SYSTEM["options"]["fps"]))
 
 def start_level():
@@ -488,14 +491,7 @@ def load_others():
     SYSTEM["ui_surface"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT)
     SYSTEM["ui_background"] = []
     SYSTEM["ui_foreground"] = []
-    SYSTEM["layers"] = {
-        "pickup": [],
-        "warnings": [],
-        "bullets": [],
-        "characters": [],
-        "texts": [],
-        "ui": []
-    }
+    SYSTEM["layers"] = RENDER_QUEUE
     load_uniques()
 
 def load_start():
@@ -516,15 +512,38 @@ def load_start():
     SYSTEM["def_panel"] = SlotPanel(SCREEN_WIDTH - 535, 10)
     SYSTEM["mouse_previous"] = SYSTEM["mouse"]
 
+def bake_projectiles():
+    """Pre-renders the rotations of the projectile animations, if enabled
+    in the options. Done after the spells so their animations are known."""
+    if not SYSTEM["options"]["prebake_projectiles"]:
+        return
+    names = {spell.attack_anim for spell in SYSTEM["spells"].values()\
+             if Flags.PROJECTILE in spell.all_flags}
+    for name in sorted(n for n in names if isinstance(n, str)):
+        animation = SYSTEM["images"].get(name)
+        if not isinstance(animation, Animation):
+            continue
+        for area in SYSTEM["options"]["prebake_areas"]:
+            SYSTEM["rotation_bake"].bake(name, animation, area)
+
 def create_character():
     """Creates the player character."""
     SYSTEM["player"] = Character(imagefile="witch")
 
-def get_memory_usage():
-    """Get current memory usage in MB."""
-    process = psutil.Process(os.getpid())
-    mem = process.memory_info().rss / 1024 / 1024
-    return round(mem)
+def init_metrics():
+    """Creates the metrics collector and its gauges, and starts sampling."""
+    if SYSTEM["metrics"] is not None:
+        SYSTEM["metrics"].stop()
+    metrics = MetricsCollector()
+    metrics.add_gauge("projectiles", PROJECTILE_TRACKER.__len__)
+    metrics.add_gauge("enemies", ENNEMY_TRACKER.__len__)
+    metrics.add_gauge("power_ups", POWER_UP_TRACKER.__len__)
+    metrics.add_gauge("texts", TEXT_TRACKER.__len__)
+    metrics.add_gauge("animations", ANIMATION_TRACKER.__len__)
+    metrics.add_gauge("trans_cache", lambda: SYSTEM["trans_cache"].bytes / 1024 / 1024)
+    metrics.add_gauge("particles", lambda: SYSTEM["particle_emitter"].count)
+    SYSTEM["metrics"] = metrics
+    metrics.start(f"{PROFILES}/metrics.csv")
 
 def load():
     """Loads everything inside the system.
@@ -536,6 +555,7 @@ def load():
         (load_tiles, 2, "tiles"),
         (load_tilesets, 4, "tileset"),
         (generate_spell_list, 3, "spells"),
+        (bake_projectiles, 2, "bake"),
         (load_others, 1, "others"),
         (load_buttons, 2, "buttons"),
         (create_character, 1, "player"),
@@ -543,30 +563,39 @@ def load():
     ]
     total = sum(weight for _, weight, _ in tasks)
     progress = 0
-    print(f"Memory in use before loading: {get_memory_usage()} MB")
     for t, w, x in tasks:
         SYSTEM["loading_text"] = Text(trad('loading', x), font="item_titles", size=30)
         t()
         progress += w
         SYSTEM["progress"] = progress / total * 100
-        print(f"{x} loaded: {get_memory_usage()} MB")
     SYSTEM["loaded"] = True
+    metrics = SYSTEM["metrics"]
+    if metrics is not None and SYSTEM.get("logger") is not None and "rss" in metrics.values:
+        SYSTEM["logger"].print(f"Memory in use after loading: {metrics.values['rss']:.0f} MB")
+
+def init_game(threaded: bool = True):
+    """Loads the basic data for the game.
 
-def init_game():
-    """Loads the basic data for the game."""
+    Args:
+        threaded (bool, optional): Whether or not to load the assets on a\
+        thread, while the loading screen is drawn. Defaults to True.
+    """
     init_engine()
-    SYSTEM["keys"] = get_keys()
+    SYSTEM["keys"] = set()
     load_options(True)
     SYSTEM["clock"] = Clock()
     SYSTEM["deltatime"] = DeltaTime()
+    SYSTEM["fixed_step"] = FixedStep()
+    if SYSTEM["inputs"] is None:
+        SYSTEM["inputs"] = LiveInput()
     change_language(SYSTEM["options"]["lang_selec"])
     SYSTEM["camera"] = Camera(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
     SYSTEM["post_effects"] = PostEffects()
     SYSTEM["windows"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT, is_alpha=False)
     SYSTEM["gm_background"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT, is_alpha=False)
     SYSTEM["gm_parallaxe"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT)
-    SYSTEM["warnings"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT)
-    SYSTEM["particles"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT)
+    SYSTEM["warnings"] = Overlay(SCREEN_WIDTH, SCREEN_HEIGHT)
+    SYSTEM["particles"] = Overlay(SCREEN_WIDTH, SCREEN_HEIGHT)
     SYSTEM["text_generator"] = TextGenerator()
     SYSTEM["images"]["load_orb"] = Animation("sprites/darkcristal.png", 64, 64, frame_rate=0.25)\
         .scale(128, 128)
@@ -575,11 +604,20 @@ def init_game():
     SYSTEM["loading_text"] = None
     SYSTEM["fps_counter"] = None
     SYSTEM["mouse_target"] = None
-    SYSTEM["profiler"] = cProfile.Profile()
+    SYSTEM["profiler"] = FrameProfiler()
     SYSTEM["trans_cache"] = TransformCache()
+    SYSTEM["rotation_bake"] = RotationBake(directory=f"{CACHE}/rotations")
     SYSTEM["logger"] = Logger()
-    SYSTEM["particle_emitter"] = ParticleEmitter(max_particles=2000)
-    loading_thread = threading.Thread(target=load)
-    loading_thread.start()
+    SYSTEM["particle_emitter"] = ParticleEmitter(max_particles=2000,
+                                    vectorized=SYSTEM["options"]["particles_vectorized"],
+                                    batched=SYSTEM["options"]["particles_batched"])
+    SYSTEM["collision_grid"] = SpatialHash()
+    SYSTEM["flow_field"] = FlowField()
+    init_metrics()
+    if threaded:
+        loading_thread = threading.Thread(target=load)
+        loading_thread.start()
+    else:
+        load()
     SYSTEM["unloader"] = None
     SYSTEM["held"] = False
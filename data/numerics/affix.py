@@ -1,10 +1,10 @@
 """An affix is a modifier for an item."""
 
-import random
 import json
 from data.constants import Flags
 from data.numerics.affliction import Affliction
 from data.constants import trad, META_FLAGS, GEAR_FLAGS
+from data.numerics.rng import RNG
 
 class Affix():
     """An affix a single modifier for an item.
@@ -40,7 +40,7 @@ class Affix():
         """Creates a copy of the affix with a randomly rolled value."""
         lower = self._bounds[0] * self._value
         upper = self._bounds[1] * self._value
-        value = round(random.uniform(lower, upper), 2)
+        value = round(RNG["loot"].uniform(lower, upper), 2)
         return Affix(
             self._name,
             value,
@@ -64,7 +64,7 @@ class Affix():
     def reroll(self):
         """Rerolls an affix within its bounds."""
         if not self._seal:
-            self._value = random.uniform(self._bounds[0], self._bounds[1])
+            self._value = RNG["loot"].uniform(self._bounds[0], self._bounds[1])
 
     def seal(self, seals: bool):
         """Sets the seal or unseals it."""
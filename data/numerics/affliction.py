@@ -5,6 +5,7 @@ import json
 from data.constants import trad, META_FLAGS, Flags, ORANGE
 from data.image.hoverable import Hoverable
 from data.numerics.damage import Damage
+from data.numerics.expiry import EXPIRY, STEP
 
 class Affliction():
     """Defines an affliction. An affliction is a temporary \
@@ -31,7 +32,7 @@ class Affliction():
     """
     __slots__ = '_name', '_value', '_duration', '_flags', '_max_duration', '_expire', '_stackable',\
                 '_refreshable', '_damage', '_max_stacks', '_tick_rate', '_dot_tick', '_dot_timer', \
-                '_dot_amount', '_dot_color', '_is_debuff'
+                '_dot_amount', '_dot_color', '_is_debuff', '_start', '_expires_at', '_on_expire'
     def __init__(self, name, value, duration = 1, flags: list = None, stackable = False,
                  refreshable = False, damage: Damage = None, max_stacks = 10, tick_rate = 0.016,
                  dot_tick = 1, dot_color = ORANGE, is_debuff = False):
@@ -54,23 +55,51 @@ class Affliction():
         self._dot_amount = 0
         self._dot_color = dot_color
         self._is_debuff = is_debuff
+        self._start = 0
+        self._expires_at = None
+        self._on_expire = None
 
     def tick(self):
-        """Ticks down the timer.
+        """Ticks down the timer. The duration of a scheduled affliction\
+        counts down with the logic steps instead.
         """
         self._dot_timer += self._tick_rate
         if self._dot_timer >= self._dot_tick:
             self._dot_timer -= self._dot_tick
             self._dot_amount += 1
-        if self._duration >= 0:
-            self._duration -= 0.016
+        if self._expires_at is None and self._duration >= 0:
+            self._duration -= STEP
+
+    def schedule(self, callback) -> bool:
+        """Hands the expiry of the affliction to the expiry scheduler, which\
+        calls `callback` with the affliction once its duration ran out.
+
+        Args:
+            callback (callable): Called with the affliction when it expires.
+
+        Returns:
+            bool: False for permanent afflictions, which are never scheduled.
+        """
+        if not self._expire:
+            return False
+        self._start = EXPIRY.now
+        self._on_expire = callback
+        self._expires_at = EXPIRY.push(self, self._duration)
+        return True
+
+    def expire(self):
+        """Called by the expiry scheduler when the affliction ran out."""
+        callback = self._on_expire
+        self._on_expire = None
+        if callback is not None:
+            callback(self)
 
     def clone(self, is_debuff = False):
         """Returns a copy of the affliction."""
         return Affliction(
             self._name,
             self._value,
-            self._duration,
+            self.duration,
             self._flags,
             self._stackable,
             self._refreshable,
@@ -84,7 +113,7 @@ class Affliction():
 
     def __str__(self):
         return f"{self._name}: value {self._value}," +\
-            f" duration {self._duration}, flags {self._flags}, tick rate {self._tick_rate}\n"
+            f" duration {self.duration}, flags {self._flags}, tick rate {self._tick_rate}\n"
 
     def __eq__(self, other):
         if not isinstance(other, Affliction):
@@ -93,7 +122,7 @@ class Affliction():
             return False
         if self._value != other._value:
             return False
-        if self._duration != other.duration:
+        if self.duration != other.duration:
             return False
         if self._flags != other.flags:
             return False
@@ -172,7 +201,7 @@ class Affliction():
             "type":"affliction",
             "name": self._name,
             "value": self._value,
-            "duration": self._duration,
+            "duration": self.duration,
             "flags": self._flags,
             "stackable": self._stackable,
             "refreshable": self._refreshable,
@@ -213,12 +242,16 @@ class Affliction():
 
     @property
     def duration(self) -> int:
-        """Returns the affliction's duration."""
-        return self._duration
+        """Returns the affliction's remaining duration."""
+        if self._expires_at is None:
+            return self._duration
+        return self._duration - (EXPIRY.now - self._start) * STEP
 
     @duration.setter
     def duration(self, value):
         self._duration = value
+        if self._expires_at is not None:
+            self.schedule(self._on_expire)
 
     @property
     def flags(self):
@@ -259,15 +292,23 @@ class Affliction():
     @property
     def elapsed(self):
         """Returns the relative elapsed time of the debuff."""
-        return round(self._duration / self._max_duration * 255)
+        return round(self.duration / self._max_duration * 255)
 
     @property
     def expired(self):
         """"Returns true whether or not the affliction's expired."""
         if not self._expire:
             return False
+        if self._expires_at is not None:
+            return EXPIRY.now >= self._expires_at
         return self._duration <= 0
 
+    @property
+    def expires_at(self) -> int:
+        """Returns the logic step the affliction expires at, or None if it\
+        is not scheduled."""
+        return self._expires_at
+
     @property
     def max_stacks(self):
         """Returns the maximum amounts of stacks."""
@@ -7,8 +7,8 @@ P stands for penetration, ie how much of the
 resistance the damage source shall ignore."""
 
 import json
-import random
 from data.constants import trad
+from data.numerics.rng import RNG
 
 class Damage():
     """A source of damage is a group of numbers that will \
@@ -117,14 +117,17 @@ class Damage():
             List of damages and list of \
             penetration values.
         """
+        rolls = RNG["combat"]
+        low, high = self._bounds
+        types = self._types
         damages = {
-            "phys": self._types["phys"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "fire": self._types["fire"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "ice": self._types["ice"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "lightning": self._types["lightning"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "energy": self._types["energy"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "light": self._types["light"] * random.uniform(self._bounds[0], self._bounds[1]),
-            "dark": self._types["dark"] * random.uniform(self._bounds[0], self._bounds[1])
+            "phys": types["phys"] * rolls.uniform(low, high),
+            "fire": types["fire"] * rolls.uniform(low, high),
+            "ice": types["ice"] * rolls.uniform(low, high),
+            "lightning": types["lightning"] * rolls.uniform(low, high),
+            "energy": types["energy"] * rolls.uniform(low, high),
+            "light": types["light"] * rolls.uniform(low, high),
+            "dark": types["dark"] * rolls.uniform(low, high)
         }
         return damages, self._penetration
 
@@ -1,10 +1,10 @@
 """A double affix is a modifier for an item that adds a range."""
 
-import random
 import json
 from data.constants import Flags
 from data.numerics.affliction import Affliction
 from data.constants import trad, META_FLAGS, GEAR_FLAGS
+from data.numerics.rng import RNG
 
 class DoubleAffix():
     """An affix a single modifier for an item.
@@ -56,8 +56,8 @@ class DoubleAffix():
         upper_min = self._bounds_min[1] * self._value_min
         lower_max = self._bounds_max[0] * self._value_max
         upper_max = self._bounds_max[1] * self._value_max
-        value_min = round(random.uniform(lower_min, upper_min))
-        value_max = round(random.uniform(lower_max, upper_max))
+        value_min = round(RNG["loot"].uniform(lower_min, upper_min))
+        value_max = round(RNG["loot"].uniform(lower_max, upper_max))
         return DoubleAffix(
             self._name,
             value_min,
@@ -72,8 +72,8 @@ class DoubleAffix():
     def reroll(self):
         """Rerolls an affix within its bounds."""
         if not self._seal:
-            self._value_min = random.uniform(self._bounds_min[0], self._bounds_min[1])
-            self._value_max = random.uniform(self._bounds_max[0], self._bounds_max[1])
+            self._value_min = RNG["loot"].uniform(self._bounds_min[0], self._bounds_min[1])
+            self._value_max = RNG["loot"].uniform(self._bounds_max[0], self._bounds_max[1])
 
     def seal(self, seals: bool):
         """Sets the seal or unseals it."""
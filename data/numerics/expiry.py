@@ -0,0 +1,64 @@
+"""Expiry of the afflictions. Instead of every creature scanning its stats
+each tick for modifiers that ran out, timed afflictions are pushed in a heap
+keyed by the logic step they expire at. The scheduler advances once per
+logic step and only wakes the afflictions that are due.
+
+A refreshed affliction is pushed again rather than moved in the heap: its
+previous entry no longer matches its expiry step and is skipped."""
+
+import heapq
+import math
+
+STEP = 0.016
+
+class ExpiryScheduler():
+    """Calls afflictions back when their duration ran out."""
+    __slots__ = '_now', '_heap', '_count'
+    def __init__(self):
+        self._now = 0
+        self._heap = []
+        self._count = 0
+
+    def push(self, affliction, duration: float) -> int:
+        """Schedules the expiry of an affliction.
+
+        Args:
+            affliction (Affliction): Affliction to expire.
+            duration (float): Duration in seconds from now.
+
+        Returns:
+            int: The logic step the affliction expires at.
+        """
+        due = self._now + max(math.ceil(duration / STEP - 1e-9), 1)
+        self._count += 1
+        heapq.heappush(self._heap, (due, self._count, affliction))
+        return due
+
+    def advance(self) -> int:
+        """Moves to the next logic step, and expires the afflictions due.
+
+        Returns:
+            int: The amount of afflictions expired.
+        """
+        self._now += 1
+        heap = self._heap
+        expired = 0
+        while heap and heap[0][0] <= self._now:
+            due, _, affliction = heapq.heappop(heap)
+            if affliction.expires_at != due:
+                continue
+            affliction.expire()
+            expired += 1
+        return expired
+
+    @property
+    def now(self) -> int:
+        """Returns the current logic step."""
+        return self._now
+
+    @property
+    def pending(self) -> int:
+        """Returns the amount of entries in the heap, stale ones included."""
+        return len(self._heap)
+
+EXPIRY = ExpiryScheduler()
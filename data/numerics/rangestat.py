@@ -1,11 +1,11 @@
 """A range stat is a special stat that has an upper and lower bound."""
 
 import json
-import random
 from data.numerics.stat import Stat
 from data.numerics.affliction import Affliction
 from data.constants import trad
 from data.image.hoverable import Hoverable
+from data.numerics.rng import RNG
 
 class RangeStat():
     """Defines a range stat.
@@ -81,6 +81,20 @@ class RangeStat():
             self._upper.remove_affliction(affliction)
             self._lower.remove_affliction(affliction)
 
+    def expire(self, affliction: Affliction):
+        """Removes an affliction that ran out, see `Stat.expire`.
+
+        Args:
+            affliction (Affliction): Affliction to remove.
+        """
+        if affliction.name[len(affliction.name) - 4:] == "_min":
+            self._lower.expire(affliction)
+        elif affliction.name[len(affliction.name) - 4:] == "_max":
+            self._upper.expire(affliction)
+        else:
+            self._upper.expire(affliction)
+            self._lower.expire(affliction)
+
     def tick(self):
         """Ticks down all increases and multipliers durations.
         
@@ -117,7 +131,7 @@ class RangeStat():
     def roll(self):
         """Rolls a random value between the upper and the lower
         bounds."""
-        roll = random.uniform(self._lower.get_value(),\
+        roll = RNG["combat"].uniform(self._lower.get_value(),\
                               self._upper.get_value())
         return roll
 
@@ -0,0 +1,170 @@
+"""Random numbers of the game. Every kind of roll draws from its own named
+stream, each seeded from the game seed and its name, so that a run can be
+reproduced and that rolling more of one kind (particles, for instance) does
+not change the others (loot, combat...).
+
+Single rolls are read from a batch of uniforms generated in advance by
+numpy, instead of calling the generator once per roll."""
+
+import zlib
+from bisect import bisect
+from itertools import accumulate
+
+import numpy as np
+
+STREAMS = ("loot", "combat", "spawns", "particles", "visual")
+
+class RandomStream():
+    """Defines a named stream of random numbers.
+
+    Args:
+        seed (int): Seed of the game.
+        name (str): Name of the stream, mixed into the seed.
+        batch (int, optional): Amount of uniforms generated at once for the\
+        single rolls. Defaults to 1024.
+    """
+    __slots__ = '_name', '_generator', '_batch', '_buffer', '_index', '_draws'
+    def __init__(self, seed: int, name: str, batch: int = 1024):
+        self._name = name
+        self._batch = batch
+        self._generator = None
+        self._buffer = []
+        self._index = 0
+        self._draws = 0
+        self.seed(seed)
+
+    def seed(self, seed: int):
+        """Restarts the stream from a seed."""
+        key = zlib.crc32(self._name.encode())
+        self._generator = np.random.Generator(np.random.PCG64(
+            np.random.SeedSequence(seed, spawn_key=(key,))))
+        self._buffer = []
+        self._index = 0
+        self._draws = 0
+
+    def random(self) -> float:
+        """Returns a float in [0, 1)."""
+        index = self._index
+        if index >= len(self._buffer):
+            self._buffer = self._generator.random(self._batch).tolist()
+            index = 0
+        self._index = index + 1
+        self._draws += 1
+        return self._buffer[index]
+
+    def uniform(self, low: float, high: float) -> float:
+        """Returns a float between low and high."""
+        return low + (high - low) * self.random()
+
+    def randint(self, low: int, high: int) -> int:
+        """Returns an integer between low and high, both included."""
+        return low + int(self.random() * (high - low + 1))
+
+    def integers(self, low: int, high: int) -> int:
+        """Returns an integer between low included and high excluded."""
+        return low + int(self.random() * (high - low))
+
+    def chance(self, probability: float) -> bool:
+        """Returns `True` with the given probability."""
+        return self.random() < probability
+
+    def choice(self, population, weights=None):
+        """Returns an element of a sequence.
+
+        Args:
+            population (Sequence): Elements to pick from.
+            weights (Sequence, optional): Relative weight of each element,\
+            they do not need to add up to 1. Defaults to None (same weights).
+        """
+        if weights is None:
+            return population[int(self.random() * len(population))]
+        cumulated = list(accumulate(weights))
+        index = bisect(cumulated, self.random() * cumulated[-1])
+        return population[min(index, len(population) - 1)]
+
+    def sample(self, population, count: int) -> list:
+        """Returns `count` distinct elements of a sequence."""
+        indexes = self._generator.choice(len(population), size=count, replace=False)
+        return [population[int(i)] for i in indexes]
+
+    def uniforms(self, low, high, size) -> np.ndarray:
+        """Returns an array of floats between low and high, for batches of\
+        rolls.
+
+        Args:
+            low (float|np.ndarray): Lower bound.
+            high (float|np.ndarray): Upper bound.
+            size (int|tuple): Shape of the array.
+        """
+        return self._generator.uniform(low, high, size)
+
+    def array_integers(self, low: int, high: int, size) -> np.ndarray:
+        """Returns an array of integers between low included and high excluded."""
+        return self._generator.integers(low, high, size)
+
+    @property
+    def name(self) -> str:
+        """Returns the name of the stream."""
+        return self._name
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """Returns the numpy generator of the stream."""
+        return self._generator
+
+    @property
+    def draws(self) -> int:
+        """Returns the amount of single rolls since the stream was seeded."""
+        return self._draws
+
+class RandomService():
+    """Holds the random streams of the game.
+
+    Args:
+        seed (int, optional): Seed of the game. Defaults to None, picking\
+        one from the system's entropy.
+    """
+    __slots__ = '_seed', '_streams'
+    def __init__(self, seed: int = None):
+        self._seed = None
+        self._streams = {}
+        self.seed(seed)
+
+    def seed(self, seed: int = None) -> int:
+        """Restarts every stream from a new seed.
+
+        Args:
+            seed (int, optional): Seed of the game. Defaults to None, picking\
+            one from the system's entropy.
+
+        Returns:
+            int: The seed used.
+        """
+        if seed is None:
+            seed = int(np.random.SeedSequence().entropy % (1 << 63))
+        self._seed = seed
+        for stream in self._streams.values():
+            stream.seed(seed)
+        for name in STREAMS:
+            if name not in self._streams:
+                self._streams[name] = RandomStream(seed, name)
+        return seed
+
+    def __getitem__(self, name: str) -> RandomStream:
+        stream = self._streams.get(name)
+        if stream is None:
+            stream = RandomStream(self._seed, name)
+            self._streams[name] = stream
+        return stream
+
+    @property
+    def current_seed(self) -> int:
+        """Returns the seed the streams started from."""
+        return self._seed
+
+    @property
+    def streams(self) -> dict:
+        """Returns the streams by name."""
+        return self._streams
+
+RNG = RandomService()
@@ -28,7 +28,8 @@ class Stat:
         scales multiplicatively. Defaults to `False` (additive).
     """
     __slots__ = '_value', '_name', '_flats', '_mults', '_incr', '_cap', '_scaling_value', \
-                '_mult_scaling', '_round', '_has_mods', "_changed"
+                '_mult_scaling', '_round', '_has_mods', "_changed", '_version', '_cached', \
+                '_cached_version'
     def __init__(self, val = 10, name = "stat",\
             max_cap:float = None, min_cap = None, precision:int = 2,\
             scaling_value:float = 0, mult_scaling = False):
@@ -43,6 +44,16 @@ class Stat:
         self._round = int(precision)
         self._has_mods = False
         self._changed = False
+        self._version = 0
+        self._cached = None
+        self._cached_version = -1
+
+    def invalidate(self):
+        """Bumps the version of the stat, so its value is computed again.
+        Called by every method changing the base value or the modifiers;\
+        must be called when an affliction already applied is modified."""
+        self._version += 1
+        self._changed = True
 
     def get_flats(self):
         """Returns the sum of the flat values"""
@@ -76,11 +87,14 @@ class Stat:
                f" * {self.get_multipliers()}"
 
     def get_value(self):
-        """Returns the computed final value of the stat.
+        """Returns the computed final value of the stat. The value is only\
+        computed again when the version of the stat changed.
         
         Returns:
             float: value of the stat with computed increases \
             and multipliers."""
+        if self._cached_version == self._version:
+            return self._cached
         final_incr = self.get_increases()
         final_flats = self.get_flats()
         final_mults = self.get_multipliers()
@@ -90,6 +104,8 @@ class Stat:
             final_value = max(final_value, self._cap[0])
         if self._cap[1] is not None:
             final_value = min(final_value, self._cap[1])
+        self._cached = final_value
+        self._cached_version = self._version
         return final_value
 
     def _handle_affliction_list(self, list_name, affliction):
@@ -128,7 +144,7 @@ class Stat:
             self._handle_affliction_list("_mults", affliction)
         if Flags.FLAT in affliction.flags:
             self._handle_affliction_list("_flats", affliction)
-        self._changed = True
+        self.invalidate()
 
     def remove_affliction(self, affliction: Affliction):
         """Removes an affliction.
@@ -145,7 +161,7 @@ class Stat:
         for afflic in self._flats:
             if afflic == affliction:
                 self._flats.remove(afflic)
-        self._changed = True
+        self.invalidate()
 
     def tick(self):
         """Ticks down all increases and multipliers durations.
@@ -153,15 +169,30 @@ class Stat:
         If a duration reaches 0, it'll be deleted. 
         If a duration is negative, it's considered infinite.  
         """
-        for flats in self._flats:
-            if flats.expired:
-                self._flats.remove(flats)
-        for mults in self._mults:
-            if mults.expired:
-                self._mults.remove(mults)
-        for incr in self._incr:
-            if incr.expired:
-                self._incr.remove(incr)
+        if not (self._flats or self._mults or self._incr):
+            return
+        expired = False
+        for modifiers in (self._flats, self._mults, self._incr):
+            for i in range(len(modifiers) - 1, -1, -1):
+                if modifiers[i].expired:
+                    del modifiers[i]
+                    expired = True
+        if expired:
+            self.invalidate()
+
+    def expire(self, affliction: Affliction):
+        """Removes an affliction that ran out. Unlike `remove_affliction`,\
+        only this very affliction is removed, not the equal ones.
+
+        Args:
+            affliction (Affliction): Affliction to remove.
+        """
+        for modifiers in (self._flats, self._mults, self._incr):
+            for i, modifier in enumerate(modifiers):
+                if modifier is affliction:
+                    del modifiers[i]
+                    self.invalidate()
+                    break
 
     def scale(self, level:int):
         """Scales the stat to the given level."""
@@ -169,6 +200,7 @@ class Stat:
             self._value *= self._scaling_value * level
         else:
             self._value += self._scaling_value * level
+        self.invalidate()
 
     def describe(self, is_percentage = True, is_tab = False):
         """Describe the stat as a surface."""
@@ -218,6 +250,7 @@ class Stat:
         self._incr.clear()
         self._mults.clear()
         self._flats.clear()
+        self.invalidate()
 
     def export(self):
         """Serializes the affix as JSON."""
@@ -281,6 +314,12 @@ class Stat:
             self._changed = False
         return self._has_mods
 
+    @property
+    def version(self) -> int:
+        """Returns the version of the stat, bumped each time its value may\
+        have changed. Caches depending on the stat can compare it."""
+        return self._version
+
     @property
     def value(self) -> float:
         """Returns the current value of the stat."""
@@ -289,6 +328,7 @@ class Stat:
     @value.setter
     def value(self, value):
         self._value = value
+        self.invalidate()
 
     @property
     def name(self) -> str:
@@ -307,6 +347,7 @@ class Stat:
     @flats.setter
     def flats(self, value):
         self._flats = value
+        self.invalidate()
 
     @property
     def mults(self):
@@ -316,6 +357,7 @@ class Stat:
     @mults.setter
     def mults(self, value):
         self._mults = value
+        self.invalidate()
 
     @property
     def incr(self):
@@ -325,6 +367,7 @@ class Stat:
     @incr.setter
     def incr(self, value):
         self._incr = value
+        self.invalidate()
 
     @property
     def c_value(self):
@@ -104,6 +104,13 @@ class Entity(HitBox):
             self.y -= self._move_speed
         self.move_center(self.center)
 
+    def follow(self, direction):
+        """Moves the entity by one step along a (dx, dy) direction, such as\
+        the ones of a flow field. Uses the same speeds as `move`."""
+        self.x += direction[0] * self._move_speed * 3
+        self.y += direction[1] * self._move_speed
+        self.move_center(self.center)
+
     def displace(self, pos):
         """Moves the entity toward the x;y position."""
         if self._dashing:
@@ -0,0 +1,161 @@
+"""Flow field pathfinding. A single breadth-first search from the target
+gives the distance of every tile of the map to it; each tile then points
+toward its closest neighbour. Any amount of enemies can follow the field
+with one lookup each, instead of searching a path per enemy."""
+
+import numpy as np
+
+OFFSETS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+class FlowField():
+    """Defines a flow field over the obstacle grid of a map.
+
+    Args:
+        refresh (float, optional): Minimum delay in seconds between two\
+        computations of the field. Defaults to 0.25.
+    """
+    __slots__ = '_refresh', '_timer', '_obstacles', '_tile_w', '_tile_h', '_goal', \
+                '_distance', '_directions', '_computations'
+    def __init__(self, refresh: float = 0.25):
+        self._refresh = refresh
+        self._timer = refresh
+        self._obstacles = None
+        self._tile_w = 1
+        self._tile_h = 1
+        self._goal = None
+        self._distance = None
+        self._directions = None
+        self._computations = 0
+
+    def compute(self, obstacles: np.ndarray, goal: tuple[int, int]):
+        """Computes the field toward a tile.
+
+        Args:
+            obstacles (np.ndarray): Boolean (height, width) grid, `True` on\
+            blocked tiles.
+            goal (tuple[int, int]): x;y index of the target tile.
+        """
+        height, width = obstacles.shape
+        goal_x = min(max(goal[0], 0), width - 1)
+        goal_y = min(max(goal[1], 0), height - 1)
+        stride = width + 2
+        walkable = np.zeros((height + 2, stride), dtype=bool)
+        walkable[1:-1, 1:-1] = ~obstacles
+        walkable = walkable.ravel().tolist()
+        distance = [-1] * len(walkable)
+        start = (goal_y + 1) * stride + goal_x + 1
+        distance[start] = 0
+        walkable[start] = True
+        queue = [start]
+        for index in queue:
+            step = distance[index] + 1
+            for neighbour in (index - stride, index + stride, index - 1, index + 1):
+                if walkable[neighbour] and distance[neighbour] < 0:
+                    distance[neighbour] = step
+                    queue.append(neighbour)
+        grid = np.array(distance, dtype=np.float32).reshape(height + 2, stride)[1:-1, 1:-1]
+        grid[grid < 0] = np.inf
+        self._distance = grid
+        self._directions = self._descend(grid)
+        self._goal = (goal_x, goal_y)
+        self._computations += 1
+
+    @staticmethod
+    def _descend(distance: np.ndarray) -> np.ndarray:
+        """Returns, for every tile, the (dx, dy) step toward its closest\
+        neighbour. Diagonals are only taken if both sides are free, so\
+        followers do not cut corners."""
+        height, width = distance.shape
+        padded = np.full((height + 2, width + 2), np.inf, dtype=np.float32)
+        padded[1:-1, 1:-1] = distance
+        candidates = np.empty((len(OFFSETS), height, width), dtype=np.float32)
+        for i, (dx, dy) in enumerate(OFFSETS):
+            candidates[i] = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+            if dx and dy:
+                side_x = padded[1:-1, 1 + dx:1 + dx + width]
+                side_y = padded[1 + dy:1 + dy + height, 1:-1]
+                candidates[i][np.isinf(side_x) | np.isinf(side_y)] = np.inf
+        best = candidates.argmin(axis=0)
+        directions = np.array(OFFSETS, dtype=np.int8)[best]
+        stuck = ~(np.take_along_axis(candidates, best[None], axis=0)[0] < distance)
+        directions[stuck] = 0
+        return directions
+
+    def update(self, obstacles: np.ndarray, tile_size: tuple[int, int],
+               target: tuple[float, float], delta: float = 0.016) -> bool:
+        """Recomputes the field if the refresh delay is over and the target\
+        changed tile, or at once if the obstacles changed.
+
+        Args:
+            obstacles (np.ndarray): Obstacle grid of the map.
+            tile_size (tuple[int, int]): Size in pixels of a tile.
+            target (tuple[float, float]): World position to reach.
+            delta (float, optional): Time elapsed since the last update.\
+            Defaults to 0.016.
+
+        Returns:
+            bool: Whether or not the field was computed again.
+        """
+        self._timer += delta
+        goal = (int(target[0] // tile_size[0]), int(target[1] // tile_size[1]))
+        if obstacles is not self._obstacles or tuple(tile_size) != (self._tile_w, self._tile_h):
+            self._obstacles = obstacles
+            self._tile_w, self._tile_h = tile_size
+        elif self._timer < self._refresh or goal == self._goal:
+            return False
+        self._timer = 0
+        self.compute(obstacles, goal)
+        return True
+
+    def sample(self, x: float, y: float) -> tuple[int, int]:
+        """Returns the (dx, dy) step to follow from a world position.
+        (0, 0) means the target tile was reached, cannot be reached, or that\
+        there is no field yet."""
+        if self._directions is None:
+            return (0, 0)
+        height, width = self._distance.shape
+        tile_x = min(max(int(x // self._tile_w), 0), width - 1)
+        tile_y = min(max(int(y // self._tile_h), 0), height - 1)
+        dx, dy = self._directions[tile_y, tile_x]
+        return (int(dx), int(dy))
+
+    def sample_many(self, positions) -> np.ndarray:
+        """Returns the (dx, dy) steps of many world positions at once.
+
+        Args:
+            positions (array-like): (n, 2) world positions.
+
+        Returns:
+            np.ndarray: (n, 2) array of steps.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 2)
+        if self._directions is None:
+            return np.zeros((len(positions), 2), dtype=np.int8)
+        height, width = self._distance.shape
+        tile_x = np.clip((positions[:, 0] // self._tile_w).astype(np.int32), 0, width - 1)
+        tile_y = np.clip((positions[:, 1] // self._tile_h).astype(np.int32), 0, height - 1)
+        return self._directions[tile_y, tile_x]
+
+    def clear(self):
+        """Forgets the current field."""
+        self._timer = self._refresh
+        self._obstacles = None
+        self._goal = None
+        self._distance = None
+        self._directions = None
+
+    @property
+    def distance(self) -> np.ndarray:
+        """Returns the distance in tiles of every tile to the goal,\
+        infinite where it cannot be reached."""
+        return self._distance
+
+    @property
+    def goal(self) -> tuple[int, int]:
+        """Returns the tile the field leads to."""
+        return self._goal
+
+    @property
+    def computations(self) -> int:
+        """Returns the amount of times the field was computed."""
+        return self._computations
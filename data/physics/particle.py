@@ -1,10 +1,18 @@
 """Particle system for visual effects."""
 
 import math
+from collections import OrderedDict
 
 import numpy as np
+from data.api.surface import Surface, Overlay
 from data.api.vec2d import Vec2
 from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT, PARTICULE_TRACKER, SYSTEM
+from data.numerics.rng import RNG
+
+LIGHTNING_LENGTH_STEP = 16
+LIGHTNING_ANGLE_STEP = 2
+LIGHTNING_CACHE_SIZE = 32
+LIGHTNING_CACHE_PIXELS = 8_000_000
 
 class Particle:
     """Single particle instance."""
@@ -20,12 +28,17 @@ class Particle:
         self.fade = fade
         self.gravity = gravity
 
-    def tick(self):
-        """Update particle state."""
+    def tick(self, delta=0.016):
+        """Update particle state.
+
+        Args:
+            delta (float, optional): Duration of the step in seconds.\
+            Defaults to 0.016.
+        """
         self.pos += self.vel
         if self.gravity:
             self.vel.y += self.gravity
-        self.life -= 0.016
+        self.life -= delta
         return self.life > 0
 
     def get_alpha(self):
@@ -52,15 +65,272 @@ class Segment:
         self.end = Vec2(x2, y2)
 
 
+class ParticleStamps:
+    """Atlas of pre-rendered particles. Each stamp is a small surface holding
+    a single particle, keyed by its quantized radius, color and alpha bucket,
+    so a whole frame of particles can be drawn with a single `blits` call.
+
+    Args:
+        max_stamps (int, optional): Amount of stamps to keep before the\
+        atlas is flushed. Defaults to 4096.
+    """
+    __slots__ = ('_stamps', '_max_stamps')
+    COLOR_STEP = 8
+    ALPHA_SHIFT = 4
+
+    def __init__(self, max_stamps=4096):
+        self._stamps = {}
+        self._max_stamps = max_stamps
+
+    @classmethod
+    def quantize(cls, size, color, alpha):
+        """Returns the stamp key of a particle. A radius of 0 is a single pixel."""
+        radius = 0 if size <= 1 else int(size)
+        half = cls.COLOR_STEP // 2
+        mask = ~(cls.COLOR_STEP - 1)
+        r, g, b = (min(255, (int(c) + half) & mask) for c in color[:3])
+        return (radius, r, g, b, int(alpha) >> cls.ALPHA_SHIFT)
+
+    def get(self, key):
+        """Returns the pygame surface of the stamp, rendering it if needed."""
+        stamp = self._stamps.get(key)
+        if stamp is None:
+            if len(self._stamps) >= self._max_stamps:
+                self._stamps.clear()
+            radius, r, g, b, bucket = key
+            alpha = bucket * 255 // (255 >> self.ALPHA_SHIFT)
+            if radius == 0:
+                sfc = Surface(1, 1)
+                sfc.fill((r, g, b, alpha))
+            else:
+                sfc = Surface(radius * 2, radius * 2)
+                sfc.draw_circle((r, g, b, alpha), (radius, radius), radius)
+            stamp = sfc.surface
+            self._stamps[key] = stamp
+        return stamp
+
+    @staticmethod
+    def blits(surface, batch):
+        """Blits a batch of (stamp, position) on the surface in one call."""
+        if isinstance(surface, Overlay):
+            surface.mark_many(surface.surface.blits(batch))
+            return
+        target = surface.surface if isinstance(surface, Surface) else surface
+        target.blits(batch, doreturn=False)
+
+    def clear(self):
+        """Empties the atlas."""
+        self._stamps.clear()
+
+    @property
+    def stamps(self):
+        """Returns the rendered stamps by key."""
+        return self._stamps
+
+    @property
+    def count(self):
+        """Amount of stamps rendered."""
+        return len(self._stamps)
+
+
+class ParticleArrays:
+    """Structure-of-arrays storage for particles. Every field lives in a
+    preallocated NumPy array of `capacity` slots; live particles are packed
+    in the first `count` slots, so emission, update and culling are done
+    on whole slices instead of one Python object per particle.
+
+    Args:
+        capacity (int): Maximum amount of live particles.
+    """
+    __slots__ = ('_capacity', '_count', '_pos', '_vel', '_life', '_max_life', '_size',
+                 '_color', '_gravity', '_fade')
+
+    def __init__(self, capacity):
+        self._capacity = capacity
+        self._count = 0
+        self._pos = np.zeros((capacity, 2), dtype=np.float32)
+        self._vel = np.zeros((capacity, 2), dtype=np.float32)
+        self._life = np.zeros(capacity, dtype=np.float32)
+        self._max_life = np.ones(capacity, dtype=np.float32)
+        self._size = np.zeros(capacity, dtype=np.float32)
+        self._color = np.zeros((capacity, 3), dtype=np.float32)
+        self._gravity = np.zeros(capacity, dtype=np.float32)
+        self._fade = np.zeros(capacity, dtype=np.bool_)
+
+    def _reserve(self, count):
+        """Returns the slice of the next `count` free slots, clamped to the
+        remaining capacity."""
+        count = min(count, self._capacity - self._count)
+        start = self._count
+        self._count += count
+        return slice(start, start + count), count
+
+    @staticmethod
+    def _colors(color, count):
+        """Returns a (count, 3) array of colors picked from `color`."""
+        if isinstance(color, list):
+            palette = np.asarray(color, dtype=np.float32)
+            return palette[RNG["particles"].array_integers(0, len(color), count)]
+        return np.asarray(color, dtype=np.float32)
+
+    def emit(self, x, y, count, vel_range, color, size_range, life_range,
+             spread_angle=360, fade=True, gravity=0):
+        """Emit particles from a point. See `ParticleEmitter.emit`."""
+        slots, count = self._reserve(count)
+        if count <= 0:
+            return
+        rolls = RNG["particles"]
+        angle = rolls.uniforms(0, spread_angle, count) * np.pi / 180
+        speed = rolls.uniforms(vel_range[0], vel_range[1], count)
+        self._pos[slots] = (x, y)
+        self._vel[slots, 0] = np.cos(angle) * speed
+        self._vel[slots, 1] = np.sin(angle) * speed
+        self._color[slots] = self._colors(color, count)
+        self._size[slots] = rolls.uniforms(size_range[0], size_range[1], count)
+        life = rolls.uniforms(life_range[0], life_range[1], count)
+        self._life[slots] = life
+        self._max_life[slots] = life
+        self._gravity[slots] = gravity
+        self._fade[slots] = fade
+
+    def emit_line(self, x1, y1, x2, y2, particle_count, color, size_range,
+                  life_range, fade=True):
+        """Emit particles along a line. See `ParticleEmitter.emit_line`."""
+        slots, count = self._reserve(particle_count)
+        if count <= 0:
+            return
+        rolls = RNG["particles"]
+        t = np.arange(count) / max(1, count - 1)
+        t = np.clip(t + rolls.uniforms(-0.05, 0.05, count), 0, 1)
+        dx = x2 - x1
+        dy = y2 - y1
+        px = x1 + dx * t
+        py = y1 + dy * t
+        length = math.hypot(dx, dy)
+        if length > 0:
+            offset = rolls.uniforms(-3, 3, count)
+            px += -dy / length * offset
+            py += dx / length * offset
+        self._pos[slots, 0] = px
+        self._pos[slots, 1] = py
+        self._vel[slots] = rolls.uniforms(-0.5, 0.5, (count, 2))
+        self._color[slots] = self._colors(color, count)
+        self._size[slots] = rolls.uniforms(size_range[0], size_range[1], count)
+        life = rolls.uniforms(life_range[0], life_range[1], count)
+        self._life[slots] = life
+        self._max_life[slots] = life
+        self._gravity[slots] = 0
+        self._fade[slots] = fade
+
+    def tick(self, delta=0.016):
+        """Updates every live particle, then packs the survivors by
+        moving the live particles of the tail into the dead slots."""
+        n = self._count
+        if n == 0:
+            return
+        self._pos[:n] += self._vel[:n]
+        self._vel[:n, 1] += self._gravity[:n]
+        self._life[:n] -= delta
+        alive = self._life[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            holes = np.flatnonzero(~alive[:remaining])
+            movers = np.flatnonzero(alive[remaining:]) + remaining
+            for field in (self._pos, self._vel, self._life, self._max_life, self._size,
+                          self._color, self._gravity, self._fade):
+                field[holes] = field[movers]
+        self._count = remaining
+
+    def visible(self, camera_x, camera_y, margin=50):
+        """Returns the indices of the particles on screen."""
+        n = self._count
+        sx = self._pos[:n, 0] - camera_x
+        sy = self._pos[:n, 1] - camera_y
+        mask = (sx >= -margin) & (sx <= SCREEN_WIDTH + margin) &\
+            (sy >= -margin) & (sy <= SCREEN_HEIGHT + margin)
+        return np.flatnonzero(mask)
+
+    def alphas(self, indices):
+        """Returns the alpha of the given particles, based on their lifetime."""
+        ratio = self._life[indices] / self._max_life[indices]
+        return np.where(self._fade[indices], 255 * ratio, 255).astype(np.int32)
+
+    def draw(self, surface, camera_x, camera_y, stamps=None):
+        """Draws the visible particles. When an atlas of stamps is given,
+        every particle is blitted at once instead of drawn one by one."""
+        indices = self.visible(camera_x, camera_y)
+        if indices.size == 0:
+            return
+        xs = (self._pos[indices, 0] - camera_x).astype(np.int32)
+        ys = (self._pos[indices, 1] - camera_y).astype(np.int32)
+        alphas = self.alphas(indices)
+        if stamps is not None:
+            size = self._size[indices]
+            radius = np.where(size <= 1, 0, size.astype(np.int32))
+            step = ParticleStamps.COLOR_STEP
+            colors = np.minimum((self._color[indices].astype(np.int32) + step // 2) & ~(step - 1),
+                                255)
+            buckets = alphas >> ParticleStamps.ALPHA_SHIFT
+            keys = zip(radius.tolist(), colors[:, 0].tolist(), colors[:, 1].tolist(),
+                       colors[:, 2].tolist(), buckets.tolist())
+            positions = zip((xs - radius).tolist(), (ys - radius).tolist())
+            cached = stamps.stamps.get
+            render = stamps.get
+            batch = [(cached(key) or render(key), pos)
+                     for key, pos in zip(keys, positions) if key[4] > 0]
+            stamps.blits(surface, batch)
+            return
+        width = surface.get_width()
+        height = surface.get_height()
+        colors = self._color[indices].astype(np.int32).tolist()
+        for x, y, size, color, alpha in zip(xs.tolist(), ys.tolist(), self._size[indices].tolist(),
+                                            colors, alphas.tolist()):
+            color.append(alpha)
+            if size <= 1:
+                if 0 <= x < width and 0 <= y < height:
+                    surface.set_at((x, y), color)
+            else:
+                surface.draw_circle(color, (x, y), int(size))
+
+    def clear(self):
+        """Remove all particles."""
+        self._count = 0
+
+    @property
+    def count(self):
+        """Current particle count."""
+        return self._count
+
+    @property
+    def capacity(self):
+        """Maximum particle count."""
+        return self._capacity
+
+
 class ParticleEmitter:
-    """Manages a collection of particles."""
-    __slots__ = ('_particles', '_max_particles', '_enabled', '_lightning_cache')
+    """Manages a collection of particles.
 
-    def __init__(self, max_particles=1000):
+    Args:
+        max_particles (int, optional): Maximum amount of live particles.\
+        Defaults to 1000.
+        vectorized (bool, optional): Whether to store the particles in\
+        NumPy arrays (`ParticleArrays`) instead of one `Particle` per\
+        particle. Defaults to `False`.
+        batched (bool, optional): Whether to draw the particles with a\
+        single `blits` of pre-rendered stamps (`ParticleStamps`) instead\
+        of one draw call per particle. Defaults to `False`.
+    """
+    __slots__ = ('_particles', '_max_particles', '_enabled', '_lightning_cache', '_arrays',
+                 '_stamps', '_lightning_pixels')
+
+    def __init__(self, max_particles=1000, vectorized=False, batched=False):
         self._particles = []
         self._max_particles = max_particles
         self._enabled = True
-        self._lightning_cache = {}  # Cache lightning segments by (x1, y1, x2, y2) key
+        self._lightning_cache = OrderedDict()
+        self._lightning_pixels = 0
+        self._arrays = ParticleArrays(max_particles) if vectorized else None
+        self._stamps = ParticleStamps() if batched else None
 
     def emit(self, x, y, count, vel_range, color, size_range, life_range,
              spread_angle=360, fade=True, gravity=0):
@@ -79,20 +349,27 @@ class ParticleEmitter:
         """
         if not self._enabled:
             return
+        if self._arrays is not None:
+            count = min(count, self._max_particles - self._arrays.count)
+            if count > 0:
+                self._arrays.emit(x, y, count, vel_range, color, size_range, life_range,
+                                  spread_angle, fade, gravity)
+            return
         if len(self._particles) >= self._max_particles:
             return
         count = min(count, self._max_particles - len(self._particles))
+        rolls = RNG["particles"]
         for _ in range(count):
-            angle = np.random.uniform(0, spread_angle) * np.pi / 180
-            speed = np.random.uniform(*vel_range)
+            angle = rolls.uniform(0, spread_angle) * np.pi / 180
+            speed = rolls.uniform(*vel_range)
             vx = np.cos(angle) * speed
             vy = np.sin(angle) * speed
             if isinstance(color, list):
-                particle_color = color[np.random.randint(0, len(color))]
+                particle_color = color[rolls.integers(0, len(color))]
             else:
                 particle_color = color
-            size = np.random.uniform(*size_range)
-            life = np.random.uniform(*life_range)
+            size = rolls.uniform(*size_range)
+            life = rolls.uniform(*life_range)
             particle = Particle(x, y, vx, vy, particle_color, size, life, fade, gravity)
             self._particles.append(particle)
 
@@ -110,12 +387,19 @@ class ParticleEmitter:
         """
         if not self._enabled:
             return
+        if self._arrays is not None:
+            particle_count = min(particle_count, self._max_particles - self._arrays.count)
+            if particle_count > 0:
+                self._arrays.emit_line(x1, y1, x2, y2, particle_count, color, size_range,
+                                       life_range, fade)
+            return
         if len(self._particles) >= self._max_particles:
             return
         count = min(particle_count, self._max_particles - len(self._particles))
+        rolls = RNG["particles"]
         for i in range(count):
             t = i / max(1, count - 1)
-            jitter = np.random.uniform(-0.05, 0.05)
+            jitter = rolls.uniform(-0.05, 0.05)
             t = max(0, min(1, t + jitter))
             x = x1 + (x2 - x1) * t
             y = y1 + (y2 - y1) * t
@@ -125,26 +409,40 @@ class ParticleEmitter:
             if length > 0:
                 perp_x = -dy / length
                 perp_y = dx / length
-                offset = np.random.uniform(-3, 3)
+                offset = rolls.uniform(-3, 3)
                 x += perp_x * offset
                 y += perp_y * offset
-            vx = np.random.uniform(-0.5, 0.5)
-            vy = np.random.uniform(-0.5, 0.5)
+            vx = rolls.uniform(-0.5, 0.5)
+            vy = rolls.uniform(-0.5, 0.5)
             if isinstance(color, list):
-                particle_color = color[np.random.randint(0, len(color))]
+                particle_color = color[rolls.integers(0, len(color))]
             else:
                 particle_color = color
-            size = np.random.uniform(*size_range)
-            life = np.random.uniform(*life_range)
+            size = rolls.uniform(*size_range)
+            life = rolls.uniform(*life_range)
             particle = Particle(x, y, vx, vy, particle_color, size, life, fade, 0)
             self._particles.append(particle)
 
-    def tick(self):
-        """Update all particles."""
+    def tick(self, delta=0.016):
+        """Update all particles and lightning arcs. Called once per\
+        simulation step, so their speed does not depend on the frame rate.
+
+        Args:
+            delta (float, optional): Duration of the step in seconds.\
+            Defaults to 0.016.
+        """
+        for i in PARTICULE_TRACKER:
+            i[4] -= delta
+        PARTICULE_TRACKER[:] = [i for i in PARTICULE_TRACKER if i[4] > 0]
         if not self._enabled:
             self._particles.clear()
+            if self._arrays is not None:
+                self._arrays.clear()
+            return
+        if self._arrays is not None:
+            self._arrays.tick(delta)
             return
-        self._particles = [p for p in self._particles if p.tick()]
+        self._particles = [p for p in self._particles if p.tick(delta)]
 
 
     def draw(self, surface):
@@ -159,22 +457,36 @@ class ParticleEmitter:
             camera_x, camera_y = SYSTEM["level"].map.camera_offset
         else:
             camera_x, camera_y = 0, 0
-        for particle in self._particles:
-            if not particle.is_on_screen():
-                continue
-            color = list(particle.color) + [particle.get_alpha()]
-            screen_x = int(particle.pos.x - camera_x)
-            screen_y = int(particle.pos.y - camera_y)
-            if particle.size <= 1:
-                if 0 <= screen_x < surface.get_width() and 0 <= screen_y < surface.get_height():
-                    surface.set_at((screen_x, screen_y), color)
-            else:
-                surface.draw_circle(color, (screen_x, screen_y), int(particle.size))
+        if self._arrays is not None:
+            self._arrays.draw(surface, camera_x, camera_y, self._stamps)
+        elif self._stamps is not None:
+            batch = []
+            for particle in self._particles:
+                if not particle.is_on_screen():
+                    continue
+                key = ParticleStamps.quantize(particle.size, particle.color,
+                                              particle.get_alpha())
+                if key[4] <= 0:
+                    continue
+                batch.append((self._stamps.get(key), (int(particle.pos.x - camera_x) - key[0],
+                                                      int(particle.pos.y - camera_y) - key[0])))
+            self._stamps.blits(surface, batch)
+        else:
+            for particle in self._particles:
+                if not particle.is_on_screen():
+                    continue
+                color = list(particle.color) + [particle.get_alpha()]
+                screen_x = int(particle.pos.x - camera_x)
+                screen_y = int(particle.pos.y - camera_y)
+                if particle.size <= 1:
+                    if 0 <= screen_x < surface.get_width() and\
+                        0 <= screen_y < surface.get_height():
+                        surface.set_at((screen_x, screen_y), color)
+                else:
+                    surface.draw_circle(color, (screen_x, screen_y), int(particle.size))
         for i in PARTICULE_TRACKER:
             # i = [x1, y1, x2, y2, remaining_lifetime, max_lifetime]
             self.draw_lightning(i[0], i[1], i[2], i[3], surface, camera_x, camera_y, i[4], i[5])
-            i[4] -= 0.016
-        PARTICULE_TRACKER[:] = [i for i in PARTICULE_TRACKER if i[4] > 0]
 
     def rotate(self, x1, y1, x2, y2, angle):
         """Rotate a point counterclockwise by a given angle around a given origin.  
@@ -185,9 +497,85 @@ class ParticleEmitter:
         qy = oy + math.sin(angle) * (px - ox) + math.cos(angle) * (py - oy)
         return (qx, qy)
 
-    def draw_lightning(self, x1, y1, x2, y2, surface, camera_x=0, camera_y=0, remaining_lifetime=1.0, max_lifetime=1.0):
-        """Draw a lightning arc between two points (cached for stability).
-        
+    def _lightning_segments(self, length, rng):
+        """Generates the segments of a lightning arc going from (0, 0) to (length, 0)."""
+        segments = [Segment(0, 0, length, 0)]
+        offset_amount = max(3.0, length * 0.1)
+        iterations = 4
+        for _ in range(iterations):
+            new_segs = []
+            for seg in segments:
+                mid_x = (seg.start.x + seg.end.x) / 2.0
+                mid_y = (seg.start.y + seg.end.y) / 2.0
+                dx = seg.end.x - seg.start.x
+                dy = seg.end.y - seg.start.y
+                seg_length = math.hypot(dx, dy)
+                if seg_length != 0:
+                    perp_x = -dy / seg_length
+                    perp_y = dx / seg_length
+                else:
+                    perp_x = perp_y = 0
+                # Reduced displacement factor for straighter main line
+                displacement = rng.uniform(-offset_amount, offset_amount) * 0.5
+                mid_x += perp_x * displacement
+                mid_y += perp_y * displacement
+                new_segs.append(Segment(seg.start.x, seg.start.y, mid_x, mid_y))
+                new_segs.append(Segment(mid_x, mid_y, seg.end.x, seg.end.y))
+                # Add lightning branches (keep these more prominent for visual interest)
+                dir_x = mid_x - seg.start.x
+                dir_y = mid_y - seg.start.y
+                random_angle = rng.uniform(-0.3, 0.3)
+                cos_a = math.cos(random_angle)
+                sin_a = math.sin(random_angle)
+                rotated_x = (dir_x * cos_a - dir_y * sin_a) * 0.7
+                rotated_y = (dir_x * sin_a + dir_y * cos_a) * 0.7
+                new_segs.append(Segment(mid_x, mid_y, mid_x + rotated_x, mid_y + rotated_y))
+            segments = new_segs
+            offset_amount /= 2.0
+        return segments
+
+    def _lightning_surface(self, length_bucket, angle_bucket):
+        """Returns the pre-rendered arc of the given length and angle buckets, as
+        a (surface, anchor) tuple where anchor is the position of the arc's
+        origin inside the surface. Arcs are kept in a bounded LRU."""
+        key = (length_bucket, angle_bucket)
+        cached = self._lightning_cache.get(key)
+        if cached is not None:
+            self._lightning_cache.move_to_end(key)
+            return cached
+        rng = np.random.default_rng(key)
+        segments = self._lightning_segments(length_bucket * LIGHTNING_LENGTH_STEP, rng)
+        xs = [c for seg in segments for c in (seg.start.x, seg.end.x)]
+        ys = [c for seg in segments for c in (seg.start.y, seg.end.y)]
+        pad = 2
+        left = min(xs) - pad
+        top = min(ys) - pad
+        width = int(max(xs) - left) + pad
+        height = int(max(ys) - top) + pad
+        sfc = Surface(width, height)
+        for seg in segments:
+            sfc.draw_line((255, 255, 0, 255), (seg.start.x - left, seg.start.y - top),
+                          (seg.end.x - left, seg.end.y - top), 2)
+        angle = math.radians(angle_bucket * LIGHTNING_ANGLE_STEP)
+        vx = -left - width / 2
+        vy = -top - height / 2
+        sfc.rotate(-math.degrees(angle))
+        anchor = (sfc.get_width() / 2 + vx * math.cos(angle) - vy * math.sin(angle),
+                  sfc.get_height() / 2 + vx * math.sin(angle) + vy * math.cos(angle))
+        cached = (sfc, anchor)
+        self._lightning_cache[key] = cached
+        self._lightning_pixels += sfc.get_width() * sfc.get_height()
+        while len(self._lightning_cache) > LIGHTNING_CACHE_SIZE or\
+            (self._lightning_pixels > LIGHTNING_CACHE_PIXELS and len(self._lightning_cache) > 1):
+            _, (old, _) = self._lightning_cache.popitem(last=False)
+            self._lightning_pixels -= old.get_width() * old.get_height()
+        return cached
+
+    def draw_lightning(self, x1, y1, x2, y2, surface, camera_x=0, camera_y=0,
+                       remaining_lifetime=1.0, max_lifetime=1.0):
+        """Draw a lightning arc between two points. Arcs are generated for a quantized
+        length and angle, rendered once and reused for every arc in the same buckets.
+
         Args:
             x1, y1, x2, y2: World space coordinates
             surface: Surface to draw on
@@ -195,82 +583,27 @@ class ParticleEmitter:
             remaining_lifetime: Current lifetime remaining
             max_lifetime: Maximum lifetime for fade calculation
         """
-        # Create a cache key using exact coordinates to avoid precision issues
-        # Convert to int for better cache consistency across the map
-        cache_key = (int(x1), int(y1), int(x2), int(y2))
-        
-        # Generate segments once and cache them (in world space)
-        if cache_key not in self._lightning_cache:
-            # Use coordinates as seed for deterministic randomization
-            seed_value = (int(x1) * 73856093 ^ int(y1) * 19349663 ^ int(x2) * 83492791 ^ int(y2) * 42451971) & 0xffffffff
-            np.random.seed(seed_value)
-            
-            segments = [Segment(x1, y1, x2, y2)]
-            offset_amount = max(3.0, np.hypot(x2 - x1, y2 - y1) * 0.1)  # Reduced from 0.25 to 0.1
-            iterations = 4
-            for _ in range(iterations):
-                new_segs = []
-                for seg in segments:
-                    mid_x = (seg.start.x + seg.end.x) / 2.0
-                    mid_y = (seg.start.y + seg.end.y) / 2.0
-                    dx = seg.end.x - seg.start.x
-                    dy = seg.end.y - seg.start.y
-
-                    length = np.hypot(dx, dy)
-                    if length != 0:
-                        perp_x = -dy / length
-                        perp_y = dx / length
-                    else:
-                        perp_x = perp_y = 0
-                    # Reduced displacement factor for straighter main line
-                    displacement = np.random.uniform(-offset_amount, offset_amount) * 0.5
-                    mid_x += perp_x * displacement
-                    mid_y += perp_y * displacement
-                    new_segs.append(Segment(seg.start.x, seg.start.y, mid_x, mid_y))
-                    new_segs.append(Segment(mid_x, mid_y, seg.end.x, seg.end.y))
-
-                    # Add lightning branches (keep these more prominent for visual interest)
-                    dir_x = mid_x - seg.start.x
-                    dir_y = mid_y - seg.start.y
-
-                    random_angle = np.random.uniform(-0.3, 0.3)
-                    cos_a = np.cos(random_angle)
-                    sin_a = np.sin(random_angle)
-                    rotated_x = dir_x * cos_a - dir_y * sin_a
-                    rotated_y = dir_x * sin_a + dir_y * cos_a
-
-                    length_scale = 0.7
-                    rotated_x *= length_scale
-                    rotated_y *= length_scale
-
-                    split_end_x = mid_x + rotated_x
-                    split_end_y = mid_y + rotated_y
-                    new_segs.append(Segment(mid_x, mid_y, split_end_x, split_end_y))
-                segments = new_segs
-                offset_amount /= 2.0
-            self._lightning_cache[cache_key] = segments
-        
-        # Calculate alpha based on lifetime
+        dx = x2 - x1
+        dy = y2 - y1
+        length_bucket = max(1, round(math.hypot(dx, dy) / LIGHTNING_LENGTH_STEP))
+        angle_bucket = round(math.degrees(math.atan2(dy, dx)) / LIGHTNING_ANGLE_STEP)\
+            % (360 // LIGHTNING_ANGLE_STEP)
+        sfc, anchor = self._lightning_surface(length_bucket, angle_bucket)
         if max_lifetime > 0:
             alpha = int(255 * (remaining_lifetime / max_lifetime))
         else:
             alpha = 255
-        alpha = max(0, min(255, alpha))  # Clamp to 0-255
-        
-        # Draw cached segments with camera offset and fade applied
-        segments = self._lightning_cache[cache_key]
-        for seg in segments:
-            screen_x1 = seg.start.x - camera_x
-            screen_y1 = seg.start.y - camera_y
-            screen_x2 = seg.end.x - camera_x
-            screen_y2 = seg.end.y - camera_y
-            surface.draw_line((255, 255, 0, alpha), (screen_x1, screen_y1), (screen_x2, screen_y2), 2)
+        sfc.set_alpha(max(0, min(255, alpha)))
+        surface.blit(sfc, (x1 - camera_x - anchor[0], y1 - camera_y - anchor[1]))
 
     def clear(self):
         """Remove all particles."""
         self._particles.clear()
+        if self._arrays is not None:
+            self._arrays.clear()
         PARTICULE_TRACKER.clear()
         self._lightning_cache.clear()
+        self._lightning_pixels = 0
 
     @property
     def enabled(self):
@@ -283,8 +616,40 @@ class ParticleEmitter:
         self._enabled = value
         if not value:
             self._particles.clear()
+            if self._arrays is not None:
+                self._arrays.clear()
 
     @property
     def count(self):
         """Current particle count."""
+        if self._arrays is not None:
+            return self._arrays.count
         return len(self._particles)
+
+    @property
+    def max_particles(self):
+        """Returns the maximum amount of live particles."""
+        return self._max_particles
+
+    @max_particles.setter
+    def max_particles(self, value):
+        """Sets the particle budget. Live particles above it are kept until\
+        they die, but no new ones are emitted."""
+        self._max_particles = max(0, int(value))
+
+    @property
+    def vectorized(self):
+        """Returns whether the particles are stored in NumPy arrays."""
+        return self._arrays is not None
+
+    @property
+    def batched(self):
+        """Returns whether the particles are drawn from pre-rendered stamps."""
+        return self._stamps is not None
+
+    @batched.setter
+    def batched(self, value):
+        if value and self._stamps is None:
+            self._stamps = ParticleStamps()
+        elif not value:
+            self._stamps = None
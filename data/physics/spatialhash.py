@@ -0,0 +1,88 @@
+"""Uniform grid used as a broad phase for collisions. Hitboxes are
+bucketed into fixed-size cells, so a query only has to test the
+hitboxes sharing a cell with it instead of every hitbox in the game."""
+
+from data.physics.hitbox import HitBox
+
+class SpatialHash():
+    """Defines a spatial hash.
+
+    Args:
+        cell_size (int, optional): Size in pixels of a single cell.\
+        Should be around the size of the biggest common hitbox. Defaults to 256.
+    """
+    __slots__ = '_cell_size', '_cells', '_count'
+    def __init__(self, cell_size: int = 256):
+        self._cell_size = cell_size
+        self._cells = {}
+        self._count = 0
+
+    def _span(self, hitbox: HitBox) -> tuple[int, int, int, int]:
+        """Returns the range of cells covered by the hitbox."""
+        size = self._cell_size
+        return (int(hitbox.left // size), int(hitbox.top // size),
+                int(hitbox.right // size), int(hitbox.bottom // size))
+
+    def clear(self):
+        """Empties the grid. Cells are kept so they can be reused."""
+        for bucket in self._cells.values():
+            bucket.clear()
+        self._count = 0
+
+    def insert(self, item, hitbox: HitBox):
+        """Inserts an item in every cell its hitbox overlaps.
+
+        Args:
+            item (any): Object returned by the queries.
+            hitbox (HitBox): Hitbox of the object.
+        """
+        entry = (self._count, item)
+        self._count += 1
+        cells = self._cells
+        x_min, y_min, x_max, y_max = self._span(hitbox)
+        for cx in range(x_min, x_max + 1):
+            for cy in range(y_min, y_max + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [entry]
+                else:
+                    bucket.append(entry)
+
+    def rebuild(self, items: list, hitboxes: list):
+        """Clears the grid and inserts all the items at once.
+
+        Args:
+            items (list): Objects to insert.
+            hitboxes (list): Hitboxes of the objects, in the same order.
+        """
+        self.clear()
+        for item, hitbox in zip(items, hitboxes):
+            self.insert(item, hitbox)
+
+    def query(self, hitbox: HitBox) -> list:
+        """Returns the items sharing at least a cell with the hitbox,
+        in insertion order. This is only a broad phase: the items still
+        have to be tested with `HitBox.is_colliding`."""
+        cells = self._cells
+        x_min, y_min, x_max, y_max = self._span(hitbox)
+        if x_min == x_max and y_min == y_max:
+            bucket = cells.get((x_min, y_min))
+            return [item for _, item in bucket] if bucket else []
+        found = {}
+        for cx in range(x_min, x_max + 1):
+            for cy in range(y_min, y_max + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    for order, item in bucket:
+                        found[order] = item
+        return [found[order] for order in sorted(found)]
+
+    @property
+    def cell_size(self) -> int:
+        """Returns the size of a cell."""
+        return self._cell_size
+
+    @property
+    def count(self) -> int:
+        """Returns the amount of items in the grid."""
+        return self._count
@@ -0,0 +1,233 @@
+"""Input sources of the main loop. The live source reads the keyboard and
+mouse; the recorder also writes every frame to a file, and the replay reads
+them back. A frame holds the inputs and the time it lasted, so that with the
+seeded random streams and the fixed timestep, a replay plays exactly the same
+game as the recording.
+
+File format, little endian: a header (magic, version, seed, length of the
+key names, key names separated by null bytes), then one 25 bytes record per
+frame (elapsed seconds as a double, key bitmask, mouse x and y as floats,
+button and quit bits, the two last wheel moves)."""
+
+import struct
+import time
+
+from data.api.surface import get_press, get_events
+from data.api.keycodes import KEY_EVENT, MOUSEWHEEL, QUIT, get_key_event
+from data.constants import screen_mouse_position
+from data.numerics.rng import RNG
+
+MAGIC = b"GREP"
+VERSION = 1
+HEADER = struct.Struct("<4sHQH")
+FRAME = struct.Struct("<dIffBbbbb")
+QUIT_BIT = 8
+
+class InputFrame():
+    """Defines the inputs of a frame.
+
+    Args:
+        elapsed (float): Duration of the frame in seconds.
+        keys (set[str]): Key events held, see `KEY_EVENT`.
+        mouse (tuple[float, float]): Mouse position on the screen.
+        buttons (tuple[bool, bool, bool]): Left, middle and right buttons.
+        wheel (list[tuple[int, int]]): Two last wheel moves of the frame.
+        quit_game (bool, optional): Whether or not the window was closed.\
+        Defaults to False.
+        events (list, optional): Raw events of the frame, only for live\
+        inputs. Defaults to None.
+    """
+    __slots__ = 'elapsed', 'keys', 'mouse', 'buttons', 'wheel', 'quit_game', 'events'
+    def __init__(self, elapsed: float, keys: set, mouse: tuple, buttons: tuple, wheel: list,
+                 quit_game: bool = False, events: list = None):
+        self.elapsed = elapsed
+        self.keys = keys
+        self.mouse = mouse
+        self.buttons = buttons
+        self.wheel = wheel
+        self.quit_game = quit_game
+        self.events = [] if events is None else events
+
+    def pack(self, names: tuple) -> bytes:
+        """Returns the record of the frame.
+
+        Args:
+            names (tuple): Key event of each bit of the mask.
+        """
+        mask = 0
+        for bit, name in enumerate(names):
+            if name in self.keys:
+                mask |= 1 << bit
+        bits = sum(1 << i for i, pressed in enumerate(self.buttons[:3]) if pressed)
+        if self.quit_game:
+            bits |= QUIT_BIT
+        (w0x, w0y), (w1x, w1y) = (tuple(max(-128, min(127, int(v))) for v in move)
+                                  for move in self.wheel)
+        return FRAME.pack(self.elapsed, mask, self.mouse[0], self.mouse[1], bits,
+                          w0x, w0y, w1x, w1y)
+
+    @staticmethod
+    def unpack(data: bytes, names: tuple, offset: int = 0):
+        """Reads a frame from a record.
+
+        Args:
+            data (bytes): Content of the file.
+            names (tuple): Key event of each bit of the mask.
+            offset (int, optional): Position of the record. Defaults to 0.
+        """
+        elapsed, mask, x, y, bits, w0x, w0y, w1x, w1y = FRAME.unpack_from(data, offset)
+        keys = {name for bit, name in enumerate(names) if mask & (1 << bit)}
+        buttons = (bool(bits & 1), bool(bits & 2), bool(bits & 4))
+        return InputFrame(elapsed, keys, (x, y), buttons, [(w0x, w0y), (w1x, w1y)],
+                          bool(bits & QUIT_BIT))
+
+class LiveInput():
+    """Reads the inputs of the player."""
+    __slots__ = '_last_tick', '_frame', '_frames'
+    def __init__(self):
+        self._last_tick = time.perf_counter()
+        self._frame = None
+        self._frames = 0
+
+    def poll(self) -> InputFrame:
+        """Reads the inputs of a new frame."""
+        now = time.perf_counter()
+        elapsed = now - self._last_tick
+        self._last_tick = now
+        mouse = screen_mouse_position()
+        buttons = tuple(get_press())
+        wheel = [(0, 0), (0, 0)]
+        quit_game = False
+        events = get_events()
+        for event in events:
+            if event.type == QUIT:
+                quit_game = True
+            if event.type == MOUSEWHEEL:
+                wheel[0] = wheel[1]
+                wheel[1] = (event.x, event.y)
+        keys = get_key_event(buttons)
+        self._frame = InputFrame(elapsed, keys, mouse, buttons, wheel, quit_game, events)
+        self._frames += 1
+        return self._frame
+
+    def close(self):
+        """Stops reading the inputs."""
+
+    @property
+    def frame(self) -> InputFrame:
+        """Returns the inputs of the current frame."""
+        return self._frame
+
+    @property
+    def elapsed(self) -> float:
+        """Returns the duration of the current frame in seconds."""
+        return 0.0 if self._frame is None else self._frame.elapsed
+
+    @property
+    def frames(self) -> int:
+        """Returns the amount of frames read."""
+        return self._frames
+
+    @property
+    def deterministic(self) -> bool:
+        """Returns whether or not the frames must play the same way each\
+        time, in which case levels are loaded without a thread."""
+        return False
+
+class InputRecorder(LiveInput):
+    """Reads the inputs of the player and writes them to a file.
+
+    Args:
+        path (str): File to write.
+        seed (int, optional): Seed of the random streams. Defaults to None,\
+        picking a new one.
+    """
+    __slots__ = '_file', '_names', '_seed'
+    def __init__(self, path: str, seed: int = None):
+        super().__init__()
+        self._seed = RNG.seed(seed)
+        self._names = tuple(KEY_EVENT)
+        names = "\0".join(self._names).encode()
+        # The file stays open for the whole recording, until `close`.
+        self._file = open(path, "wb") # pylint: disable=consider-using-with
+        try:
+            self._file.write(HEADER.pack(MAGIC, VERSION, self._seed, len(names)) + names)
+        except:
+            self._file.close()
+            raise
+
+    def poll(self) -> InputFrame:
+        frame = super().poll()
+        record = frame.pack(self._names)
+        self._file.write(record)
+        self._frame = InputFrame.unpack(record, self._names)
+        self._frame.events = frame.events
+        return self._frame
+
+    def close(self):
+        self._file.close()
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the recording."""
+        return self._seed
+
+    @property
+    def deterministic(self) -> bool:
+        return True
+
+class InputReplay(LiveInput):
+    """Plays the frames of a recording, then closes the game. The real\
+    duration of each frame is kept, to compare the same game between\
+    versions.
+
+    Args:
+        path (str): File to read.
+    """
+    __slots__ = '_data', '_names', '_offset', '_seed', '_times'
+    def __init__(self, path: str):
+        super().__init__()
+        with open(path, "rb") as file:
+            self._data = file.read()
+        magic, version, seed, length = HEADER.unpack_from(self._data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} recording.")
+        start = HEADER.size
+        self._names = tuple(self._data[start:start + length].decode().split("\0"))
+        self._offset = start + length
+        self._seed = RNG.seed(seed)
+        self._times = []
+
+    def poll(self) -> InputFrame:
+        now = time.perf_counter()
+        if self._frame is not None:
+            self._times.append(now - self._last_tick)
+        self._last_tick = now
+        get_events()
+        if self._offset + FRAME.size > len(self._data):
+            self._frame = InputFrame(0.0, set(), self._frame.mouse if self._frame else (0, 0),
+                                     (False, False, False), [(0, 0), (0, 0)], True)
+            return self._frame
+        self._frame = InputFrame.unpack(self._data, self._names, self._offset)
+        self._offset += FRAME.size
+        self._frames += 1
+        return self._frame
+
+    @property
+    def seed(self) -> int:
+        """Returns the seed of the recording."""
+        return self._seed
+
+    @property
+    def length(self) -> int:
+        """Returns the amount of frames in the recording."""
+        return (len(self._data) - self._offset) // FRAME.size + self._frames
+
+    @property
+    def times(self) -> list[float]:
+        """Returns the real duration in seconds of each played frame."""
+        return self._times
+
+    @property
+    def deterministic(self) -> bool:
+        return True
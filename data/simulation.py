@@ -0,0 +1,164 @@
+"""Headless simulation. Runs a level without any display nor human input,
+as fast as possible, and measures the time spent in each system of the
+game. Used for benchmarks and balance runs.
+
+The display still has to exist for the images to be converted, so the SDL
+dummy video driver is used and the frames are never presented."""
+
+import os
+import time
+
+from data.constants import SYSTEM, ENNEMY_TRACKER, PROJECTILE_TRACKER, POWER_UP_TRACKER,\
+    ANIMATION_TRACKER, TEXT_TRACKER, WAVE_TIMER, WAVE_CHECK
+from data.game.level import Level
+from data.numerics.rng import RNG
+
+MOVES = ("left", "up", "right", "down")
+
+def enable_headless():
+    """Switches SDL to its dummy drivers. Must be called before the engine\
+    is initialised."""
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    os.environ["SDL_AUDIODRIVER"] = "dummy"
+    SYSTEM["headless"] = True
+
+def circling_player(step: int, dt: float) -> list[str]:
+    """Default scripted player: walks in a square, changing side every two\
+    seconds, aims at the closest enemy and keeps casting its main spell.
+
+    Args:
+        step (int): Index of the simulation step.
+        dt (float): Duration of a step.
+
+    Returns:
+        list[str]: The keys held during the step.
+    """
+    player = SYSTEM["player"]
+    if ENNEMY_TRACKER:
+        target = min(ENNEMY_TRACKER, key=lambda e: (e.x - player.x) ** 2 + (e.y - player.y) ** 2)
+        SYSTEM["mouse"] = (target.entity.center_x, target.entity.center_y)
+    return [MOVES[int(step * dt / 2) % len(MOVES)], "spell_L"]
+
+class Simulation():
+    """Runs a level headlessly against a scripted player.
+
+    Args:
+        level (Level, optional): Level to play. Defaults to None, generating\
+        a random one.
+        seed (int, optional): Seed of the random generators. Defaults to 0.
+        script (callable, optional): Called each step with the step index\
+        and its duration, returns the keys held by the player. Defaults to\
+        `circling_player`.
+        render (bool, optional): Whether or not to draw each step into the\
+        (never presented) window, to measure rendering too. Defaults to False.
+        step (float, optional): Simulated duration of a step. Defaults to 0.016.
+    """
+    __slots__ = '_level', '_seed', '_script', '_render', '_step', '_timings', '_steps'
+    def __init__(self, level: Level = None, seed: int = 0, script=None, render: bool = False,
+                 step: float = 0.016):
+        self._level = level
+        self._seed = seed
+        self._script = script if script is not None else circling_player
+        self._render = render
+        self._step = step
+        self._timings = {}
+        self._steps = 0
+
+    def setup(self):
+        """Loads the level synchronously and resets the player."""
+        from data.loading import generate_random_level
+        RNG.seed(self._seed)
+        for tracker in (ENNEMY_TRACKER, PROJECTILE_TRACKER, POWER_UP_TRACKER,
+                        ANIMATION_TRACKER, TEXT_TRACKER):
+            tracker.clear()
+        SYSTEM["player"].reset()
+        if self._level is None:
+            self._level = generate_random_level()
+        SYSTEM["level"] = self._level
+        SYSTEM["keys"] = []
+        self._level.load_level()
+        self._timings.clear()
+        self._steps = 0
+
+    def _timed(self, name: str, function, *args):
+        """Runs a function and adds its duration to the timings."""
+        start = time.perf_counter()
+        function(*args)
+        self._timings[name] = self._timings.get(name, 0.0) + time.perf_counter() - start
+
+    def run(self, seconds: float) -> dict:
+        """Simulates the level for a given duration, or until it ends.
+
+        Args:
+            seconds (float): Simulated duration in seconds.
+
+        Returns:
+            dict: The report of the run, see `report`.
+        """
+        from data.interface.general import LOGIC_SYSTEMS, check_collisions, draw_game
+        from data.interface.gameui import draw_ui
+        from data.interface.render import render_all
+        if self._level is None or SYSTEM["level"] is not self._level:
+            self.setup()
+        level = self._level
+        deltatime = SYSTEM["deltatime"]
+        timed = self._timed
+        start = time.perf_counter()
+        for _ in range(int(seconds / self._step)):
+            if level.finished or SYSTEM["player"].creature.stats["life"].current_value <= 0:
+                break
+            deltatime.tick(self._step * 1000)
+            for event in deltatime.get():
+                if event == WAVE_TIMER:
+                    timed("waves", level.next_wave)
+                elif event == WAVE_CHECK:
+                    timed("waves", level.check_wave)
+            for name, system in LOGIC_SYSTEMS:
+                timed(name, system)
+            keys = self._script(self._steps, self._step)
+            timed("input", SYSTEM["player"].action, keys)
+            timed("collisions", check_collisions)
+            if self._render:
+                player = SYSTEM["player"]
+                SYSTEM["camera"].update(player.x, player.y, level.map.width, level.map.height)
+                timed("draw", level.draw)
+                timed("draw", draw_game)
+                timed("draw", draw_ui)
+                timed("render", render_all)
+            self._steps += 1
+        return self.report(time.perf_counter() - start)
+
+    def report(self, wall_time: float) -> dict:
+        """Returns the results of the run.
+
+        Args:
+            wall_time (float): Real duration of the run.
+
+        Returns:
+            dict: Simulated and real durations, the speedup, the amount of\
+            steps, the state of the level and the average milliseconds per\
+            step of each system.
+        """
+        simulated = self._steps * self._step
+        steps = max(self._steps, 1)
+        return {
+            "simulated": simulated,
+            "wall_time": wall_time,
+            "speedup": simulated / wall_time if wall_time > 0 else 0.0,
+            "steps": self._steps,
+            "wave": self._level.current_wave,
+            "finished": self._level.finished,
+            "enemies": len(ENNEMY_TRACKER),
+            "projectiles": len(PROJECTILE_TRACKER),
+            "systems": {name: total / steps * 1000 for name, total in self._timings.items()}
+        }
+
+    @property
+    def level(self) -> Level:
+        """Returns the simulated level."""
+        return self._level
+
+    @property
+    def timings(self) -> dict:
+        """Returns the total time in seconds spent in each system."""
+        return self._timings
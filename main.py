@@ -1,38 +1,34 @@
 """Game launcher."""
 
-import random
+import argparse
 
-from data.api.surface import Surface, get_press, get_events
-from data.api.keycodes import get_key_event, MOUSEWHEEL, QUIT
+from data.api.surface import Surface
 
 from data.image.text import Text
 from data.constants import *
-from data.interface.gameui import draw_ui
+from data.interface.gameui import draw_ui, draw_profiler
 from data.game.level import Level
 from data.interface.general import setup_bottom_bar, draw_bottom_bar
 from data.interface.inventory import draw_inventory
 from data.interface.spellbook import draw_spells
 from data.interface.skilltree import draw_skills
 from data.interface.options import draw_options
-from data.interface.general import logic_tick, draw_game
+from data.interface.general import logic_tick, draw_game, check_collisions
 from data.interface.gear import draw_gear
 from data.loading import init_game, init_timers
 from data.interface.render import render_all, render, renders
 from data.interface.endlevel import draw_end
-from data.components.projectiles.projectile import Projectile
-from data.components.slashes.slash import Slash
 from data.tables.uniques_table import UNIQUES
 from data.game.item import Item
 from data.tables.implicits_table import IMPLICITS
-from data.loading import get_memory_usage
-
-DAMAGE_COLOR = (255, 30, 30)
+from data.numerics.rng import RNG
+from data.replay import InputRecorder, InputReplay
 
 def debug_create_items():
     """Creates a bunch of items."""
     base_loot = []
     for _ in range(30):
-        base_loot.append(SYSTEM["looter"].generate_item(5, random.randint(0,3)))
+        base_loot.append(SYSTEM["looter"].generate_item(5, RNG["loot"].randint(0,3)))
     SYSTEM["player"].inventory.extend(base_loot)
     SYSTEM["player"].inventory.extend([f[0] for f in UNIQUES])
     man = Item("Old blue potion", "Mana Extract", 100, 0, 1, SYSTEM["images"]["mana"][0],\
@@ -44,78 +40,28 @@ def debug_create_items():
     SYSTEM["player"].creature.equip(Flags.MANA_POT, man)
     SYSTEM["player"].creature.equip(Flags.LIFE_POT, lif)
 
-def check_collisions():
-    """Checks all collisions."""
-    for proj in PROJECTILE_TRACKER:
-        if proj.ignore_team or proj.evil: #check for player
-            if proj.hitbox.is_colliding(SYSTEM["player"].entity.hitbox):
-                if proj in SYSTEM["player"].immune:
-                    continue
-                if isinstance(proj, Projectile) and proj.effective:
-                    dmg, crit = proj.on_hit(SYSTEM["player"].creature, SYSTEM["player"].entity)
-                    if dmg is None or crit is None:
-                        continue
-                    SYSTEM["text_generator"].generate_damage_text(SYSTEM["player"].x,\
-                                                                  SYSTEM["player"].y,\
-                                                                DAMAGE_COLOR, crit, dmg)
-                    if proj.can_be_destroyed():
-                        continue
-                elif isinstance(proj, Slash) and proj.effective:
-                    dmg, crit = proj.on_hit(SYSTEM["player"].creature, SYSTEM["player"].entity)
-                    if dmg is None or crit is None:
-                        continue
-                    SYSTEM["text_generator"].generate_damage_text(SYSTEM["player"].x,\
-                                                                  SYSTEM["player"].y,\
-                                                                DAMAGE_COLOR, crit, dmg)
-                    if proj.finished:
-                        continue
-        elif proj.ignore_team or not proj.evil: #Check for each enemy
-            for enemy in ENNEMY_TRACKER:
-                if proj.hitbox.is_colliding(enemy.entity.hitbox):
-                    if proj in enemy.immune:
-                        continue
-                    if isinstance(proj, Projectile) and proj.effective:
-                        dmg, crit = proj.on_hit(enemy.creature, enemy.entity)
-                        if dmg is None or crit is None:
-                            continue
-                        SYSTEM["text_generator"].generate_damage_text(enemy.x,\
-                                                                    enemy.y,\
-                                                                    DAMAGE_COLOR, crit, dmg)
-                        if proj.can_be_destroyed():
-                            continue
-                    elif isinstance(proj, Slash) and proj.effective:
-                        dmg, crit = proj.on_hit(enemy.creature, enemy.entity)
-                        if dmg is None or crit is None:
-                            continue
-                        SYSTEM["text_generator"].generate_damage_text(enemy.x,\
-                                                                    enemy.y,\
-                                                                    DAMAGE_COLOR, crit, dmg)
-                        if proj.finished:
-                            continue
-
 def game_loop(keys, time_event):
     """Main game loop."""
     #Handle Events
     for event in time_event:
-        if event == QUIT:
-            SYSTEM["playing"] = False
         if event == WAVE_TIMER:
             SYSTEM["level"].next_wave()
         if event == WAVE_CHECK:
             SYSTEM["level"].check_wave()
-        if event == TICKER_TIMER:
-            logic_tick()
+    profiler = SYSTEM["profiler"]
+    for _ in range(SYSTEM["fixed_step"].advance(SYSTEM["inputs"].elapsed)):
+        profiler.call("logic_tick", logic_tick)
+        profiler.call("player_action", SYSTEM["player"].action, keys)
+        profiler.call("check_collisions", check_collisions)
     player_x = SYSTEM["player"].x
     player_y = SYSTEM["player"].y
     world_width = SYSTEM["level"].map.width
     world_height = SYSTEM["level"].map.height
     SYSTEM["camera"].update(player_x, player_y, world_width, world_height)
-    SYSTEM["level"].draw()
-    draw_game()
-    draw_ui()
-    #Handle logic
-    SYSTEM["player"].action(keys)
-    check_collisions()
+    profiler.call("draw_level", SYSTEM["level"].draw)
+    profiler.call("draw_game", draw_game)
+    profiler.call("draw_ui", draw_ui)
+    draw_profiler()
     if SYSTEM["player"].creature.stats["life"].current_value <= 0:
         SYSTEM["level"].fail_level()
 
@@ -182,10 +128,14 @@ def loading():
 def main_loop():
     """Main loop. Temporary"""
     while SYSTEM["playing"]:
-        print(f"Memory: {get_memory_usage():.1f} MB", end='\r')
+        SYSTEM["profiler"].enabled = SYSTEM["options"]["profiler"]
+        SYSTEM["metrics"].logging = SYSTEM["options"]["profiler"]
+        SYSTEM["profiler"].next_frame()
+        frame = SYSTEM["inputs"].poll()
+        if frame.quit_game:
+            SYSTEM["playing"] = False
         SYSTEM["mouse_target"] = None
-        SYSTEM["deltatime"].tick()
-        SYSTEM["particle_emitter"].tick()
+        SYSTEM["deltatime"].tick(frame.elapsed * 1000)
         if SYSTEM["game_state"] == LOADING:
             loading()
             continue
@@ -193,23 +143,17 @@ def main_loop():
             SYSTEM["post_effects"].tick()
             continue
         SYSTEM["pop_up"] = None
-        get_mouse_pos()
-        SYSTEM["mouse_click"] = get_press()
+        get_mouse_pos(frame.mouse)
+        SYSTEM["mouse_click"] = frame.buttons
         if SYSTEM["mouse_click"][0] and not SYSTEM["held"]:
             SYSTEM["held"] = True
             SYSTEM["mouse_previous"] = SYSTEM["mouse"]
         if SYSTEM["held"] and not SYSTEM["mouse_click"][0]:
             SYSTEM["held"] = False
-        SYSTEM["mouse_wheel"] = [(0, 0), (0, 0)]
-        events = get_events()
+        SYSTEM["mouse_wheel"] = list(frame.wheel)
+        events = frame.events
         time_event = SYSTEM["deltatime"].get()
-        for event in events:
-            if event.type == QUIT:
-                SYSTEM["playing"] = False
-            if event.type == MOUSEWHEEL:
-                SYSTEM["mouse_wheel"][0] = SYSTEM["mouse_wheel"][1]
-                SYSTEM["mouse_wheel"][1] = (event.x, event.y)
-        keys = get_key_event()
+        keys = frame.keys
         SYSTEM["keys"] = keys
         if "pause" in keys:
             if SYSTEM["cooldown"] <= 0:
@@ -218,6 +162,7 @@ def main_loop():
                     SYSTEM["game_state"] = GAME_PAUSE
                 elif SYSTEM["game_state"] == GAME_PAUSE:
                     SYSTEM["game_state"] = GAME_LEVEL
+                    SYSTEM["fixed_step"].reset()
         if SYSTEM["game_state"] == GAME_LEVEL:
             game_loop(keys, time_event)
         elif SYSTEM["game_state"] == GAME_PAUSE:
@@ -263,7 +208,7 @@ def main_loop():
                 SYSTEM["rune"] = -1
                 SYSTEM["rune_display"] = None
                 SYSTEM["cooldown"] = 0.8
-        render_all()
+        SYSTEM["profiler"].call("render_all", render_all)
         SYSTEM["post_effects"].tick()
         if SYSTEM["mouse_click"][0] and not SYSTEM["dragging"]:
             SYSTEM["dragging"] = True
@@ -271,7 +216,16 @@ def main_loop():
             SYSTEM["dragging"] = False
 
 if __name__ == "__main__":
-    init_game()
+    parser = argparse.ArgumentParser(description="Gameuh.py")
+    parser.add_argument("--record", metavar="FILE", help="records the inputs of the game")
+    parser.add_argument("--replay", metavar="FILE", help="plays back recorded inputs")
+    parser.add_argument("--seed", type=int, help="seed of the recording")
+    args = parser.parse_args()
+    if args.replay:
+        SYSTEM["inputs"] = InputReplay(args.replay)
+    elif args.record:
+        SYSTEM["inputs"] = InputRecorder(args.record, args.seed)
+    init_game(threaded=SYSTEM["inputs"] is None)
     init_timers()
     while True:
         if not SYSTEM["loaded"]:
@@ -297,6 +251,8 @@ if __name__ == "__main__":
         main_loop()
     except KeyboardInterrupt:
         pass
+    SYSTEM["inputs"].close()
+    SYSTEM["metrics"].stop()
     #profiler.disable()
     #stats = pstats.Stats(profiler).sort_stats("cumtime")
     #stats.print_stats(25)
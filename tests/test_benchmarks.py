@@ -0,0 +1,30 @@
+import unittest
+import os
+import tempfile
+from benchmarks.suite import compare, load_results, save_results
+
+class TestBenchmarkSuite(unittest.TestCase):
+    """Tests for the regression check of the benchmark suite."""
+
+    def test_compare(self):
+        """Test that only the scenarios slower than the threshold are reported."""
+        baseline = {"loot": {"ms_per_frame": 10.0}, "collisions": {"ms_per_frame": 2.0},
+                    "removed": {"ms_per_frame": 1.0}}
+        results = {"loot": {"ms_per_frame": 11.5}, "collisions": {"ms_per_frame": 3.0},
+                   "added": {"ms_per_frame": 50.0}}
+        regressions = compare(results, baseline, 0.2)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith("collisions"))
+        self.assertEqual(len(compare(results, baseline, 0.1)), 2)
+
+    def test_results_round_trip(self):
+        """Test that saved results are loaded back, and a missing file is empty."""
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "results", "baseline.json")
+        self.assertEqual(load_results(path), {})
+        results = {"loot": {"params": [], "frames": 1, "ms_per_frame": 5.0, "ops_per_sec": 2.0}}
+        save_results(path, results)
+        self.assertEqual(load_results(path), results)
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+        os.rmdir(directory)
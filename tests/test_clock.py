@@ -332,6 +332,19 @@ class TestClockBufferBehavior(unittest.TestCase):
         # Should be the most recent
         self.assertNotEqual(first_time, second_time)
 
+    def test_busy_times_exclude_sleep(self):
+        """Test that busy times only count the time before sleeping."""
+        clock = Clock(buffer_size=4)
+        clock.tick(20)
+        for _ in range(4):
+            time.sleep(0.005)
+            clock.tick(20)
+
+        self.assertEqual(len(clock.busy_times), 4)
+        self.assertEqual(clock.frames, 4)
+        self.assertLess(clock.busy_time, 0.03)
+        self.assertGreaterEqual(clock.frame_time, 0.049)
+
 
 class TestClockEdgeCases(unittest.TestCase):
     """Tests for edge cases and boundary conditions."""
@@ -1,6 +1,7 @@
 from data.game.creature import Creature
 from data.numerics.damage import Damage
 from data.numerics.affliction import Affliction
+from data.numerics.expiry import EXPIRY
 from data.constants import Flags
 from data.numerics.affix import Affix
 from data.game.item import Item
@@ -57,6 +58,7 @@ class TestingCreatureDamage(unittest.TestCase):
         bob.tick()
         self.assertEqual(round(bob.stats["life"].current_value), 50)
         for _ in range(500): #Simulates the time ...
+            EXPIRY.advance()
             bob.tick()
         self.assertEqual(len(bob._buffs), 5)
 
@@ -0,0 +1,51 @@
+import unittest
+from data.game.deltatime import DeltaTime, FixedStep
+
+class TestFixedStep(unittest.TestCase):
+    """Tests for the fixed timestep accumulator."""
+
+    def test_speed_does_not_depend_on_frame_rate(self):
+        """Test that one second of frames gives the same steps at any frame rate."""
+        for fps in (30, 60, 75, 144):
+            clock = FixedStep(0.016)
+            steps = sum(clock.advance(1 / fps) for _ in range(fps))
+            self.assertIn(steps, (62, 63))
+
+    def test_remainder_is_kept(self):
+        """Test that time below a step is kept for the next frames."""
+        clock = FixedStep(0.016)
+        self.assertEqual(clock.advance(0.010), 0)
+        self.assertEqual(clock.advance(0.010), 1)
+        self.assertEqual(clock.advance(0.011), 0)
+        self.assertEqual(clock.advance(0.002), 1)
+
+    def test_max_steps(self):
+        """Test that a long frame runs at most max_steps, dropping the rest."""
+        clock = FixedStep(0.016, max_steps=4)
+        self.assertEqual(clock.advance(1.0), 4)
+        self.assertAlmostEqual(clock.dropped, 0.016 * 58)
+        self.assertEqual(clock.advance(0.016), 1)
+        self.assertEqual(clock.steps, 5)
+
+    def test_reset(self):
+        """Test that a reset forgets the accumulated time."""
+        clock = FixedStep(0.016)
+        clock.advance(0.015)
+        clock.reset()
+        self.assertEqual(clock.advance(0.002), 0)
+
+
+class TestDeltaTime(unittest.TestCase):
+    """Tests for the timer handler."""
+
+    def test_simulated_time(self):
+        """Test that timers can be ticked by a given time instead of the real one."""
+        timers = DeltaTime()
+        timers.start("wave", 400)
+        timers.start("once", 100, 1)
+        timers.tick(1000)
+        self.assertEqual(timers.get(), ["wave", "wave", "once"])
+        self.assertIsNone(timers.peek("once"))
+        self.assertAlmostEqual(timers.peek("wave").timer, 200)
+        timers.tick(0)
+        self.assertEqual(timers.get(), [])
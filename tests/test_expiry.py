@@ -0,0 +1,76 @@
+import unittest
+from data.constants import Flags
+from data.game.creature import Creature
+from data.numerics.affliction import Affliction
+from data.numerics.expiry import EXPIRY
+
+class TestExpiryScheduler(unittest.TestCase):
+    """Tests for the expiry of the afflictions."""
+
+    def test_expires_on_due_step(self):
+        """Test that an affliction is called back once, on the step it runs out."""
+        expired = []
+        haste = Affliction("haste", 0.5, 0.1, [Flags.SPEED, Flags.BOON])
+        self.assertTrue(haste.schedule(expired.append))
+        due = haste.expires_at
+        self.assertEqual(due - EXPIRY.now, 7)
+        self.assertAlmostEqual(haste.duration, 0.1)
+        while EXPIRY.now < due - 1:
+            EXPIRY.advance()
+        self.assertEqual(expired, [])
+        self.assertFalse(haste.expired)
+        EXPIRY.advance()
+        self.assertEqual(expired, [haste])
+        self.assertTrue(haste.expired)
+        EXPIRY.advance()
+        self.assertEqual(expired, [haste])
+
+    def test_refresh_skips_stale_entry(self):
+        """Test that a refreshed affliction only expires at its new step."""
+        calls = []
+        burn = Affliction("burn", 1, 0.032, [Flags.FIRE, Flags.HEX])
+        burn.schedule(calls.append)
+        EXPIRY.advance()
+        burn.duration = 0.048
+        due = burn.expires_at
+        EXPIRY.advance()
+        EXPIRY.advance()
+        self.assertEqual(calls, [])
+        EXPIRY.advance()
+        self.assertEqual(EXPIRY.now, due)
+        self.assertEqual(calls, [burn])
+
+    def test_permanent_is_not_scheduled(self):
+        """Test that permanent afflictions are left out of the heap."""
+        pending = EXPIRY.pending
+        gear = Affliction("ring", 5, -1, [Flags.STR, Flags.FLAT])
+        self.assertFalse(gear.schedule(print))
+        self.assertIsNone(gear.expires_at)
+        self.assertEqual(EXPIRY.pending, pending)
+
+    def test_creature_expiry(self):
+        """Test that a creature loses the buff and its stat modifier on expiry."""
+        bob = Creature("Bob")
+        strength = bob.stats["str"].get_value()
+        bob.afflict(Affliction("might", 10, 0.05, [Flags.STR, Flags.FLAT]))
+        self.assertEqual(bob.stats["str"].get_value(), strength + 10)
+        for _ in range(3):
+            EXPIRY.advance()
+            bob.tick()
+        self.assertEqual(len([b for b in bob.buffs if b.name == "might"]), 1)
+        EXPIRY.advance()
+        self.assertEqual(len([b for b in bob.buffs if b.name == "might"]), 0)
+        self.assertEqual(bob.stats["str"].get_value(), strength)
+
+    def test_range_stat_expiry(self):
+        """Test that a timed flat damage buff leaves both bounds of a range stat."""
+        bob = Creature("Bob")
+        base = bob.stats["fire_flat"].get_value()
+        bob.afflict(Affliction("embers", 10, 0.05, [Flags.FIRE_FLAT, Flags.FLAT]))
+        bob.afflict(Affliction("sparks_max", 5, 0.05, [Flags.FIRE_FLAT, Flags.FLAT]))
+        self.assertEqual(bob.stats["fire_flat"].get_value(), (base[0] + 15, base[1] + 10))
+        for _ in range(4):
+            EXPIRY.advance()
+            bob.tick()
+        self.assertEqual(bob.stats["fire_flat"].get_value(), base)
+        self.assertEqual([b for b in bob.buffs if b.name in ("embers", "sparks_max")], [])
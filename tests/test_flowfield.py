@@ -0,0 +1,71 @@
+import unittest
+import numpy as np
+from data.physics.flowfield import FlowField
+
+def wall_map():
+    """Returns a 10x8 map cut by a vertical wall with a gap at the bottom."""
+    obstacles = np.zeros((8, 10), dtype=bool)
+    obstacles[0:7, 5] = True
+    return obstacles
+
+class TestFlowField(unittest.TestCase):
+    """Tests for the flow field pathfinding."""
+
+    def test_distances_go_around_walls(self):
+        """Test that distances follow the walkable tiles."""
+        field = FlowField()
+        field.compute(wall_map(), (8, 0))
+        self.assertEqual(field.distance[0, 8], 0)
+        self.assertEqual(field.distance[0, 6], 2)
+        self.assertEqual(field.distance[0, 4], 7 + 2 + 7 + 2)
+        self.assertTrue(np.isinf(field.distance[3, 5]))
+
+    def test_following_reaches_goal(self):
+        """Test that stepping along the field reaches the goal without crossing walls."""
+        obstacles = wall_map()
+        field = FlowField()
+        field.compute(obstacles, (8, 0))
+        x, y = 1, 0
+        for _ in range(40):
+            dx, dy = field.sample(x, y)
+            if dx == 0 and dy == 0:
+                break
+            x += dx
+            y += dy
+            self.assertFalse(obstacles[y, x])
+        self.assertEqual((x, y), (8, 0))
+
+    def test_no_corner_cutting(self):
+        """Test that diagonals are not taken along a wall corner."""
+        field = FlowField()
+        field.compute(wall_map(), (6, 7))
+        self.assertEqual(field.sample(4, 6), (0, 1))
+
+    def test_sample_many_matches_sample(self):
+        """Test that the vectorized lookup gives the same steps."""
+        field = FlowField()
+        field.update(wall_map(), (64, 64), (8 * 64 + 3, 10))
+        positions = [(10, 10), (300, 400), (639, 511), (-50, 9000), (4 * 64, 3 * 64)]
+        steps = field.sample_many(positions)
+        for pos, step in zip(positions, steps.tolist()):
+            self.assertEqual(field.sample(*pos), tuple(step))
+        self.assertEqual(field.sample(8 * 64 + 10, 20), (0, 0))
+
+    def test_refresh_rate(self):
+        """Test that the field is only recomputed a few times per second."""
+        obstacles = wall_map()
+        field = FlowField(refresh=0.25)
+        self.assertTrue(field.update(obstacles, (64, 64), (10, 10)))
+        self.assertFalse(field.update(obstacles, (64, 64), (200, 10)))
+        for _ in range(15):
+            field.update(obstacles, (64, 64), (200, 10))
+        self.assertEqual(field.goal, (3, 0))
+        self.assertEqual(field.computations, 2)
+        self.assertFalse(field.update(obstacles, (64, 64), (200, 10), 1.0))
+        self.assertTrue(field.update(wall_map(), (64, 64), (200, 10)))
+
+    def test_empty_field(self):
+        """Test that an empty field does not move anybody."""
+        field = FlowField()
+        self.assertEqual(field.sample(10, 10), (0, 0))
+        self.assertEqual(field.sample_many([(1, 2), (3, 4)]).tolist(), [[0, 0], [0, 0]])
@@ -0,0 +1,93 @@
+import unittest
+from data.api.governor import QualityGovernor, QUALITY_LEVELS
+from data.constants import SYSTEM
+from data.physics.particle import ParticleEmitter
+
+class FakeClock():
+    """Clock whose busy times are set by the test."""
+    def __init__(self):
+        self.busy_times = []
+
+    def frames(self, seconds, amount=10):
+        """Fills the buffer with frames of the given duration."""
+        self.busy_times = [seconds] * amount
+
+class TestQualityGovernor(unittest.TestCase):
+    """Tests for the adaptive quality governor."""
+
+    def setUp(self):
+        self.saved = {key: SYSTEM.get(key) for key in ("particle_emitter", "logger")}
+        SYSTEM["particle_emitter"] = ParticleEmitter(max_particles=1000)
+        SYSTEM["logger"] = None
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        SYSTEM.update(self.saved)
+
+    def test_steps_down_under_load(self):
+        """Test that a sustained overload lowers the quality one level at a time."""
+        governor = QualityGovernor(patience=5)
+        self.clock.frames(0.03)
+        changes = sum(governor.update(self.clock, 60) for _ in range(12))
+        self.assertEqual(changes, 2)
+        self.assertEqual(governor.level, 2)
+        self.assertFalse(governor.hitboxes)
+        self.assertEqual(SYSTEM["particle_emitter"].max_particles, 500)
+        self.assertEqual(governor.trail_factor, 2.0)
+
+    def test_single_spike_is_ignored(self):
+        """Test that one slow frame among fast ones changes nothing."""
+        governor = QualityGovernor(patience=1)
+        self.clock.busy_times = [0.005] * 9 + [0.5]
+        self.assertFalse(governor.update(self.clock, 60))
+        self.assertEqual(governor.level, 0)
+
+    def test_restores_with_headroom(self):
+        """Test that the quality comes back after enough fast frames, and restores the budget."""
+        governor = QualityGovernor(recovery=20)
+        governor.set_level(len(QUALITY_LEVELS) - 1)
+        self.assertEqual(SYSTEM["particle_emitter"].max_particles, 100)
+        self.clock.frames(0.004)
+        for _ in range(20 * len(QUALITY_LEVELS)):
+            governor.update(self.clock, 60)
+        self.assertEqual(governor.level, 0)
+        self.assertEqual(SYSTEM["particle_emitter"].max_particles, 1000)
+        self.assertTrue(governor.buff_animations)
+
+    def test_stable_load_keeps_level(self):
+        """Test that a load between both thresholds keeps the level."""
+        governor = QualityGovernor(patience=2, recovery=2)
+        governor.set_level(1)
+        self.clock.frames(0.012)
+        for _ in range(50):
+            self.assertFalse(governor.update(self.clock, 60))
+
+    def test_adjustments_are_logged(self):
+        """Test that every change is kept in the history and printed by the logger."""
+        lines = []
+        SYSTEM["logger"] = type("Log", (), {"print": lambda _, line: lines.append(line)})()
+        governor = QualityGovernor(patience=1)
+        self.clock.frames(0.05)
+        governor.update(self.clock, 60)
+        governor.reset()
+        self.assertEqual([(entry[1], entry[2]) for entry in governor.history], [(0, 1), (1, 0)])
+        self.assertEqual(len(lines), 2)
+        self.assertIn("0 -> 1", lines[0])
+
+    def test_damage_texts(self):
+        """Test that damage numbers are thinned out, but never critical hits."""
+        governor = QualityGovernor()
+        self.assertTrue(all(governor.allow_damage_text() for _ in range(10)))
+        governor.set_level(len(QUALITY_LEVELS) - 1)
+        shown = sum(governor.allow_damage_text() for _ in range(40))
+        self.assertEqual(shown, 10)
+        self.assertTrue(all(governor.allow_damage_text(True) for _ in range(10)))
+
+    def test_particle_budget(self):
+        """Test that the emitter stops emitting above its budget."""
+        emitter = ParticleEmitter(max_particles=100, vectorized=True)
+        emitter.max_particles = 30
+        emitter.emit(0, 0, 50, (1, 2), (255, 0, 0), (1, 2), (1, 2))
+        self.assertEqual(emitter.count, 30)
+        emitter.emit_line(0, 0, 10, 10, 20, (255, 0, 0), (1, 2), (1, 2))
+        self.assertEqual(emitter.count, 30)
@@ -0,0 +1,91 @@
+import unittest
+import os
+import threading
+import pygame
+from data.caching.image_registry import IMAGE_REGISTRY, ImageRegistry
+from data.image.image import Image
+from data.image.animation import Animation
+from data.image.sprite import Sprite
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+class TestImageRegistry(unittest.TestCase):
+    """Tests for the decoded image registry."""
+
+    def test_files_are_decoded_once(self):
+        """Test that loading the same file twice only reads it once."""
+        Image("default.png")
+        loads = IMAGE_REGISTRY.loads
+        img = Image("default.png")
+        self.assertEqual(IMAGE_REGISTRY.loads, loads)
+        self.assertEqual((img.width, img.height), (96, 96))
+
+    def test_images_do_not_share_pixels(self):
+        """Test that images made from the same file are independent."""
+        a = Image("default.png")
+        b = Image("default.png")
+        a.image.fill((1, 2, 3, 255))
+        a.opacity(100)
+        self.assertNotEqual(b.image.get_at((0, 0)), a.image.get_at((0, 0)))
+        self.assertNotEqual(b.image.get_alpha(), 100)
+
+    def test_clone_without_disk(self):
+        """Test that clones replay their transformations from memory."""
+        img = Image("default.png").flip(True, False).rotate(30).scale(40, 50)
+        first = img.clone()
+        loads = IMAGE_REGISTRY.loads
+        second = img.clone()
+        self.assertEqual(IMAGE_REGISTRY.loads, loads)
+        third = Animation("fireball.png", 32, 19).scale(38, 64).clone()
+        Sprite("sprites/witch.png", 64, 64, ["idle"], [0.25], [-1], [True], [0]).clone()
+        self.assertLessEqual(IMAGE_REGISTRY.loads, loads + 2)
+        self.assertEqual((second.width, second.height), (50, 40))
+        self.assertEqual(second.image.get_size(), first.image.get_size())
+        self.assertIsNot(second.image.surface, first.image.surface)
+        self.assertEqual(second.uri, "default.png")
+        self.assertEqual(third.frames[0].image.get_size(), (64, 38))
+
+    def test_transform_budget(self):
+        """Test that transformed surfaces are evicted past the budget."""
+        registry = ImageRegistry(max_bytes=1000)
+        registry.put("a", pygame.Surface((10, 10), pygame.SRCALPHA))
+        registry.put("b", pygame.Surface((10, 10), pygame.SRCALPHA))
+        registry.put("c", pygame.Surface((10, 10), pygame.SRCALPHA))
+        self.assertEqual(registry.transforms, 2)
+        self.assertEqual(registry.bytes, 800)
+        self.assertIsNone(registry.get("a"))
+        self.assertIsNotNone(registry.get("c"))
+
+    def test_file_budget(self):
+        """Test that decoded files are released past their budget, and read again."""
+        registry = ImageRegistry(max_file_bytes=96 * 96 * 4)
+        registry.load("default.png")
+        registry.load("default.png")
+        self.assertEqual((registry.loads, registry.reuses), (1, 1))
+        registry.load("fireball.png")
+        self.assertNotIn("default.png", registry)
+        self.assertLessEqual(registry.file_bytes, 96 * 96 * 4)
+        self.assertEqual(registry.load("default.png").get_size(), (96, 96))
+        self.assertEqual(registry.loads, 3)
+
+    def test_threaded_loads(self):
+        """Test that files loaded from several threads are decoded once."""
+        registry = ImageRegistry()
+        def load():
+            for _ in range(20):
+                registry.load("default.png")
+        threads = [threading.Thread(target=load) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual((registry.loads, registry.reuses), (1, 79))
+
+    def test_missing_file(self):
+        """Test that a missing file still falls back to the default image."""
+        registry = ImageRegistry()
+        with self.assertRaises(FileNotFoundError):
+            registry.load("does_not_exist.png")
+        self.assertEqual(Image("does_not_exist.png").uri, "default.png")
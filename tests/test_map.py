@@ -0,0 +1,81 @@
+import unittest
+import os
+import pygame
+import numpy as np
+from data.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from data.api.surface import Surface
+from data.image.tileset import Tileset
+from data.game.map import Map
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+TILESET = Tileset("tiles/Island_24x24.png", 24, 24).scale(64, 64)
+
+class TestMap(unittest.TestCase):
+    """Tests for the level map."""
+
+    def setUp(self):
+        self.map = Map(TILESET, 40, 30)
+
+    def test_camera_is_clamped(self):
+        """Test that the camera never leaves the map."""
+        self.assertEqual(self.map.move_camera(0, 0), (0, 0))
+        self.assertEqual(self.map.move_camera(1300, 900), (1300 - SCREEN_WIDTH // 2, 900 - SCREEN_HEIGHT // 2))
+        self.assertEqual(self.map.move_camera(10000, 10000),
+                         (self.map.width - SCREEN_WIDTH, self.map.height - SCREEN_HEIGHT))
+        self.assertEqual(self.map.camera_offset,
+                         (self.map.width - SCREEN_WIDTH, self.map.height - SCREEN_HEIGHT))
+
+    def test_tiles_are_compact(self):
+        """Test that the tiles are stored as a uint16 grid."""
+        self.assertEqual(self.map.tiles.dtype, np.uint16)
+        self.assertEqual(self.map.tiles.shape, (30, 40))
+        with self.assertRaises(ValueError):
+            Map(TILESET, 40, 30, np.zeros((40, 30)))
+
+    def test_draw_covers_screen(self):
+        """Test that the visible chunks cover the whole screen."""
+        blits = self.map.draw(1500.5, 700.25)
+        self.assertEqual(self.map.chunks, len(blits))
+        chunk = 64 * self.map.chunk_size
+        for surface, (x, y) in blits:
+            self.assertEqual(surface.get_size(), (chunk, chunk))
+            self.assertTrue(-chunk < x < SCREEN_WIDTH and -chunk < y < SCREEN_HEIGHT)
+        covered = sum((min(x + chunk, SCREEN_WIDTH) - max(x, 0)) *\
+                      (min(y + chunk, SCREEN_HEIGHT) - max(y, 0)) for _, (x, y) in blits)
+        self.assertEqual(covered, SCREEN_WIDTH * SCREEN_HEIGHT)
+
+    def test_chunks_are_bounded(self):
+        """Test that walking across a large map keeps a bounded amount of chunks."""
+        world = Map(TILESET, 400, 400, max_chunks=30)
+        for step in range(0, 400 * 64, 500):
+            world.draw(step, step)
+            self.assertLessEqual(world.chunks, 30)
+        first = world.draw(0, 0)[0][0]
+        self.assertIs(world.draw(10, 10)[0][0], first)
+
+    def test_chunk_matches_tiles(self):
+        """Test that a chunk is drawn from the tile grid, and redrawn on change."""
+        tiles = np.zeros((30, 40), dtype=np.uint16)
+        tiles[0, 1] = 6
+        world = Map(TILESET, 40, 30, tiles)
+        screen = Surface(SCREEN_WIDTH, SCREEN_HEIGHT)
+        screen.blits(world.draw(0, 0))
+        expected = TILESET.get_at(6, 0).image.get_at((10, 10))
+        self.assertEqual(screen.get_at((74, 10)), expected)
+        world.set_tile(1, 0, 0)
+        screen.blits(world.draw(0, 0))
+        self.assertEqual(screen.get_at((74, 10)), TILESET.get_at(0, 0).image.get_at((10, 10)))
+
+    def test_obstacles(self):
+        """Test the obstacle lookups in world coordinates."""
+        obstacles = np.zeros((30, 40), dtype=bool)
+        obstacles[2, 3] = True
+        world = Map(TILESET, 40, 30, obstacles=obstacles)
+        self.assertTrue(world.is_blocked(3 * 64 + 10, 2 * 64 + 63))
+        self.assertFalse(world.is_blocked(2 * 64 + 10, 2 * 64 + 10))
+        self.assertTrue(world.is_blocked(-1, 10))
+        self.assertTrue(world.is_blocked(10, world.height))
+        self.assertEqual(world.tile_size, (64, 64))
@@ -0,0 +1,46 @@
+import unittest
+import time
+import numpy as np
+from data.game.mapgen import MapGenerator
+
+class TestMapGenerator(unittest.TestCase):
+    """Tests for the procedural map generation."""
+
+    def test_seed_is_deterministic(self):
+        """Test that a seed always gives the same map, and another seed another map."""
+        tiles, obstacles = MapGenerator(1234).generate(60, 40)
+        again, again_obstacles = MapGenerator(1234).generate(60, 40)
+        other, _ = MapGenerator(4321).generate(60, 40)
+        self.assertTrue(np.array_equal(tiles, again))
+        self.assertTrue(np.array_equal(obstacles, again_obstacles))
+        self.assertFalse(np.array_equal(tiles, other))
+
+    def test_grids(self):
+        """Test the shape and types of the generated grids."""
+        tiles, obstacles = MapGenerator(7).generate(50, 30)
+        self.assertEqual(tiles.shape, (30, 50))
+        self.assertEqual(tiles.dtype, np.uint16)
+        self.assertEqual(obstacles.shape, (30, 50))
+        self.assertEqual(obstacles.dtype, bool)
+
+    def test_obstacles_are_water(self):
+        """Test that the obstacles match the water tiles and their share."""
+        tiles, obstacles = MapGenerator(7, water=0.2).generate(100, 100)
+        water = np.isin(tiles, MapGenerator.WATER + MapGenerator.WATER_DECORATIONS)
+        self.assertTrue(np.array_equal(water, obstacles))
+        self.assertAlmostEqual(obstacles.mean(), 0.2, delta=0.01)
+        self.assertTrue((tiles == MapGenerator.DIRT).any())
+
+    def test_noise_range(self):
+        """Test that the noise stays within [0, 1]."""
+        grid = MapGenerator.noise(np.random.default_rng(3), 37, 23, 5)
+        self.assertEqual(grid.shape, (23, 37))
+        self.assertGreaterEqual(grid.min(), 0)
+        self.assertLessEqual(grid.max(), 1)
+
+    def test_speed(self):
+        """Test that a 200x200 map is generated well under 50 ms."""
+        MapGenerator(0).generate(200, 200)
+        start = time.perf_counter()
+        MapGenerator(1).generate(200, 200)
+        self.assertLess(time.perf_counter() - start, 0.05)
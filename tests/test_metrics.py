@@ -0,0 +1,60 @@
+import unittest
+import csv
+import os
+import tempfile
+import time
+from data.api.metrics import MetricsCollector
+
+class TestMetricsCollector(unittest.TestCase):
+    """Tests for the metrics collector."""
+
+    def test_sample(self):
+        """Test that every gauge is read, and failing ones skipped."""
+        tracker = [1, 2, 3]
+        metrics = MetricsCollector()
+        metrics.add_gauge("tracker", tracker.__len__)
+        metrics.add_gauge("missing", lambda: {}["key"])
+        values = metrics.sample()
+        self.assertGreater(values["rss"], 0)
+        self.assertEqual(values["tracker"], 3)
+        self.assertNotIn("missing", values)
+        tracker.append(4)
+        metrics.sample()
+        self.assertEqual(metrics.values["tracker"], 4)
+        self.assertEqual(metrics.history("tracker"), [3, 4])
+        self.assertEqual(metrics.samples, 2)
+
+    def test_background_sampling(self):
+        """Test that samples are taken on a thread until stopped."""
+        metrics = MetricsCollector(interval=0.01, history=3)
+        metrics.start()
+        deadline = time.time() + 2
+        while metrics.samples < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        metrics.stop()
+        self.assertGreaterEqual(metrics.samples, 5)
+        self.assertEqual(len(metrics.history("rss")), 3)
+        count = metrics.samples
+        time.sleep(0.05)
+        self.assertEqual(metrics.samples, count)
+
+    def test_log_file(self):
+        """Test that samples are only written while logging is on."""
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "profiles", "metrics.csv")
+        metrics = MetricsCollector(interval=60)
+        metrics.add_gauge("enemies", lambda: 7)
+        metrics.start(path)
+        metrics.sample()
+        self.assertFalse(os.path.exists(path))
+        metrics.logging = True
+        metrics.sample()
+        metrics.sample()
+        metrics.stop()
+        with open(path, encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["time", "rss", "enemies"])
+        self.assertEqual([row[2] for row in rows[1:]], ["7", "7"])
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+        os.rmdir(directory)
@@ -192,6 +192,41 @@ class TestingNumerics(unittest.TestCase):
         a.afflict(af6)
         self.assertEqual(a.c_value, 0)
 
+    def test_stat_cache(self):
+        a = Stat(10, "test")
+        self.assertEqual(a.c_value, 10)
+        version = a.version
+        self.assertEqual(a.c_value, 10)
+        self.assertEqual(a.version, version)
+        boon = Affliction("a", 0.5, 1, [Flags.BOON])
+        a.afflict(boon)
+        self.assertGreater(a.version, version)
+        self.assertEqual(a.c_value, 15)
+        a.value = 20
+        self.assertEqual(a.c_value, 30)
+        version = a.version
+        a.tick()
+        self.assertEqual(a.version, version)
+        boon.duration = 0
+        a.tick()
+        self.assertGreater(a.version, version)
+        self.assertEqual(a.c_value, 20)
+        curse = Affliction("b", 0.5, -1, [Flags.CURSE])
+        a.afflict(curse)
+        self.assertEqual(a.c_value, 10)
+        curse.value = 0.25
+        self.assertEqual(a.c_value, 10)
+        a.invalidate()
+        self.assertEqual(a.c_value, 15)
+        a.remove_affliction(curse)
+        self.assertEqual(a.c_value, 20)
+        a.scale(5)
+        self.assertEqual(a.c_value, 20)
+        a.mults = [curse]
+        self.assertEqual(a.c_value, 15)
+        a.reset()
+        self.assertEqual(a.c_value, 20)
+
     def test_rangestat(self):
         a = RangeStat(0, 5, "a", 100, 0)
         b = RangeStat(0, 5, "a", 100, 0)
@@ -0,0 +1,164 @@
+import unittest
+import numpy as np
+from data.api.surface import Surface
+from data.constants import PARTICULE_TRACKER
+from data.physics.particle import ParticleEmitter, ParticleArrays, ParticleStamps
+
+class TestParticleArrays(unittest.TestCase):
+    """Tests for the structure-of-arrays particle storage."""
+
+    def test_emit_respects_capacity(self):
+        """Test that emission stops at the capacity."""
+        arrays = ParticleArrays(10)
+        arrays.emit(0, 0, 8, (1, 2), (255, 0, 0), (1, 3), (1, 2))
+        arrays.emit(0, 0, 8, (1, 2), [(255, 0, 0), (0, 255, 0)], (1, 3), (1, 2))
+        self.assertEqual(arrays.count, 10)
+
+    def test_tick_moves_and_applies_gravity(self):
+        """Test that tick matches the per-particle update."""
+        arrays = ParticleArrays(4)
+        arrays.emit(100, 100, 1, (2, 2), (255, 0, 0), (1, 1), (1, 1),
+                    spread_angle=0, gravity=0.5)
+        arrays.tick()
+        self.assertAlmostEqual(float(arrays._pos[0, 0]), 102, places=4)
+        self.assertAlmostEqual(float(arrays._pos[0, 1]), 100, places=4)
+        self.assertAlmostEqual(float(arrays._vel[0, 1]), 0.5, places=4)
+        self.assertAlmostEqual(float(arrays._life[0]), 0.984, places=4)
+
+    def test_tick_compacts_dead_particles(self):
+        """Test that dead particles are swapped out and survivors kept packed."""
+        arrays = ParticleArrays(10)
+        arrays.emit(0, 0, 3, (0, 0), (1, 1, 1), (1, 1), (0.01, 0.01))
+        arrays.emit(0, 0, 3, (0, 0), (2, 2, 2), (1, 1), (5, 5))
+        arrays.emit(0, 0, 2, (0, 0), (3, 3, 3), (1, 1), (0.01, 0.01))
+        arrays.tick()
+        self.assertEqual(arrays.count, 3)
+        self.assertTrue(np.all(arrays._life[:3] > 0))
+        self.assertTrue(np.all(arrays._color[:3] == 2))
+
+    def test_emit_line(self):
+        """Test that line particles are spread between both ends."""
+        arrays = ParticleArrays(50)
+        arrays.emit_line(0, 0, 100, 0, 20, (255, 255, 255), (1, 2), (1, 1))
+        self.assertEqual(arrays.count, 20)
+        self.assertTrue(np.all(arrays._pos[:20, 0] >= 0))
+        self.assertTrue(np.all(arrays._pos[:20, 0] <= 100))
+        self.assertTrue(np.all(np.abs(arrays._pos[:20, 1]) <= 3))
+
+    def test_visible_culls_off_screen(self):
+        """Test that particles outside of the screen are culled."""
+        arrays = ParticleArrays(4)
+        arrays.emit(10, 10, 1, (0, 0), (1, 1, 1), (1, 1), (1, 1))
+        arrays.emit(5000, 10, 1, (0, 0), (1, 1, 1), (1, 1), (1, 1))
+        self.assertEqual(arrays.visible(0, 0).tolist(), [0])
+        self.assertEqual(arrays.visible(4000, 0).tolist(), [1])
+
+    def test_alphas(self):
+        """Test that only fading particles lose alpha."""
+        arrays = ParticleArrays(4)
+        arrays.emit(0, 0, 1, (0, 0), (1, 1, 1), (1, 1), (1, 1), fade=True)
+        arrays.emit(0, 0, 1, (0, 0), (1, 1, 1), (1, 1), (1, 1), fade=False)
+        arrays._life[:2] = 0.5
+        self.assertEqual(arrays.alphas(np.arange(2)).tolist(), [127, 255])
+
+class TestParticleStamps(unittest.TestCase):
+    """Tests for the pre-rendered particle atlas."""
+
+    def test_quantize(self):
+        """Test that close particles share the same stamp."""
+        self.assertEqual(ParticleStamps.quantize(3.7, (255, 101, 3), 200),
+                         ParticleStamps.quantize(3.2, (253, 102, 1), 195))
+        self.assertEqual(ParticleStamps.quantize(0.5, (0, 0, 0), 255)[0], 0)
+
+    def test_get_renders_once(self):
+        """Test that stamps are rendered once with the right size."""
+        stamps = ParticleStamps(max_stamps=2)
+        key = ParticleStamps.quantize(4, (255, 0, 0), 255)
+        stamp = stamps.get(key)
+        self.assertEqual(stamp.get_size(), (8, 8))
+        self.assertIs(stamps.get(key), stamp)
+        self.assertEqual(stamps.get((0, 0, 0, 0, 15)).get_size(), (1, 1))
+        stamps.get((1, 0, 0, 0, 15))
+        self.assertEqual(stamps.count, 1)
+
+class TestParticleEmitter(unittest.TestCase):
+    """Tests for the particle emitter."""
+
+    def test_both_backends_count(self):
+        """Test that both backends expose the same count."""
+        for vectorized in (False, True):
+            emitter = ParticleEmitter(100, vectorized=vectorized)
+            self.assertEqual(emitter.vectorized, vectorized)
+            emitter.emit(0, 0, 30, (1, 2), (255, 0, 0), (1, 3), (0.01, 0.01))
+            self.assertEqual(emitter.count, 30)
+            emitter.tick()
+            self.assertEqual(emitter.count, 0)
+            emitter.emit(0, 0, 30, (1, 2), (255, 0, 0), (1, 3), (1, 2))
+            emitter.enabled = False
+            self.assertEqual(emitter.count, 0)
+
+    def test_batched_draw(self):
+        """Test that every backend draws the particles on the surface."""
+        for vectorized in (False, True):
+            for batched in (False, True):
+                emitter = ParticleEmitter(100, vectorized=vectorized, batched=batched)
+                surface = Surface(200, 200)
+                emitter.emit(100, 100, 10, (0, 0), (255, 0, 0), (3, 3), (1, 1), fade=False)
+                emitter.draw(surface)
+                self.assertEqual(tuple(surface.get_at((100, 100)))[:3], (255, 0, 0))
+
+    def test_lifetime_follows_steps(self):
+        """Test that particles and arcs age by the step duration, not by draws."""
+        for vectorized in (False, True):
+            emitter = ParticleEmitter(100, vectorized=vectorized)
+            surface = Surface(200, 200)
+            emitter.emit(0, 0, 5, (1, 2), (255, 0, 0), (1, 3), (0.1, 0.1))
+            PARTICULE_TRACKER.append([0, 0, 50, 50, 0.1, 0.1])
+            for _ in range(10):
+                emitter.draw(surface)
+            self.assertEqual(emitter.count, 5)
+            self.assertEqual(len(PARTICULE_TRACKER), 1)
+            emitter.tick(0.05)
+            self.assertEqual(emitter.count, 5)
+            self.assertEqual(len(PARTICULE_TRACKER), 1)
+            emitter.tick(0.06)
+            self.assertEqual(emitter.count, 0)
+            self.assertEqual(PARTICULE_TRACKER, [])
+
+class TestLightning(unittest.TestCase):
+    """Tests for the lightning arcs."""
+
+    def test_arc_reaches_both_ends(self):
+        """Test that the rotated arc is drawn between its two ends."""
+        for x2, y2 in ((400, 100), (100, 400), (-200, -200)):
+            emitter = ParticleEmitter(10)
+            surface = Surface(1000, 1000)
+            emitter.draw_lightning(300, 300, 300 + x2, 300 + y2, surface)
+            for t in (0.05, 0.95):
+                x = int(300 + x2 * t)
+                y = int(300 + y2 * t)
+                area = [surface.get_at((x + i, y + j))[3] for i in range(-25, 26)
+                        for j in range(-25, 26)]
+                self.assertGreater(max(area), 0)
+
+    def test_global_rng_untouched(self):
+        """Test that generating arcs does not reseed numpy's global state."""
+        np.random.seed(42)
+        expected = np.random.random(3)
+        np.random.seed(42)
+        emitter = ParticleEmitter(10)
+        emitter.draw_lightning(0, 0, 500, 200, Surface(100, 100))
+        self.assertTrue(np.array_equal(np.random.random(3), expected))
+
+    def test_cache_is_bounded_and_quantized(self):
+        """Test that close arcs share a shape and the cache stays bounded."""
+        emitter = ParticleEmitter(10)
+        surface = Surface(100, 100)
+        emitter.draw_lightning(0, 0, 500, 0, surface)
+        emitter.draw_lightning(50, 70, 553, 72, surface)
+        self.assertEqual(len(emitter._lightning_cache), 1)
+        for i in range(200):
+            emitter.draw_lightning(0, 0, 100 + i * 7, i * 13, surface)
+        self.assertLessEqual(len(emitter._lightning_cache), 32)
+        emitter.clear()
+        self.assertEqual(len(emitter._lightning_cache), 0)
@@ -0,0 +1,67 @@
+import unittest
+import csv
+import os
+import tempfile
+from data.api.profiler import FrameProfiler
+
+class TestFrameProfiler(unittest.TestCase):
+    """Tests for the frame profiler."""
+
+    def test_disabled_records_nothing(self):
+        """Test that a disabled profiler only calls the functions."""
+        profiler = FrameProfiler()
+        self.assertEqual(profiler.call("logic", max, 2, 5), 5)
+        profiler.begin("draw")
+        profiler.end("draw")
+        profiler.next_frame()
+        self.assertEqual(profiler.frames, 0)
+        self.assertEqual(profiler.scopes, ())
+
+    def test_scopes_add_up_per_frame(self):
+        """Test that a scope entered several times in a frame is summed."""
+        profiler = FrameProfiler(enabled=True)
+        for _ in range(3):
+            profiler.call("logic", sum, range(1000))
+        profiler.begin("draw")
+        profiler.end("draw")
+        profiler.end("never_started")
+        profiler.next_frame()
+        self.assertEqual(profiler.scopes, ("logic", "draw"))
+        self.assertEqual(len(profiler.samples("logic")), 1)
+        self.assertGreater(profiler.samples("logic")[0], 0)
+        profiler.next_frame()
+        self.assertEqual(profiler.samples("logic")[1], 0)
+
+    def test_ring_buffer(self):
+        """Test that only the last frames are kept, oldest first."""
+        profiler = FrameProfiler(size=4, enabled=True)
+        for i in range(6):
+            profiler.call("logic", lambda: None)
+            profiler.next_frame()
+            profiler._buffers["logic"][(profiler._index - 1) % 4] = i / 1000
+        self.assertEqual(profiler.samples("logic"), [0.002, 0.003, 0.004, 0.005])
+        p50, p95, peak = profiler.stats("logic")
+        self.assertAlmostEqual(p50, 3.5)
+        self.assertAlmostEqual(peak, 5)
+        self.assertLess(p95, peak)
+
+    def test_export_csv(self):
+        """Test that every frame is written in milliseconds."""
+        profiler = FrameProfiler(size=4, enabled=True)
+        self.assertFalse(profiler.export_csv("unused.csv"))
+        for _ in range(6):
+            profiler.call("logic", lambda: None)
+            profiler.call("draw", lambda: None)
+            profiler.next_frame()
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "profiles", "level.csv")
+        self.assertTrue(profiler.export_csv(path))
+        with open(path, encoding="utf-8") as file:
+            rows = list(csv.reader(file))
+        self.assertEqual(rows[0], ["frame", "logic", "draw"])
+        self.assertEqual([row[0] for row in rows[1:]], ["2", "3", "4", "5"])
+        os.remove(path)
+        os.rmdir(os.path.dirname(path))
+        os.rmdir(directory)
+        profiler.reset()
+        self.assertEqual(profiler.frames, 0)
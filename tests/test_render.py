@@ -0,0 +1,232 @@
+import unittest
+import os
+import pygame
+from data.constants import SYSTEM, SCREEN_WIDTH, SCREEN_HEIGHT
+from data.api.surface import Surface, Overlay
+from data.interface.render import DirtyRegions, RenderQueue, ScaledBlits, world_target
+from data.game.camera import Camera
+from data.image.posteffects import PostEffects
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+SPRITE = Surface(50, 40)
+
+class TestDirtyRegions(unittest.TestCase):
+    """Tests for the dirty rectangles of the screen."""
+
+    def test_first_frame_is_full(self):
+        """Test that a frame without a previous one is drawn entirely."""
+        regions = DirtyRegions()
+        self.assertIsNone(regions.compute([(SPRITE, (10, 10))]))
+        self.assertIsNotNone(regions.compute([(SPRITE, (10, 10))]))
+        self.assertEqual(regions.full_frames, 1)
+        self.assertEqual(regions.partial_frames, 1)
+
+    def test_moved_image_erases_old_position(self):
+        """Test that both the old and new position of an image are dirty."""
+        regions = DirtyRegions()
+        regions.compute([(SPRITE, (10, 10))])
+        rects = regions.compute([(SPRITE, (500, 300))])
+        self.assertEqual(len(rects), 2)
+        self.assertIn(pygame.Rect(10, 10, 50, 40), rects)
+        self.assertIn(pygame.Rect(500, 300, 50, 40), rects)
+        self.assertEqual(regions.rects, rects)
+
+    def test_overlaps_are_merged(self):
+        """Test that overlapping rects are merged and clipped to the screen."""
+        regions = DirtyRegions()
+        regions.compute([(SPRITE, (10, 10))])
+        rects = regions.compute([(SPRITE, (30, 20)), (SPRITE, (SCREEN_WIDTH - 20, -10))])
+        self.assertIn(pygame.Rect(10, 10, 70, 50), rects)
+        self.assertIn(pygame.Rect(SCREEN_WIDTH - 20, 0, 20, 30), rects)
+        self.assertEqual(len(rects), 2)
+
+    def test_area_of_blits(self):
+        """Test that blits with an area only cover that area."""
+        rects = DirtyRegions.bounds([(SPRITE, (5, 6), (0, 0, 10, 12))])
+        self.assertEqual(rects, [pygame.Rect(5, 6, 10, 12)])
+
+    def test_threshold(self):
+        """Test that large dirty areas fall back to a full frame."""
+        regions = DirtyRegions(threshold=0.5)
+        big = Surface(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + 10)
+        regions.compute([(big, (0, 0))])
+        self.assertIsNone(regions.compute([(big, (0, 0))]))
+        self.assertIsNone(regions.rects)
+
+    def test_too_many_rects(self):
+        """Test that too many rects are merged in their bounding box."""
+        regions = DirtyRegions(max_rects=4)
+        blits = [(SPRITE, (i * 60, 0)) for i in range(6)]
+        regions.compute(blits)
+        self.assertEqual(regions.compute(blits), [pygame.Rect(0, 0, 5 * 60 + 50, 40)])
+
+    def test_invalidate(self):
+        """Test that invalidating gives two full frames."""
+        regions = DirtyRegions()
+        regions.compute([(SPRITE, (10, 10))])
+        regions.invalidate()
+        self.assertIsNone(regions.rects)
+        self.assertIsNone(regions.compute([(SPRITE, (10, 10))]))
+        self.assertIsNotNone(regions.compute([(SPRITE, (10, 10))]))
+
+    def test_still_map_gives_partial_frames(self):
+        """Test that a level frame with a still camera only redraws what moved\
+        over the map, and a moved camera redraws everything."""
+        regions = DirtyRegions()
+        chunk = Surface(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+        chunks = [(chunk, (x, y)) for x in (0, SCREEN_WIDTH // 2) for y in (0, SCREEN_HEIGHT // 2)]
+        self.assertIsNone(regions.compute([(SPRITE, (10, 10))], chunks))
+        rects = regions.compute([(SPRITE, (20, 10))], list(chunks))
+        self.assertEqual(rects, [pygame.Rect(10, 10, 60, 40)])
+        moved = [(surface, (x - 5, y)) for surface, (x, y) in chunks]
+        self.assertIsNone(regions.compute([(SPRITE, (20, 10))], moved))
+        self.assertIsNotNone(regions.compute([(SPRITE, (20, 10))], moved))
+
+class TestOverlay(unittest.TestCase):
+    """Tests for the full screen overlays."""
+
+    def test_empty_overlay(self):
+        """Test that an empty overlay is not blitted."""
+        overlay = Overlay(SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.assertIsNone(overlay.bounds)
+        self.assertIsNone(overlay.blit_item((3, 4)))
+
+    def test_bounds_union(self):
+        """Test that the bounds cover everything drawn, within the overlay."""
+        overlay = Overlay(SCREEN_WIDTH, SCREEN_HEIGHT)
+        overlay.draw_polygon((255, 0, 0, 100), [(100, 100), (200, 100), (150, 180)])
+        overlay.set_at((300, 50), (0, 255, 0, 255))
+        overlay.blits([(SPRITE, (-20, 500))])
+        self.assertEqual(overlay.bounds, pygame.Rect(0, 50, 301, 490))
+        surface, pos, area = overlay.blit_item((5, -2))
+        self.assertIs(surface, overlay.surface)
+        self.assertEqual(pos, (5, 48))
+        self.assertEqual(area, overlay.bounds)
+
+    def test_clear_bounds_only(self):
+        """Test that clearing empties the drawn part and the bounds."""
+        overlay = Overlay(SCREEN_WIDTH, SCREEN_HEIGHT)
+        overlay.draw_circle((255, 0, 0, 255), (400, 400), 20)
+        overlay.clear()
+        self.assertIsNone(overlay.bounds)
+        self.assertEqual(overlay.get_at((400, 400)), (0, 0, 0, 0))
+
+
+class TestRenderQueue(unittest.TestCase):
+    """Tests for the layered render queue."""
+
+    def setUp(self):
+        self.queue = RenderQueue({"top": 20, "bottom": 0, "middle": 10})
+
+    def test_sources_are_unwrapped(self):
+        """Test that wrapped surfaces are stored as raw pygame surfaces."""
+        raw = pygame.Surface((4, 4))
+        self.queue.push("top", SPRITE, (1, 2))
+        self.queue.push("top", SPRITE, (3, 4), (0, 0, 5, 5))
+        self.queue.extend("middle", [(SPRITE, (5, 6)), (raw, (7, 8))])
+        self.assertEqual(self.queue["top"], [(SPRITE.surface, (1, 2)),
+                                             (SPRITE.surface, (3, 4), (0, 0, 5, 5))])
+        self.assertEqual(self.queue["middle"], [(SPRITE.surface, (5, 6)), (raw, (7, 8))])
+
+    def test_z_order(self):
+        """Test that layers are drawn by increasing z, whatever their insertion order."""
+        red = pygame.Surface((10, 10))
+        red.fill((255, 0, 0))
+        blue = pygame.Surface((10, 10))
+        blue.fill((0, 0, 255))
+        self.queue.push("top", blue, (0, 0))
+        self.queue.push("bottom", red, (0, 0))
+        self.assertEqual(self.queue.order, ("bottom", "middle", "top"))
+        target = pygame.Surface((10, 10))
+        self.queue.submit(target)
+        self.assertEqual(target.get_at((5, 5))[:3], (0, 0, 255))
+        self.queue.add_layer("bottom", 30)
+        self.queue.submit(target)
+        self.assertEqual(target.get_at((5, 5))[:3], (255, 0, 0))
+
+    def test_counts(self):
+        """Test that the blits of each submitted layer are counted."""
+        self.queue.extend("middle", [(SPRITE, (i, 0)) for i in range(3)])
+        self.queue.push("top", SPRITE, (0, 0))
+        self.queue.submit(pygame.Surface((10, 10)), ("middle",))
+        self.assertEqual(self.queue.counts, {"top": 0, "bottom": 0, "middle": 3})
+        self.assertEqual(len(self.queue.blits(("middle", "top"))), 4)
+        self.queue.clear("middle")
+        self.queue.submit(pygame.Surface((10, 10)))
+        self.assertEqual(self.queue.counts, {"top": 1, "bottom": 0, "middle": 0})
+
+
+class TestRenderScale(unittest.TestCase):
+    """Tests for the internal render scale."""
+
+    def setUp(self):
+        self.options = dict(SYSTEM["options"])
+        self.saved = {key: SYSTEM.get(key) for key in ("windows", "real_windows", "world")}
+
+    def test_world_target(self):
+        """Test that the world target is reduced, and only allocated again on a new scale."""
+        SYSTEM["world"] = None
+        world = world_target(50)
+        self.assertEqual(world.get_size(), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        self.assertIs(world_target(50), world)
+        self.assertEqual(world_target(75).get_size(), (1440, 810))
+        self.assertEqual(world_target(100).get_size(), (SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    def test_submit_scaled(self):
+        """Test that world layers are drawn reduced then upscaled, and the\
+        other layers at the native resolution over them."""
+        queue = RenderQueue({"world": 0, "hud": 10})
+        scaler = ScaledBlits(("world",), ())
+        camera = Camera()
+        camera.render_scale = 0.5
+        red = Surface(40, 20, is_alpha=False)
+        red.fill((255, 0, 0))
+        green = Surface(10, 10, is_alpha=False)
+        green.fill((0, 255, 0))
+        target = Surface(200, 100, is_alpha=False)
+        world = Surface(100, 50, is_alpha=False)
+        for _ in range(2):
+            queue.clear()
+            queue.push("hud", green, (130, 60))
+            queue.push("world", red, (100, 50))
+            queue.submit_scaled(target, world, ("world", "hud"), scaler, camera)
+        self.assertEqual(len(scaler), 1)
+        self.assertEqual(world.get_at((55, 30))[:3], (255, 0, 0))
+        self.assertEqual(world.get_at((75, 30))[:3], (0, 0, 0))
+        self.assertEqual(target.get_at((105, 55))[:3], (255, 0, 0))
+        self.assertEqual(target.get_at((135, 65))[:3], (0, 255, 0))
+        self.assertEqual(target.get_at((145, 55))[:3], (0, 0, 0))
+        self.assertEqual(queue.counts, {"world": 1, "hud": 1})
+
+    def tearDown(self):
+        SYSTEM["options"].clear()
+        SYSTEM["options"].update(self.options)
+        SYSTEM.update(self.saved)
+
+    def test_scale_into_keeps_source(self):
+        """Test that scaling into a surface changes neither surface size nor handle."""
+        source = Surface(40, 20, is_alpha=False)
+        source.fill((10, 200, 30))
+        raw = source.surface
+        dest = Surface(10, 5, is_alpha=False)
+        dest_raw = dest.surface
+        self.assertIs(source.scale_into(dest), dest)
+        self.assertIs(source.surface, raw)
+        self.assertEqual(source.get_size(), (40, 20))
+        self.assertIs(dest.surface, dest_raw)
+        self.assertEqual(dest.get_at((5, 2))[:3], (10, 200, 30))
+
+    def test_present_scaled(self):
+        """Test that the frame is presented at another resolution without being modified."""
+        SYSTEM["windows"] = Surface(SCREEN_WIDTH, SCREEN_HEIGHT, is_alpha=False)
+        SYSTEM["windows"].fill((0, 0, 255))
+        raw = SYSTEM["windows"].surface
+        SYSTEM["real_windows"] = Surface(960, 540, is_alpha=False)
+        effects = PostEffects()
+        effects.present_scaled((960, 540))
+        self.assertIs(SYSTEM["windows"].surface, raw)
+        self.assertEqual(SYSTEM["windows"].get_size(), (SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.assertEqual(SYSTEM["real_windows"].get_at((480, 270))[:3], (0, 0, 255))
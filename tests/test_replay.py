@@ -0,0 +1,64 @@
+import unittest
+import os
+import tempfile
+import pygame
+from data.numerics.rng import RNG
+from data.replay import InputFrame, InputRecorder, InputReplay, FRAME
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+NAMES = ("spell_L", "left", "pause")
+
+class TestReplay(unittest.TestCase):
+    """Tests for the recording and replay of inputs."""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_frame_round_trip(self):
+        """Test that a frame is read back as it was written."""
+        frame = InputFrame(1 / 60, {"left", "pause", "unbound"}, (12.5, 1079.0),
+                           (True, False, True), [(0, -1), (300, 2)], True)
+        record = frame.pack(NAMES)
+        self.assertEqual(len(record), FRAME.size)
+        read = InputFrame.unpack(record, NAMES)
+        self.assertEqual(read.elapsed, 1 / 60)
+        self.assertEqual(read.keys, {"left", "pause"})
+        self.assertEqual(read.mouse, (12.5, 1079.0))
+        self.assertEqual(read.buttons, (True, False, True))
+        self.assertEqual(read.wheel, [(0, -1), (127, 2)])
+        self.assertTrue(read.quit_game)
+
+    def test_replay_plays_recording(self):
+        """Test that the replay gives the frames and seed of the recording, then quits."""
+        recorder = InputRecorder(self.path, seed=99)
+        rolls = [RNG["combat"].random() for _ in range(3)]
+        recorded = [recorder.poll() for _ in range(4)]
+        recorder.close()
+        replay = InputReplay(self.path)
+        self.assertEqual(replay.seed, 99)
+        self.assertEqual([RNG["combat"].random() for _ in range(3)], rolls)
+        self.assertEqual(replay.length, 4)
+        for frame in recorded:
+            played = replay.poll()
+            self.assertEqual(played.elapsed, frame.elapsed)
+            self.assertEqual(played.keys, frame.keys)
+            self.assertEqual(played.mouse, frame.mouse)
+            self.assertFalse(played.quit_game)
+        self.assertTrue(replay.poll().quit_game)
+        self.assertEqual(replay.frames, 4)
+        self.assertEqual(len(replay.times), 4)
+        self.assertTrue(replay.deterministic)
+
+    def test_not_a_recording(self):
+        """Test that other files are refused."""
+        with open(self.path, "wb") as file:
+            file.write(b"\0" * 64)
+        with self.assertRaises(ValueError):
+            InputReplay(self.path)
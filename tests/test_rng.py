@@ -0,0 +1,60 @@
+import unittest
+from data.numerics.rng import RandomService, RandomStream, STREAMS
+
+class TestRandomService(unittest.TestCase):
+    """Tests for the named random streams."""
+
+    def test_reproducible(self):
+        """Test that the same seed gives the same rolls."""
+        first = RandomService(7)
+        second = RandomService(7)
+        for name in STREAMS:
+            self.assertEqual([first[name].random() for _ in range(2000)],
+                             [second[name].random() for _ in range(2000)])
+        first.seed(7)
+        self.assertEqual(first["loot"].random(), RandomService(7)["loot"].random())
+
+    def test_streams_are_independent(self):
+        """Test that rolling one stream does not change the others."""
+        quiet = RandomService(3)
+        busy = RandomService(3)
+        busy["particles"].uniforms(0, 1, 5000)
+        for _ in range(3000):
+            busy["particles"].random()
+        self.assertEqual([quiet["loot"].random() for _ in range(50)],
+                         [busy["loot"].random() for _ in range(50)])
+        self.assertNotEqual(quiet["combat"].random(), quiet["spawns"].random())
+
+    def test_new_streams(self):
+        """Test that unknown streams are created and seeded on first use."""
+        service = RandomService(11)
+        roll = service["weather"].random()
+        self.assertIn("weather", service.streams)
+        service.seed(11)
+        self.assertEqual(service["weather"].random(), roll)
+        self.assertEqual(service.current_seed, 11)
+
+    def test_bounds(self):
+        """Test the bounds of the integer rolls."""
+        stream = RandomStream(0, "test", batch=64)
+        inclusive = {stream.randint(2, 4) for _ in range(500)}
+        exclusive = {stream.integers(2, 4) for _ in range(500)}
+        self.assertEqual(inclusive, {2, 3, 4})
+        self.assertEqual(exclusive, {2, 3})
+        self.assertEqual(stream.draws, 1000)
+        self.assertTrue(all(-3 <= stream.uniform(-3, 3) < 3 for _ in range(200)))
+
+    def test_weighted_choice(self):
+        """Test that weights are followed, including null ones."""
+        stream = RandomStream(5, "test")
+        picks = [stream.choice("abc", [0, 3, 1]) for _ in range(4000)]
+        self.assertNotIn("a", picks)
+        self.assertAlmostEqual(picks.count("b") / len(picks), 0.75, delta=0.03)
+        self.assertIn(stream.choice([None]), [None])
+
+    def test_sample(self):
+        """Test that samples have distinct elements."""
+        stream = RandomStream(5, "test")
+        picked = stream.sample(range(10), 6)
+        self.assertEqual(len(set(picked)), 6)
+        self.assertEqual(stream.sample(range(10), 0), [])
@@ -0,0 +1,87 @@
+import unittest
+import json
+import os
+import tempfile
+import pygame
+from data.image.animation import Animation
+from data.caching.rotation_bake import RotationBake
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+class TestRotationBake(unittest.TestCase):
+    """Tests for the pre-baked projectile rotations."""
+
+    def setUp(self):
+        self.anim = Animation("fireball.png", 32, 19, frame_rate=0.25).scale(38, 64)
+
+    def test_copy_is_independent(self):
+        """Test that transforming a copy leaves the original untouched."""
+        copy = self.anim.copy().rotate(45).scale(2, 2, False)
+        self.assertEqual(len(copy.frames), len(self.anim.frames))
+        self.assertEqual(self.anim.frames[0].image.get_size(), (64, 38))
+        self.assertNotEqual(copy.frames[0].image.get_size(), (64, 38))
+
+    def test_bake_matches_projectile_transform(self):
+        """Test that a bucket is the transform a projectile would do."""
+        bake = RotationBake()
+        self.assertEqual(bake.bake("fireball", self.anim, 2), 72)
+        baked = bake.get("fireball", -30, 2)
+        expected = self.anim.clone().rotate(-30).scale(2, 2, False)
+        self.assertEqual(baked.frames[0].image.get_size(),
+                         expected.frames[0].image.get_size())
+        self.assertEqual((baked.w, baked.h), (expected.w, expected.h))
+
+    def test_buckets(self):
+        """Test that angles are snapped to the closest bucket."""
+        bake = RotationBake(step=5)
+        self.assertEqual(bake.buckets, 72)
+        self.assertEqual(bake.bucket(2), 0)
+        self.assertEqual(bake.bucket(3), 1)
+        self.assertEqual(bake.bucket(-5), 71)
+        self.assertEqual(bake.bucket(361), 0)
+        bake.bake("fireball", self.anim, 1)
+        self.assertIs(bake.get("fireball", 359, 1), bake.get("fireball", 0, 1))
+        self.assertIsNone(bake.get("fireball", 0, 2))
+        self.assertIsNone(bake.get("iceball", 0, 1))
+
+    def test_persistence(self):
+        """Test that a second bake loads the strips saved by the first."""
+        with tempfile.TemporaryDirectory() as folder:
+            first = RotationBake(step=30, directory=folder)
+            self.assertEqual(first.bake("fireball", self.anim, 1.5), 12)
+            self.assertEqual(len(os.listdir(folder)), 13)
+            second = RotationBake(step=30, directory=folder)
+            self.assertEqual(second.bake("fireball", self.anim, 1.5), 0)
+            a = first.get("fireball", 60, 1.5)
+            b = second.get("fireball", 60, 1.5)
+            self.assertEqual(len(a.frames), len(b.frames))
+            self.assertEqual(a.frames[2].image.get_size(), b.frames[2].image.get_size())
+            self.assertEqual(a.frames[2].image.get_at((20, 20)), b.frames[2].image.get_at((20, 20)))
+
+    def test_stale_or_corrupt_bake(self):
+        """Test that a corrupt strip, or a set stamped with another source,\
+        is baked again and overwritten."""
+        with tempfile.TemporaryDirectory() as folder:
+            RotationBake(step=30, directory=folder).bake("fireball", self.anim, 1)
+            strip = os.path.join(folder, "fireball_1.00_002.png")
+            with open(strip, "wb") as file:
+                file.write(b"\x89PNG not an image")
+            bake = RotationBake(step=30, directory=folder)
+            self.assertEqual(bake.bake("fireball", self.anim, 1), 1)
+            self.assertEqual(RotationBake(step=30, directory=folder)\
+                             .bake("fireball", self.anim, 1), 0)
+            stamp_path = os.path.join(folder, "fireball_1.00.json")
+            with open(stamp_path, "r", encoding="utf-8") as file:
+                stamp = json.load(file)
+            stamp["source"] = [0, 0]
+            with open(stamp_path, "w", encoding="utf-8") as file:
+                json.dump(stamp, file)
+            self.assertEqual(RotationBake(step=30, directory=folder)\
+                             .bake("fireball", self.anim, 1), 12)
+            self.assertEqual(RotationBake(step=30, directory=folder)\
+                             .bake("fireball", self.anim, 1), 0)
+            scaled = self.anim.copy().scale(2, 2, False)
+            self.assertEqual(RotationBake(step=30, directory=folder)\
+                             .bake("fireball", scaled, 1), 12)
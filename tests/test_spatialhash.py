@@ -0,0 +1,56 @@
+import unittest
+from data.physics.hitbox import HitBox
+from data.physics.spatialhash import SpatialHash
+
+class TestSpatialHash(unittest.TestCase):
+    """Tests for the collision broad phase."""
+
+    def test_query_finds_overlapping(self):
+        """Test that a query returns the items in the same cells."""
+        grid = SpatialHash(100)
+        grid.insert("a", HitBox(10, 10, 20, 20))
+        grid.insert("b", HitBox(500, 500, 20, 20))
+        self.assertEqual(grid.query(HitBox(0, 0, 50, 50)), ["a"])
+        self.assertEqual(grid.query(HitBox(490, 490, 20, 20)), ["b"])
+        self.assertEqual(grid.query(HitBox(300, 300, 10, 10)), [])
+
+    def test_big_hitbox_spans_cells(self):
+        """Test that an item bigger than a cell is found from any cell."""
+        grid = SpatialHash(100)
+        grid.insert("boss", HitBox(0, 0, 350, 350))
+        self.assertEqual(grid.query(HitBox(320, 320, 5, 5)), ["boss"])
+        self.assertEqual(grid.query(HitBox(-50, -50, 500, 500)), ["boss"])
+
+    def test_query_keeps_insertion_order(self):
+        """Test that results are deduplicated and keep insertion order."""
+        grid = SpatialHash(100)
+        grid.insert("a", HitBox(150, 150, 100, 100))
+        grid.insert("b", HitBox(10, 10, 10, 10))
+        grid.insert("c", HitBox(120, 10, 10, 10))
+        self.assertEqual(grid.query(HitBox(0, 0, 300, 300)), ["a", "b", "c"])
+
+    def test_negative_coordinates(self):
+        """Test that items outside of the map are still indexed."""
+        grid = SpatialHash(100)
+        grid.insert("a", HitBox(-250, -20, 10, 10))
+        self.assertEqual(grid.query(HitBox(-260, -30, 30, 30)), ["a"])
+
+    def test_rebuild_matches_nested_loop(self):
+        """Test that the broad phase never misses a real collision."""
+        grid = SpatialHash(64)
+        targets = [HitBox(x * 37 % 900, x * 53 % 700, 40 + x % 3 * 30, 60) for x in range(40)]
+        grid.rebuild(list(range(len(targets))), targets)
+        self.assertEqual(grid.count, 40)
+        for i in range(60):
+            proj = HitBox(i * 29 % 950, i * 41 % 750, 16, 16)
+            expected = [j for j, t in enumerate(targets) if proj.is_colliding(t)]
+            found = [j for j in grid.query(proj) if proj.is_colliding(targets[j])]
+            self.assertEqual(found, expected)
+
+    def test_clear(self):
+        """Test that clearing the grid removes everything."""
+        grid = SpatialHash(100)
+        grid.insert("a", HitBox(10, 10, 20, 20))
+        grid.clear()
+        self.assertEqual(grid.count, 0)
+        self.assertEqual(grid.query(HitBox(0, 0, 50, 50)), [])
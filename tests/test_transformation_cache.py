@@ -0,0 +1,63 @@
+import unittest
+from data.api.surface import Surface
+from data.caching.transformation_cache import TransformCache, estimate_bytes
+
+def frame(size):
+    """Returns a square surface of size x size pixels (4 bytes each)."""
+    return Surface(size, size)
+
+class TestTransformCache(unittest.TestCase):
+    """Tests for the transformation cache."""
+
+    def test_key_is_quantized_tuple(self):
+        """Test that keys are tuples with quantized rotation and scale."""
+        self.assertEqual(TransformCache.get_key("fireball", 12, 1.004, False),
+                         ("fireball", 10, 1.0, False))
+        self.assertEqual(TransformCache.get_key("fireball", 12), TransformCache.get_key("fireball", 9))
+
+    def test_get_and_counters(self):
+        """Test hits, misses and stored bytes."""
+        cache = TransformCache()
+        img = frame(10)
+        self.assertIsNone(cache.get("a", 0))
+        cache.put("a", img, 0)
+        self.assertIs(cache.get("a", 0), img)
+        self.assertIs(cache.get("a", 1), img)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.bytes, estimate_bytes(img))
+        self.assertEqual(cache.bytes, 400)
+        self.assertEqual(cache.stats()["entries"], 1)
+
+    def test_byte_budget_evicts_lru(self):
+        """Test that the budget is in bytes and evicts the least recently used."""
+        cache = TransformCache(max_bytes=1000)
+        cache.put("a", frame(10))
+        cache.put("b", frame(10))
+        cache.put("c", frame(10))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.evictions, 1)
+        self.assertLessEqual(cache.bytes, 1000)
+
+    def test_reused_entries_survive_bursts(self):
+        """Test that entries hit before are kept over one-shot entries."""
+        cache = TransformCache(max_bytes=2000)
+        cache.put("hot", frame(10))
+        cache.get("hot")
+        for i in range(20):
+            cache.put(f"cold_{i}", frame(10))
+        self.assertIsNotNone(cache.get("hot"))
+        self.assertLessEqual(cache.bytes, 2000)
+
+    def test_oversized_and_replace(self):
+        """Test that oversized images are skipped and replacing keeps the byte count."""
+        cache = TransformCache(max_bytes=1000)
+        cache.put("big", frame(20))
+        self.assertEqual(len(cache), 0)
+        cache.put("a", frame(10))
+        cache.put("a", frame(5))
+        self.assertEqual(cache.bytes, 100)
+        cache.clear()
+        self.assertEqual(cache.bytes, 0)
+        self.assertEqual(len(cache), 0)